@@ -0,0 +1,30 @@
+"""Add HTTP validators (ETag / Last-Modified) to feeds
+
+Revision ID: 009_feed_http_validators
+Revises: 008_postgres_fts
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "009_feed_http_validators"
+down_revision: Union[str, None] = "008_postgres_fts"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Adiciona colunas para requisições HTTP condicionais na sincronização de feeds."""
+    op.add_column("feeds", sa.Column("http_etag", sa.String(length=255), nullable=True))
+    op.add_column("feeds", sa.Column("http_last_modified", sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove colunas de validadores HTTP dos feeds."""
+    with op.batch_alter_table("feeds") as batch_op:
+        batch_op.drop_column("http_last_modified")
+        batch_op.drop_column("http_etag")
@@ -0,0 +1,28 @@
+"""Add content_hash to articles
+
+Revision ID: 010_article_content_hash
+Revises: 009_feed_http_validators
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "010_article_content_hash"
+down_revision: Union[str, None] = "009_feed_http_validators"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Adiciona fingerprint de conteúdo usado para detectar entradas editadas nos feeds."""
+    op.add_column("articles", sa.Column("content_hash", sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove fingerprint de conteúdo dos artigos."""
+    with op.batch_alter_table("articles") as batch_op:
+        batch_op.drop_column("content_hash")
@@ -0,0 +1,37 @@
+"""Add adaptive sync scheduling fields to feeds
+
+Revision ID: 011_feed_adaptive_sync
+Revises: 010_article_content_hash
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "011_feed_adaptive_sync"
+down_revision: Union[str, None] = "010_article_content_hash"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Adiciona próxima sincronização, cadência aprendida e contador de ociosidade."""
+    op.add_column("feeds", sa.Column("next_sync_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("feeds", sa.Column("publish_interval_minutes", sa.Float(), nullable=True))
+    op.add_column(
+        "feeds",
+        sa.Column("idle_sync_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_feeds_next_sync_at", "feeds", ["next_sync_at"])
+
+
+def downgrade() -> None:
+    """Remove campos de agendamento adaptativo dos feeds."""
+    op.drop_index("ix_feeds_next_sync_at", table_name="feeds")
+    with op.batch_alter_table("feeds") as batch_op:
+        batch_op.drop_column("idle_sync_count")
+        batch_op.drop_column("publish_interval_minutes")
+        batch_op.drop_column("next_sync_at")
@@ -0,0 +1,56 @@
+"""Add author scrape cache table
+
+Revision ID: 012_author_scrape_cache
+Revises: 011_feed_adaptive_sync
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "012_author_scrape_cache"
+down_revision: Union[str, None] = "011_feed_adaptive_sync"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria cache de autores obtidos via scraping das páginas de artigos."""
+    op.create_table(
+        "author_scrape_cache",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("source_url", sa.String(length=500), nullable=False),
+        sa.Column("authors", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cache_key"),
+    )
+    op.create_index(
+        "ix_author_scrape_cache_cache_key", "author_scrape_cache", ["cache_key"], unique=False
+    )
+    op.create_index(
+        "ix_author_scrape_cache_expires_at", "author_scrape_cache", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove cache de autores obtidos via scraping."""
+    op.drop_index("ix_author_scrape_cache_expires_at", table_name="author_scrape_cache")
+    op.drop_index("ix_author_scrape_cache_cache_key", table_name="author_scrape_cache")
+    op.drop_table("author_scrape_cache")
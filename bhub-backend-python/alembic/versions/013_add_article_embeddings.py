@@ -0,0 +1,58 @@
+"""Add article embeddings table
+
+Revision ID: 013_article_embeddings
+Revises: 012_author_scrape_cache
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "013_article_embeddings"
+down_revision: Union[str, None] = "012_author_scrape_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria tabela de embeddings persistidos por artigo e modelo."""
+    op.create_table(
+        "article_embeddings",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("model_name", sa.String(length=100), nullable=False),
+        sa.Column("content_hash", sa.String(length=32), nullable=False),
+        sa.Column("dim", sa.Integer(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.ForeignKeyConstraint(["article_id"], ["articles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("article_id", "model_name", name="uq_article_embeddings_article_model"),
+    )
+    op.create_index(
+        "ix_article_embeddings_article_id", "article_embeddings", ["article_id"], unique=False
+    )
+    op.create_index(
+        "ix_article_embeddings_model_name", "article_embeddings", ["model_name"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove tabela de embeddings de artigos."""
+    op.drop_index("ix_article_embeddings_model_name", table_name="article_embeddings")
+    op.drop_index("ix_article_embeddings_article_id", table_name="article_embeddings")
+    op.drop_table("article_embeddings")
@@ -0,0 +1,64 @@
+"""Add article neighbors table
+
+Revision ID: 014_article_neighbors
+Revises: 013_article_embeddings
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "014_article_neighbors"
+down_revision: Union[str, None] = "013_article_embeddings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria tabela de vizinhos pré-calculados (artigos similares)."""
+    op.create_table(
+        "article_neighbors",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("neighbor_id", sa.Integer(), nullable=False),
+        sa.Column("model_name", sa.String(length=100), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.ForeignKeyConstraint(["article_id"], ["articles.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["neighbor_id"], ["articles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "article_id", "model_name", "neighbor_id", name="uq_article_neighbors_pair"
+        ),
+    )
+    op.create_index(
+        "ix_article_neighbors_lookup",
+        "article_neighbors",
+        ["article_id", "model_name", "rank"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_article_neighbors_neighbor_id", "article_neighbors", ["neighbor_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove tabela de vizinhos de artigos."""
+    op.drop_index("ix_article_neighbors_neighbor_id", table_name="article_neighbors")
+    op.drop_index("ix_article_neighbors_lookup", table_name="article_neighbors")
+    op.drop_table("article_neighbors")
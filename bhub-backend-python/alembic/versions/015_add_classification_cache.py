@@ -0,0 +1,57 @@
+"""Add classification cache table
+
+Revision ID: 015_classification_cache
+Revises: 014_article_neighbors
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "015_classification_cache"
+down_revision: Union[str, None] = "014_article_neighbors"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria cache de resultados de classificação por IA."""
+    op.create_table(
+        "classification_cache",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("provider", sa.String(length=20), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("results", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cache_key"),
+    )
+    op.create_index(
+        "ix_classification_cache_cache_key", "classification_cache", ["cache_key"], unique=False
+    )
+    op.create_index(
+        "ix_classification_cache_expires_at", "classification_cache", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove cache de resultados de classificação."""
+    op.drop_index("ix_classification_cache_expires_at", table_name="classification_cache")
+    op.drop_index("ix_classification_cache_cache_key", table_name="classification_cache")
+    op.drop_table("classification_cache")
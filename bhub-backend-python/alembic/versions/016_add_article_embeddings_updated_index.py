@@ -0,0 +1,31 @@
+"""Add article_embeddings (model_name, updated_at) index
+
+Revision ID: 016_embeddings_updated_index
+Revises: 015_classification_cache
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "016_embeddings_updated_index"
+down_revision: Union[str, None] = "015_classification_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Índice da sincronização incremental do índice semântico (updated_at por modelo)."""
+    op.create_index(
+        "ix_article_embeddings_model_updated",
+        "article_embeddings",
+        ["model_name", "updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove o índice por updated_at."""
+    op.drop_index("ix_article_embeddings_model_updated", table_name="article_embeddings")
@@ -67,6 +67,8 @@ Resumo: {abstract}
 <|assistant|>
 """
 
+    classify_prompt = CLASSIFY_PROMPT
+
     TRANSLATE_PROMPT = """<|system|>
 Você é um tradutor profissional especializado em textos acadêmicos de Análise do Comportamento.
 Traduza o texto do inglês para o português brasileiro de forma profissional e acadêmica.
@@ -84,6 +86,10 @@ Texto: {text}
         self._model_path: Path | None = None
         self._initialized = False
 
+    @property
+    def classify_model(self) -> str:
+        return settings.local_llm_model_name
+
     async def is_available(self) -> bool:
         """Verifica se o serviço está disponível."""
         if not settings.local_llm_enabled:
@@ -2,14 +2,23 @@
 Gerenciador de provedores de IA externa.
 """
 
+import asyncio
+import hashlib
+import json
+import math
 import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from enum import Enum
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
 from app.config import settings
+from app.core.http_client import HTTPPurpose, get_http_client
 from app.core.logging import log
 
 # Constantes
@@ -24,15 +33,322 @@ class AIProvider(str, Enum):
     HUGGINGFACE = "huggingface"
 
 
+class CircuitState(str, Enum):
+    """Estados do circuit breaker de um provedor."""
+    CLOSED = "closed"        # Chamadas normais
+    OPEN = "open"            # Provedor pulado até ai_circuit_reset_seconds
+    HALF_OPEN = "half_open"  # Uma chamada de teste decide se fecha ou reabre
+
+
+class ProviderHealth:
+    """
+    Saúde de um provedor: circuit breaker e latência média (EWMA).
+
+    Após ai_circuit_failure_threshold falhas seguidas o circuito abre e o
+    provedor é pulado sem custo; passado ai_circuit_reset_seconds, uma única
+    chamada de teste (half-open) fecha o circuito ou o reabre. A latência de
+    chamadas em lote tem média própria: não entra na ordem dos provedores.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.successes = 0
+        self.failures = 0
+        self.latency_ms: float | None = None
+        self.batch_latency_ms: float | None = None
+        self.last_error: str | None = None
+        self._opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Se uma chamada pode ser feita agora (em half-open, só a de teste)."""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < settings.ai_circuit_reset_seconds:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self._probing = False
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    @staticmethod
+    def _ewma(current: float | None, sample: float) -> float:
+        alpha = settings.ai_latency_ewma_alpha
+        return sample if current is None else alpha * sample + (1 - alpha) * current
+
+    def record_success(self, latency_ms: float | None = None, batch: bool = False) -> None:
+        """Registra uma chamada bem-sucedida; latency_ms é a da chamada inteira."""
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.state = CircuitState.CLOSED
+        self._probing = False
+        if latency_ms is None:
+            return
+        if batch:
+            self.batch_latency_ms = self._ewma(self.batch_latency_ms, latency_ms)
+        else:
+            self.latency_ms = self._ewma(self.latency_ms, latency_ms)
+
+    def record_failure(self, error: Exception | str) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = str(error)[:200]
+        self._probing = False
+        if (
+            self.state == CircuitState.HALF_OPEN
+            or self.consecutive_failures >= settings.ai_circuit_failure_threshold
+        ):
+            if self.state != CircuitState.OPEN:
+                log.warning(
+                    f"Circuito de {self.name} aberto após {self.consecutive_failures} falhas: "
+                    f"{self.last_error}"
+                )
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """
+        Libera a vaga de teste sem resultado (provedor indisponível, sem chamada ou
+        chamada cancelada). Sem efeito se o resultado já foi registrado.
+        """
+        self._probing = False
+
+    @property
+    def probing(self) -> bool:
+        """Há uma chamada de teste (half-open) em andamento."""
+        return self._probing
+
+    def as_dict(self) -> dict:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "successes": self.successes,
+            "failures": self.failures,
+            "latency_ms": round(self.latency_ms, 1) if self.latency_ms is not None else None,
+            "batch_latency_ms": (
+                round(self.batch_latency_ms, 1) if self.batch_latency_ms is not None else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+class ProviderRateLimited(Exception):
+    """Provedor pediu (Retry-After) para esperar mais que ai_retry_after_max_seconds."""
+
+    def __init__(self, provider: str, retry_after: float):
+        super().__init__(f"{provider}: rate limit, tentar novamente em {retry_after:.0f}s")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+# Espera padrão após um 429 sem Retry-After
+DEFAULT_RATE_LIMIT_BACKOFF_SECONDS = 5.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Segundos de um cabeçalho Retry-After (número ou data HTTP)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+class ProviderLimiter:
+    """
+    Limite de chamadas de saída a um provedor: requisições simultâneas
+    (ai_max_concurrency), orçamento por minuto de requisições e de tokens
+    (token bucket) e pausa pedida pelo provedor via Retry-After.
+
+    Quem espera é atendido por ordem de chegada, seja classificação ou tradução.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Lock | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._requests = float(max(0, settings.ai_requests_per_minute))
+        self._tokens = float(max(0, settings.ai_tokens_per_minute))
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self.in_flight = 0
+        self.waiting = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self.wait_seconds_total = 0.0
+
+    def _bind(self) -> None:
+        # Lock/Semaphore pertencem a um event loop: recriar se o loop mudou
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._queue = asyncio.Lock()
+            self._slots = asyncio.Semaphore(max(1, settings.ai_max_concurrency))
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        rpm, tpm = settings.ai_requests_per_minute, settings.ai_tokens_per_minute
+        if rpm > 0:
+            self._requests = min(float(rpm), self._requests + elapsed * rpm / 60)
+        if tpm > 0:
+            self._tokens = min(float(tpm), self._tokens + elapsed * tpm / 60)
+
+    def _budget_wait(self, tokens: int) -> float:
+        """Segundos até haver orçamento para uma requisição de `tokens` (0 = já há)."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._refill(now)
+        rpm, tpm = settings.ai_requests_per_minute, settings.ai_tokens_per_minute
+        waits = [0.0]
+        if rpm > 0 and self._requests < 1:
+            waits.append((1 - self._requests) * 60 / rpm)
+        # Requisições maiores que o orçamento inteiro esperam o bucket encher
+        needed = min(tokens, tpm)
+        if tpm > 0 and self._tokens < needed:
+            waits.append((needed - self._tokens) * 60 / tpm)
+        wait = max(waits)
+        if wait == 0:
+            if rpm > 0:
+                self._requests -= 1
+            if tpm > 0:
+                self._tokens -= needed
+        return wait
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Aguarda a vez, o orçamento e uma vaga de concorrência para uma requisição."""
+        self._bind()
+        start = time.monotonic()
+        self.waiting += 1
+        try:
+            # Fila FIFO: orçamento e vaga são concedidos por ordem de chegada
+            async with self._queue:
+                while (wait := self._budget_wait(tokens)) > 0:
+                    await asyncio.sleep(wait)
+                await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        self.wait_seconds_total += time.monotonic() - start
+        self.requests += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    def defer(self, seconds: float) -> None:
+        """Pausa novas requisições ao provedor (429 / Retry-After)."""
+        self.rate_limited += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        log.warning(f"{self.name}: rate limit, pausando requisições por {seconds:.1f}s")
+
+    def retry_after_remaining(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "requests": self.requests,
+            "rate_limited": self.rate_limited,
+            "paused_seconds": round(self.retry_after_remaining(), 1),
+            "wait_ms_avg": self.wait_seconds_total * 1000 / self.requests if self.requests else 0.0,
+        }
+
+
+_limiters: dict[str, ProviderLimiter] = {}
+
+
+def get_provider_limiter(provider: str) -> ProviderLimiter:
+    """Limitador compartilhado de um provedor (todas as instâncias de serviço usam o mesmo)."""
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        limiter = _limiters[provider] = ProviderLimiter(provider)
+    return limiter
+
+
+# Retentativas das chamadas HTTP; não repetir quando o provedor pede uma espera longa
+ai_retry = retry(
+    stop=stop_after_attempt(2),
+    wait=wait_exponential(min=1, max=5),
+    retry=retry_if_not_exception_type(ProviderRateLimited),
+)
+
+
 class AIManager:
     """
     Gerenciador central de provedores de IA.
-    Implementa fallback automático entre provedores.
+    Implementa fallback automático entre provedores, pulando os que estão com
+    o circuito aberto e priorizando os mais rápidos.
     """
 
+    # Ordem de prioridade da classificação
+    CLASSIFY_ORDER = (
+        AIProvider.DEEPSEEK,    # Prioridade máxima: API externa (mais rápida)
+        AIProvider.LOCAL_LLM,   # Fallback: LLM local (sem custos)
+        AIProvider.OPENROUTER,
+        AIProvider.HUGGINGFACE,
+    )
+
+    # Ordem de prioridade da tradução
+    TRANSLATE_ORDER = (
+        AIProvider.DEEPSEEK,
+        AIProvider.LOCAL_LLM,
+        AIProvider.OPENROUTER,
+    )
+
     def __init__(self):
         self.providers: dict[AIProvider, BaseAIService] = {}
         self._setup_providers()
+        self.health: dict[AIProvider, ProviderHealth] = {
+            provider_type: ProviderHealth(provider_type.value) for provider_type in self.providers
+        }
+
+    @staticmethod
+    def _paused(provider_type: AIProvider) -> bool:
+        """Provedor pediu (Retry-After) uma espera maior que a aceitável por chamada."""
+        remaining = get_provider_limiter(provider_type.value).retry_after_remaining()
+        return remaining > settings.ai_retry_after_max_seconds
+
+    def _ordered(self, order: tuple[AIProvider, ...]) -> list[AIProvider]:
+        """
+        Provedores configurados, reordenados pela latência observada (EWMA).
+
+        Latências dentro de um fator 2 contam como equivalentes e mantêm a
+        prioridade configurada; provedores ainda sem medição ficam na posição
+        configurada.
+        """
+        configured = [p for p in order if p in self.providers]
+
+        def bucket(provider_type: AIProvider) -> int:
+            return int(math.log2(max(self.health[provider_type].latency_ms, 1.0)))
+
+        measured = iter(
+            sorted(
+                (p for p in configured if self.health[p].latency_ms is not None),
+                key=lambda p: (bucket(p), configured.index(p)),
+            )
+        )
+        return [
+            next(measured) if self.health[p].latency_ms is not None else p for p in configured
+        ]
 
     def _setup_providers(self):
         """Configura provedores disponíveis."""
@@ -66,41 +382,107 @@ class AIManager:
         Returns:
             Tupla (categoria, confiança, provider_usado)
         """
-        providers_order = [
-            AIProvider.DEEPSEEK,    # Prioridade máxima: API externa (mais rápida)
-            AIProvider.LOCAL_LLM,   # Fallback: LLM local (sem custos)
-            AIProvider.OPENROUTER,
-            AIProvider.HUGGINGFACE,
-        ]
-
-        for provider_type in providers_order:
-            if provider_type not in self.providers:
+        for provider_type in self._ordered(self.CLASSIFY_ORDER):
+            provider = self.providers[provider_type]
+            health = self.health[provider_type]
+            # Circuito aberto ou pausado pelo provedor: pular sem gastar tentativas
+            if self._paused(provider_type) or not health.allow():
                 continue
+            probe = health.probing
 
-            provider = self.providers[provider_type]
             start = time.monotonic()
             try:
                 if not await provider.is_available():
+                    health.release()
                     continue
 
                 category, confidence = await provider.classify(text)
                 from app.core.telemetry import record_ai_latency
 
-                record_ai_latency(
-                    (time.monotonic() - start) * 1000,
-                    provider_type.value,
-                )
+                elapsed_ms = (time.monotonic() - start) * 1000
+                health.record_success(elapsed_ms)
+                record_ai_latency(elapsed_ms, provider_type.value)
                 return (category, confidence, provider_type)
 
+            except ProviderRateLimited as e:
+                health.release()
+                log.warning(str(e))
+                continue
             except Exception as e:
                 from app.core.telemetry import record_ai_fallback
 
+                health.record_failure(e)
                 record_ai_fallback(provider_type.value)
                 log.warning(f"Falha no {provider_type}: {e}")
                 continue
+            finally:
+                # Chamada de teste cancelada (desconexão, timeout, shutdown) sem resultado
+                if probe:
+                    health.release()
 
         return ("outros", 0.0, None)
 
+    async def classify_batch(self, texts: list[str]) -> list[tuple[str, float, AIProvider | None]]:
+        """
+        Classifica vários textos. Cada provedor recebe de uma vez os textos que os
+        anteriores não classificaram (o DeepSeek agrupa vários por requisição).
+
+        Returns:
+            Tupla (categoria, confiança, provider_usado) por texto, na ordem de entrada
+        """
+        results: list[tuple[str, float, AIProvider | None]] = [("outros", 0.0, None)] * len(texts)
+        pending = list(range(len(texts)))
+
+        for provider_type in self._ordered(self.CLASSIFY_ORDER):
+            if not pending:
+                break
+
+            provider = self.providers[provider_type]
+            health = self.health[provider_type]
+            if self._paused(provider_type) or not health.allow():
+                continue
+            probe = health.probing
+
+            start = time.monotonic()
+            try:
+                if not await provider.is_available():
+                    health.release()
+                    continue
+
+                answers = await provider.classify_batch([texts[i] for i in pending])
+                from app.core.telemetry import record_ai_latency
+
+                elapsed_ms = (time.monotonic() - start) * 1000
+                record_ai_latency(elapsed_ms, provider_type.value)
+                if any(answer is not None for answer in answers):
+                    health.record_success(elapsed_ms, batch=True)
+                else:
+                    health.record_failure("nenhum texto do lote classificado")
+            except ProviderRateLimited as e:
+                health.release()
+                log.warning(str(e))
+                continue
+            except Exception as e:
+                from app.core.telemetry import record_ai_fallback
+
+                health.record_failure(e)
+                record_ai_fallback(provider_type.value)
+                log.warning(f"Falha no {provider_type} (lote de {len(pending)}): {e}")
+                continue
+            finally:
+                if probe:
+                    health.release()
+
+            remaining = []
+            for i, answer in zip(pending, answers, strict=True):
+                if answer is None:
+                    remaining.append(i)
+                else:
+                    results[i] = (answer[0], answer[1], provider_type)
+            pending = remaining
+
+        return results
+
     async def translate(
         self,
         text: str,
@@ -109,35 +491,67 @@ class AIManager:
         """
         Traduz texto usando provedores em ordem de prioridade.
         """
-        providers_order = [
-            AIProvider.DEEPSEEK,    # Prioridade máxima: API externa (mais rápida)
-            AIProvider.LOCAL_LLM,   # Fallback: LLM local (sem custos)
-            AIProvider.OPENROUTER,
-        ]
-
-        for provider_type in providers_order:
+        # Tradução usa a prioridade configurada; a latência (EWMA) mede só classificação
+        for provider_type in self.TRANSLATE_ORDER:
             if provider_type not in self.providers:
                 continue
 
             provider = self.providers[provider_type]
+            health = self.health[provider_type]
+            if self._paused(provider_type) or not health.allow():
+                continue
+            probe = health.probing
+
             try:
                 if not await provider.is_available():
+                    health.release()
                     continue
 
                 translated = await provider.translate(text, target_lang)
+                health.record_success()
                 return (translated, provider_type)
 
+            except ProviderRateLimited as e:
+                health.release()
+                log.warning(str(e))
+                continue
             except Exception as e:
+                health.record_failure(e)
                 log.warning(f"Falha na tradução com {provider_type}: {e}")
                 continue
+            finally:
+                if probe:
+                    health.release()
 
         return (text, None)
 
+    def classify_cache_identities(self) -> list[tuple[str, str, str]]:
+        """
+        (provedor, modelo, versão do prompt) dos provedores de classificação
+        configurados, em ordem de prioridade. Usado nas chaves do cache de
+        classificações.
+        """
+        return [
+            (provider_type.value, *self.providers[provider_type].classify_cache_identity())
+            for provider_type in self.CLASSIFY_ORDER
+            if provider_type in self.providers
+        ]
+
     def get_status(self) -> dict:
         """Retorna status de todos os provedores."""
+        order = self._ordered(self.CLASSIFY_ORDER)
         return {
             provider.value: {
                 "configured": provider in self.providers,
+                **(
+                    {
+                        "classify_rank": order.index(provider) + 1,
+                        "health": self.health[provider].as_dict(),
+                        "limiter": get_provider_limiter(provider.value).stats(),
+                    }
+                    if provider in self.providers
+                    else {}
+                ),
             }
             for provider in AIProvider
         }
@@ -147,11 +561,67 @@ class BaseAIService(ABC):
     """Classe base para serviços de IA."""
 
     provider: AIProvider
+    http_client: httpx.AsyncClient | None = None
+    # Modelo e prompt de classificação (identificam resultados no cache)
+    classify_model: str = ""
+    classify_prompt: str = ""
+
+    def _client(self) -> httpx.AsyncClient:
+        """Cliente injetado ou o cliente HTTP compartilhado de IA (conexões reaproveitadas)."""
+        return self.http_client or get_http_client(HTTPPurpose.AI)
+
+    async def _post(self, url: str, **kwargs) -> httpx.Response:
+        """
+        POST ao provedor pelo limitador compartilhado (concorrência, orçamento
+        por minuto e Retry-After).
+
+        Raises:
+            ProviderRateLimited: 429/503 com Retry-After acima de ai_retry_after_max_seconds
+            httpx.HTTPStatusError: demais respostas de erro
+        """
+        payload = kwargs.get("json") or {}
+        # Estimativa de tokens: ~4 caracteres por token na entrada + limite da saída
+        tokens = len(json.dumps(payload, ensure_ascii=False)) // 4 + int(payload.get("max_tokens", 0))
+        limiter = get_provider_limiter(self.provider.value)
+        async with limiter.slot(tokens):
+            response = await self._client().post(url, **kwargs)
+
+        if response.status_code == 429 or (
+            response.status_code == 503 and "retry-after" in response.headers
+        ):
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            wait = DEFAULT_RATE_LIMIT_BACKOFF_SECONDS if retry_after is None else retry_after
+            limiter.defer(wait)
+            if wait > settings.ai_retry_after_max_seconds:
+                raise ProviderRateLimited(self.provider.value, wait)
+        response.raise_for_status()
+        return response
+
+    def classify_cache_identity(self) -> tuple[str, str]:
+        """(modelo, versão do prompt); a versão é um hash do prompt, que muda com ele."""
+        version = hashlib.sha256(self.classify_prompt.encode("utf-8")).hexdigest()[:12]
+        return self.classify_model, version
 
     @abstractmethod
     async def classify(self, text: str) -> tuple[str, float]:
         pass
 
+    async def classify_batch(self, texts: list[str]) -> list[tuple[str, float] | None]:
+        """
+        Classifica vários textos (padrão: uma chamada por texto).
+
+        Returns:
+            (categoria, confiança) por texto; None nos que falharam
+        """
+        results: list[tuple[str, float] | None] = []
+        for text in texts:
+            try:
+                results.append(await self.classify(text))
+            except Exception as e:
+                log.warning(f"Falha ao classificar com {self.provider}: {e}")
+                results.append(None)
+        return results
+
     @abstractmethod
     async def translate(self, text: str, target_lang: str = "pt") -> str:
         pass
@@ -203,6 +673,21 @@ Título: {title}
 Resumo: {abstract}
 """
 
+    # Mesmas instruções, vários artigos numerados por requisição
+    CLASSIFY_BATCH_PROMPT = CLASSIFY_PROMPT.split("Retorne JSON:")[0] + """Classifique CADA artigo numerado abaixo de forma independente.
+
+Retorne JSON: {{"results": [{{"id": 1, "category": "slug", "confidence": 0.0_a_1.0}}, ...]}}
+com exatamente um item por artigo, usando o número do artigo como id.
+
+{items}
+"""
+
+    VALID_CATEGORIES = (
+        "clinica", "educacao", "organizacional", "pesquisa",
+        "autismo", "behaviorismo-radical", "comportamento-verbal",
+        "noticias", "outros",
+    )
+
     TRANSLATE_PROMPT = """Traduza o seguinte texto do inglês para o português brasileiro de forma profissional e acadêmica.
 Mantenha termos técnicos de Análise do Comportamento quando apropriado.
 
@@ -212,179 +697,310 @@ Texto: {text}
 
 """
 
-    def __init__(self):
+    classify_model = "deepseek-chat"
+    classify_prompt = CLASSIFY_PROMPT + CLASSIFY_BATCH_PROMPT
+
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
         self.api_key = settings.deepseek_api_key
         self.base_url = settings.deepseek_base_url
+        self.http_client = http_client
 
     async def is_available(self) -> bool:
         return bool(self.api_key)
 
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(min=1, max=5))
     async def classify(self, text: str) -> tuple[str, float]:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": CONTENT_TYPE_JSON,
-                },
-                json={
-                    "model": "deepseek-chat",
-                    "messages": [
-                        {"role": "user", "content": self.CLASSIFY_PROMPT.format(
-                            title=text[:500],
-                            abstract=text[500:2000] if len(text) > 500 else "",
-                        )}
-                    ],
-                    "temperature": 0.1,
-                    "max_tokens": 100,
-                    "response_format": {"type": "json_object"}
-                },
-            )
-            response.raise_for_status()
+        return await self._classify_single(text) or ("outros", 0.0)
+
+    @ai_retry
+    async def _classify_single(self, text: str) -> tuple[str, float] | None:
+        """Classifica um texto; None se a resposta não puder ser interpretada."""
+        response = await self._post(
+            f"{self.base_url}/chat/completions",
+            timeout=settings.ai_timeout_seconds,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": CONTENT_TYPE_JSON,
+            },
+            json={
+                "model": self.classify_model,
+                "messages": [
+                    {"role": "user", "content": self.CLASSIFY_PROMPT.format(
+                        title=text[:500],
+                        abstract=text[500:2000] if len(text) > 500 else "",
+                    )}
+                ],
+                "temperature": 0.1,
+                "max_tokens": 100,
+                "response_format": {"type": "json_object"}
+            },
+        )
+
+        data = response.json()
+        content = data["choices"][0]["message"]["content"].strip()
+
+        try:
+            result_json = json.loads(content)
+            category = self._valid_category(result_json.get("category", "outros"))
+            confidence = float(result_json.get("confidence", 0.5))
+
+            if category is not None:
+                return (category, confidence)
+
+            return ("outros", 0.5)
+        except Exception as e:
+            log.warning(f"Erro ao parsear resposta JSON do DeepSeek: {e}. Content: {content}")
+            return None
+
+    @classmethod
+    def _valid_category(cls, category: object) -> str | None:
+        """Slug válido da resposta (exato ou contido no texto), ou None."""
+        if not isinstance(category, str):
+            return None
+        category = category.strip().lower()
+        if category in cls.VALID_CATEGORIES:
+            return category
+
+        # Fallback se a categoria retornada não for exata
+        for cat in cls.VALID_CATEGORIES:
+            if cat in category:
+                return cat
+        return None
+
+    async def classify_batch(self, texts: list[str]) -> list[tuple[str, float] | None]:
+        """
+        Classifica até ai_classify_batch_size artigos numerados por requisição.
 
-            data = response.json()
-            content = data["choices"][0]["message"]["content"].strip()
+        Itens ausentes ou malformados na resposta são reclassificados sozinhos.
+        Um lote que falha (HTTP ou resposta ilegível na reclassificação) deixa None
+        só nas suas posições, para o AIManager tentar o próximo provedor nelas.
 
+        Raises:
+            ProviderRateLimited: pausa longa pedida pelo provedor antes de qualquer
+                texto classificado
+        """
+        results: list[tuple[str, float] | None] = [None] * len(texts)
+        size = max(1, settings.ai_classify_batch_size)
+        try:
+            for start in range(0, len(texts), size):
+                chunk = texts[start : start + size]
+                parsed = {}
+                if len(chunk) > 1:
+                    try:
+                        content = await self._request_batch(chunk)
+                    except ProviderRateLimited:
+                        raise
+                    except Exception as e:
+                        log.warning(f"Falha no lote de {len(chunk)} itens do DeepSeek: {e}")
+                        continue
+                    parsed = self.parse_batch_response(content, len(chunk))
+                    if len(parsed) < len(chunk):
+                        log.warning(
+                            f"Resposta em lote do DeepSeek com {len(chunk) - len(parsed)} "
+                            f"de {len(chunk)} itens inválidos; reclassificando individualmente"
+                        )
+
+                for offset, text in enumerate(chunk):
+                    result = parsed.get(offset)
+                    if result is None:
+                        try:
+                            result = await self._classify_single(text)
+                        except ProviderRateLimited:
+                            raise
+                        except Exception as e:
+                            log.warning(f"Falha ao reclassificar item do lote no DeepSeek: {e}")
+                    results[start + offset] = result
+        except ProviderRateLimited as e:
+            # Os lotes seguintes também esperariam a pausa: devolve o que já foi classificado
+            if not any(results):
+                raise
+            log.warning(f"{e}; {results.count(None)} itens do lote ficam para o próximo provedor")
+        return results
+
+    @ai_retry
+    async def _request_batch(self, texts: list[str]) -> str:
+        """Uma chat completion para vários artigos; retorna o conteúdo da resposta."""
+        items = "\n\n".join(
+            f"[{i}] Título: {text[:500]}\nResumo: {text[500:2000] if len(text) > 500 else ''}"
+            for i, text in enumerate(texts, start=1)
+        )
+        response = await self._post(
+            f"{self.base_url}/chat/completions",
+            timeout=settings.ai_timeout_seconds,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": CONTENT_TYPE_JSON,
+            },
+            json={
+                "model": self.classify_model,
+                "messages": [
+                    {"role": "user", "content": self.CLASSIFY_BATCH_PROMPT.format(items=items)}
+                ],
+                "temperature": 0.1,
+                "max_tokens": 50 + 40 * len(texts),
+                "response_format": {"type": "json_object"},
+            },
+        )
+        return response.json()["choices"][0]["message"]["content"].strip()
+
+    @classmethod
+    def parse_batch_response(cls, content: str, count: int) -> dict[int, tuple[str, float]]:
+        """
+        Itens válidos de uma resposta em lote.
+
+        Returns:
+            índice (0-based) -> (categoria, confiança); itens com id fora do
+            intervalo, repetidos, sem categoria válida ou com confiança fora de
+            [0, 1] ficam de fora
+        """
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return {}
+        items = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            return {}
+
+        parsed: dict[int, tuple[str, float]] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
             try:
-                import json
-                result_json = json.loads(content)
-                category = result_json.get("category", "outros").lower()
-                confidence = float(result_json.get("confidence", 0.5))
-
-                valid_categories = [
-                    "clinica", "educacao", "organizacional", "pesquisa",
-                    "autismo", "behaviorismo-radical", "comportamento-verbal",
-                    "noticias", "outros"
-                ]
-                if category in valid_categories:
-                    return (category, confidence)
-
-                # Fallback se a categoria retornada não for exata
-                for cat in valid_categories:
-                    if cat in category:
-                        return (cat, confidence)
-
-                return ("outros", 0.5)
-            except Exception as e:
-                log.warning(f"Erro ao parsear resposta JSON do DeepSeek: {e}. Content: {content}")
-                return ("outros", 0.0)
+                index = int(item.get("id")) - 1
+                confidence = float(item.get("confidence"))
+            except (TypeError, ValueError):
+                continue
+            category = cls._valid_category(item.get("category"))
+            if category is None or not 0 <= index < count or index in parsed:
+                continue
+            if not 0.0 <= confidence <= 1.0:
+                continue
+            parsed[index] = (category, confidence)
+        return parsed
 
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(min=1, max=5))
+    @ai_retry
     async def translate(self, text: str, target_lang: str = "pt") -> str:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": CONTENT_TYPE_JSON,
-                },
-                json={
-                    "model": "deepseek-chat",
-                    "messages": [
-                        {"role": "user", "content": self.TRANSLATE_PROMPT.format(text=text)}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": len(text) * 2,
-                },
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            return data["choices"][0]["message"]["content"].strip()
+        response = await self._post(
+            f"{self.base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": CONTENT_TYPE_JSON,
+            },
+            json={
+                "model": "deepseek-chat",
+                "messages": [
+                    {"role": "user", "content": self.TRANSLATE_PROMPT.format(text=text)}
+                ],
+                "temperature": 0.3,
+                "max_tokens": len(text) * 2,
+            },
+        )
+
+        data = response.json()
+        return data["choices"][0]["message"]["content"].strip()
 
 
 class OpenRouterService(BaseAIService):
     """Serviço de IA usando OpenRouter API."""
 
     provider = AIProvider.OPENROUTER
+    classify_model = "anthropic/claude-3-haiku"
+    classify_prompt = DeepSeekService.CLASSIFY_PROMPT
 
-    def __init__(self):
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
         self.api_key = settings.openrouter_api_key
         self.base_url = settings.openrouter_base_url
+        self.http_client = http_client
 
     async def is_available(self) -> bool:
         return bool(self.api_key)
 
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(min=1, max=5))
+    @ai_retry
     async def classify(self, text: str) -> tuple[str, float]:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": CONTENT_TYPE_JSON,
-                },
-                json={
-                    "model": "anthropic/claude-3-haiku",
-                    "messages": [
-                        {"role": "user", "content": DeepSeekService.CLASSIFY_PROMPT.format(
-                            title=text[:500],
-                            abstract=text[500:2000] if len(text) > 500 else "",
-                        )}
-                    ],
-                    "temperature": 0.1,
-                    "max_tokens": 50,
-                },
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            content = data["choices"][0]["message"]["content"].strip()
+        response = await self._post(
+            f"{self.base_url}/chat/completions",
+            timeout=settings.ai_timeout_seconds,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": CONTENT_TYPE_JSON,
+            },
+            json={
+                "model": self.classify_model,
+                "messages": [
+                    {"role": "user", "content": DeepSeekService.CLASSIFY_PROMPT.format(
+                        title=text[:500],
+                        abstract=text[500:2000] if len(text) > 500 else "",
+                    )}
+                ],
+                "temperature": 0.1,
+                "max_tokens": 50,
+            },
+        )
+
+        data = response.json()
+        content = data["choices"][0]["message"]["content"].strip()
+
+        try:
+            import json
+            # OpenRouter models might return markdown block ```json ... ```
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0].strip()
+            elif "```" in content:
+                content = content.split("```")[1].strip()
+
+            result_json = json.loads(content)
+            category = result_json.get("category", "outros").lower()
+            confidence = float(result_json.get("confidence", 0.5))
+
+            valid_categories = ["clinica", "educacao", "organizacional", "pesquisa", "outros"]
+            if category in valid_categories:
+                return (category, confidence)
 
-            try:
-                import json
-                # OpenRouter models might return markdown block ```json ... ```
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].strip()
-
-                result_json = json.loads(content)
-                category = result_json.get("category", "outros").lower()
-                confidence = float(result_json.get("confidence", 0.5))
-
-                valid_categories = ["clinica", "educacao", "organizacional", "pesquisa", "outros"]
-                if category in valid_categories:
-                    return (category, confidence)
-
-                return ("outros", 0.5)
-            except Exception as e:
-                log.warning(f"Erro ao parsear resposta OpenRouter: {e}")
-                return ("outros", 0.0)
+            return ("outros", 0.5)
+        except Exception as e:
+            log.warning(f"Erro ao parsear resposta OpenRouter: {e}")
+            return ("outros", 0.0)
 
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(min=1, max=5))
+    @ai_retry
     async def translate(self, text: str, target_lang: str = "pt") -> str:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": CONTENT_TYPE_JSON,
-                },
-                json={
-                    "model": "anthropic/claude-3-haiku",
-                    "messages": [
-                        {"role": "user", "content": DeepSeekService.TRANSLATE_PROMPT.format(text=text)}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": len(text) * 2,
-                },
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            return data["choices"][0]["message"]["content"].strip()
+        response = await self._post(
+            f"{self.base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": CONTENT_TYPE_JSON,
+            },
+            json={
+                "model": "anthropic/claude-3-haiku",
+                "messages": [
+                    {"role": "user", "content": DeepSeekService.TRANSLATE_PROMPT.format(text=text)}
+                ],
+                "temperature": 0.3,
+                "max_tokens": len(text) * 2,
+            },
+        )
+
+        data = response.json()
+        return data["choices"][0]["message"]["content"].strip()
 
 
 class HuggingFaceService(BaseAIService):
     """Serviço de IA usando HuggingFace Inference API."""
 
     provider = AIProvider.HUGGINGFACE
-
-    def __init__(self):
+    classify_model = "facebook/bart-large-mnli"
+
+    # Rótulos do zero-shot -> categoria
+    LABEL_MAP = {
+        "clinical psychology therapy": "clinica",
+        "education teaching school": "educacao",
+        "organizational business management": "organizacional",
+        "research experiment methodology": "pesquisa",
+    }
+    classify_prompt = "|".join(LABEL_MAP)
+
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
         self.api_key = settings.huggingface_api_key
         self.base_url = "https://api-inference.huggingface.co/models"
+        self.http_client = http_client
 
     async def is_available(self) -> bool:
         return bool(self.api_key)
@@ -392,56 +1008,39 @@ class HuggingFaceService(BaseAIService):
     async def classify(self, text: str) -> tuple[str, float]:
         # HuggingFace é usado principalmente como fallback
         # Usa modelo de classificação de texto
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/facebook/bart-large-mnli",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json={
-                    "inputs": text[:1000],
-                    "parameters": {
-                        "candidate_labels": [
-                            "clinical psychology therapy",
-                            "education teaching school",
-                            "organizational business management",
-                            "research experiment methodology",
-                        ]
-                    },
-                },
-            )
-            response.raise_for_status()
-
-            data = response.json()
-
-            label_map = {
-                "clinical psychology therapy": "clinica",
-                "education teaching school": "educacao",
-                "organizational business management": "organizacional",
-                "research experiment methodology": "pesquisa",
-            }
-
-            if "labels" in data and "scores" in data:
-                top_label = data["labels"][0]
-                top_score = data["scores"][0]
-                category = label_map.get(top_label, "outros")
-                return (category, top_score)
-
-            return ("outros", 0.5)
+        response = await self._post(
+            f"{self.base_url}/{self.classify_model}",
+            timeout=settings.ai_timeout_seconds,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={
+                "inputs": text[:1000],
+                "parameters": {"candidate_labels": list(self.LABEL_MAP)},
+            },
+        )
+
+        data = response.json()
+
+        if "labels" in data and "scores" in data:
+            top_label = data["labels"][0]
+            top_score = data["scores"][0]
+            category = self.LABEL_MAP.get(top_label, "outros")
+            return (category, top_score)
+
+        return ("outros", 0.5)
 
     async def translate(self, text: str, target_lang: str = "pt") -> str:
         # HuggingFace translation usando modelo Helsinki-NLP
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.base_url}/Helsinki-NLP/opus-mt-en-pt",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json={"inputs": text},
-            )
-            response.raise_for_status()
+        response = await self._post(
+            f"{self.base_url}/Helsinki-NLP/opus-mt-en-pt",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={"inputs": text},
+        )
 
-            data = response.json()
-            if isinstance(data, list) and len(data) > 0:
-                return data[0].get("translation_text", text)
+        data = response.json()
+        if isinstance(data, list) and len(data) > 0:
+            return data[0].get("translation_text", text)
 
-            return text
+        return text
 
 
 # Instância global
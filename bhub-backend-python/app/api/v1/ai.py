@@ -11,9 +11,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.ai import get_ai_manager
 from app.config import settings
 from app.core.limiter import limiter
+from app.core.logging import log
 from app.core.rate_limiting import get_user_id_for_rate_limit
 from app.database import get_async_session
 from app.ml import EmbeddingClassifier, HeuristicClassifier
+from app.ml.embedding_service import EmbeddingServiceUnavailable
+from app.ml.encode_executor import EncodeQueueFull
+from app.services.classification_cache import classification_cache_stats
 from app.services.translation_cache_service import (
     TranslationCacheService,
     generate_cache_key,
@@ -82,18 +86,19 @@ async def classify_text(request: Request, classify_request: ClassifyRequest):
     # Usar ML local
     classifier = EmbeddingClassifier()
 
-    if classifier.is_initialized():
-        category, confidence = await classifier.classify(classify_request.text)
-        provider = "local_ml"
-    else:
-        # Fallback para heurística
-        category, confidence = HeuristicClassifier.classify(classify_request.text)
-        provider = "heuristic"
+    if classifier.is_ready():
+        try:
+            category, confidence = await classifier.classify(classify_request.text)
+            return ClassifyResponse(category=category, confidence=confidence, provider="local_ml")
+        except (EncodeQueueFull, EmbeddingServiceUnavailable) as e:
+            log.warning(f"Classificação por embeddings indisponível, usando heurística: {e}")
 
+    # Fallback para heurística
+    category, confidence = HeuristicClassifier.classify(classify_request.text)
     return ClassifyResponse(
         category=category,
         confidence=confidence,
-        provider=provider,
+        provider="heuristic",
     )
 
 
@@ -111,7 +116,6 @@ async def translate_text(
     O sistema verifica primeiro se existe uma tradução em cache antes
     de chamar a API externa, reduzindo custos e melhorando performance.
     """
-    from app.core.logging import log
 
     # Gerar chave de cache
     cache_key = generate_cache_key(
@@ -201,4 +205,5 @@ async def get_ai_status():
     return {
         "ml_local": classifier.get_status(),
         "external_providers": ai_manager.get_status(),
+        "classification_cache": classification_cache_stats(),
     }
@@ -253,7 +253,9 @@ async def get_similar_articles(
     article_id: int,
     limit: int = Query(default=5, ge=1, le=20),
 ):
-    """Retorna artigos similares baseado na categoria."""
+    """Retorna artigos similares (vizinhos pelos embeddings, ou mesma categoria)."""
+    from app.services.similar_articles import SimilarArticlesService
+
     # Buscar artigo original
     result = await db.execute(
         select(Article).where(Article.id == article_id)
@@ -266,24 +268,7 @@ async def get_similar_articles(
             detail="Artigo não encontrado",
         )
 
-    # Buscar artigos da mesma categoria
-    stmt = (
-        select(Article)
-        .where(
-            Article.is_published == True,
-            Article.id != article_id,
-            Article.category_id == article.category_id,
-        )
-        .options(
-            selectinload(Article.category),
-            selectinload(Article.authors),
-        )
-        .order_by(Article.publication_date.desc())
-        .limit(limit)
-    )
-
-    result = await db.execute(stmt)
-    similar = result.scalars().all()
+    similar = await SimilarArticlesService(db).get_similar(article, limit=limit)
 
     return ArticleSimilarResponse(
         articles=[ArticleResponse.model_validate(a) for a in similar]
@@ -60,6 +60,10 @@ class Settings(BaseSettings):
     # Persistent jobs (ARQ/Redis)
     redis_url: str = "redis://localhost:6379/0"
     enable_arq: bool = False
+    task_dispatch_batch_size: int = 100  # artigos por job ARQ nos dispatches em lote
+    # Fila local (sem ARQ): workers em processo e capacidade máxima antes de aplicar backpressure
+    local_task_workers: int = 4
+    local_task_queue_size: int = 1000
 
     # Security
     secret_key: str = Field(default="change-this-secret-key-in-production")
@@ -94,9 +98,32 @@ class Settings(BaseSettings):
     openrouter_base_url: str = "https://openrouter.ai/api/v1"
     huggingface_api_key: str | None = None
     ai_timeout_seconds: int = 30
+    ai_classify_batch_size: int = 10  # artigos por requisição de classificação em lote (DeepSeek)
+    # Circuit breaker por provedor: falhas seguidas para abrir e espera até a chamada de teste
+    ai_circuit_failure_threshold: int = 3
+    ai_circuit_reset_seconds: float = 60.0
+    ai_latency_ewma_alpha: float = 0.2  # peso da última latência na média móvel
+    # Limite de chamadas de saída por provedor (0 = sem limite por minuto)
+    ai_max_concurrency: int = 4
+    ai_requests_per_minute: int = 60
+    ai_tokens_per_minute: int = 0
+    ai_retry_after_max_seconds: float = 30.0  # Retry-After maior: pular para o próximo provedor
+    # Cache de classificações por IA: tabela classification_cache + LRU em memória
+    classification_cache_ttl_hours: int = 720
+    classification_cache_memory_size: int = 2048
     ai_external_max_chars: int = 3000
     ai_rate_limit_daily: str = "100/day"
 
+    # HTTP clients compartilhados (pool, keep-alive, HTTP/2 opcional e timeouts por finalidade)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_http2: bool = False  # requer o pacote "h2"
+    http_timeout_feeds: float = 30.0
+    http_timeout_scraping: float = 10.0
+    http_timeout_pdf: float = 60.0
+    http_timeout_ai: float = 60.0
+
     # Image Services
     unsplash_access_key: str | None = None
     pexels_api_key: str | None = None
@@ -106,6 +133,25 @@ class Settings(BaseSettings):
     enable_scheduler: bool = True
     sync_interval_hours: int = 1
 
+    # Feed sync: limite global de feeds em paralelo e conexões simultâneas por host
+    feed_sync_concurrency: int = 8
+    feed_sync_per_host_limit: int = 2
+
+    # Agendamento adaptativo: verificação de feeds vencidos a cada N minutos,
+    # com intervalo máximo entre sincronizações de um feed ocioso ou com falhas
+    feed_adaptive_sync: bool = True
+    feed_sync_tick_minutes: int = 5
+    feed_sync_max_interval_hours: int = 24
+
+    # Fallback de autores via scraping (job adiado): cache, concorrência e ritmo por domínio
+    author_scrape_cache_ttl_hours: int = 168
+    author_scrape_per_domain_concurrency: int = 2
+    author_scrape_min_interval_seconds: float = 1.0
+
+    # Parsing de feeds fora do event loop: "process", "thread" ou "inline"
+    feed_parse_executor: Literal["process", "thread", "inline"] = "process"
+    feed_parse_workers: int = 2
+
     # Scheduler Mode: "app" (rodar no app), "worker" (worker separado), "off" (desabilitado)
     scheduler_mode: Literal["app", "worker", "off"] = "app"
 
@@ -127,6 +173,38 @@ class Settings(BaseSettings):
     # ML
     embedding_model: str = "paraphrase-multilingual-MiniLM-L12-v2"
     classification_threshold: float = 0.3
+    embedding_batch_size: int = 64  # textos por chamada ao encoder
+    # Backend de inferência: "torch", "onnx" ou "onnx-int8" (ONNX requer o extra "onnx")
+    embedding_backend: Literal["torch", "onnx", "onnx-int8"] = "torch"
+    embedding_threads: int = 0  # threads de inferência; 0 = padrão da biblioteca
+    # Pool de encode: threads dedicadas e limite de pedidos pendentes (acima dele, fallback)
+    embedding_encode_workers: int = 2
+    embedding_encode_max_pending: int = 32
+    embedding_onnx_quantization: Literal["arm64", "avx2", "avx512", "avx512_vnni"] = "avx2"
+    embedding_onnx_dir: Path = Field(default_factory=lambda: Path("./data/onnx"))
+    # Serviço de embeddings compartilhado (python -m app.ml.embedding_service):
+    # com o socket definido, API e workers não carregam o modelo
+    embedding_service_socket: str | None = None
+    embedding_service_timeout_seconds: float = 10.0
+    embedding_service_max_wait_ms: float = 5.0  # espera para agrupar pedidos num lote
+    # Worker de classificação: artigos por lote e espera máxima para o lote encher
+    classification_batch_size: int = 32
+    classification_batch_max_wait_seconds: float = 0.5
+
+    # Busca semântica: índice vetorial dos embeddings de artigos
+    vector_index_dir: Path = Field(default_factory=lambda: Path("./data/vector_index"))
+    vector_index_backend: Literal["numpy", "hnsw"] = "numpy"  # "hnsw" requer hnswlib
+    vector_index_hnsw_min_size: int = 20000  # abaixo disso, busca exata (força bruta)
+    vector_index_hnsw_ef_search: int = 64
+    vector_index_refresh_seconds: float = 30.0  # intervalo mínimo entre sincronizações
+    # Janela relida a cada sincronização: cobre transações que gravam vetores e commitam depois
+    vector_index_sync_margin_seconds: float = 120.0
+    semantic_search_min_score: float = 0.3  # similaridade mínima de cosseno
+    # Busca híbrida: candidatos por lista (full-text e vetorial) e constante k do RRF
+    search_hybrid_candidates: int = 200
+    search_rrf_k: int = 60
+    # Artigos similares: vizinhos pré-calculados por artigo
+    similar_articles_cache_size: int = 20
 
     # Local LLM (llama.cpp)
     local_llm_enabled: bool = False
@@ -167,6 +245,16 @@ class Settings(BaseSettings):
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    @property
+    def embedding_model_key(self) -> str:
+        """
+        Identifica os vetores gerados (embeddings persistidos, índice vetorial).
+        int8 muda os valores: vetores quantizados não se misturam com os float32.
+        """
+        if self.embedding_backend == "onnx-int8":
+            return f"{self.embedding_model}+qint8"
+        return self.embedding_model
+
     @property
     def is_development(self) -> bool:
         return self.environment == "development"
@@ -0,0 +1,154 @@
+"""
+Registro de clientes HTTP compartilhados da aplicação.
+
+Um httpx.AsyncClient por finalidade (feeds, scraping, PDFs, IA), todos com os
+mesmos limites de pool e keep-alive, criados no lifespan e fechados no shutdown.
+Serviços recebem o cliente por injeção e reaproveitam conexões já aquecidas.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from enum import Enum
+from typing import Any
+
+import httpx
+
+from app.config import settings
+from app.core.logging import log
+
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+class HTTPPurpose(str, Enum):
+    """Finalidades de clientes HTTP compartilhados."""
+
+    FEEDS = "feeds"
+    SCRAPING = "scraping"
+    PDF = "pdf"
+    AI = "ai"
+
+
+def _purpose_options(purpose: HTTPPurpose) -> dict[str, Any]:
+    """Timeout, headers e política de redirects de cada finalidade."""
+    if purpose == HTTPPurpose.FEEDS:
+        return {
+            "timeout": settings.http_timeout_feeds,
+            "follow_redirects": True,
+            "headers": {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept": "application/rss+xml, application/xml, text/xml, */*",
+            },
+        }
+    if purpose == HTTPPurpose.SCRAPING:
+        # Timeout curto e redirects limitados para prevenir DoS/loops
+        return {
+            "timeout": settings.http_timeout_scraping,
+            "follow_redirects": True,
+            "max_redirects": 5,
+            "headers": {
+                "User-Agent": BROWSER_USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+            },
+        }
+    if purpose == HTTPPurpose.PDF:
+        return {
+            "timeout": settings.http_timeout_pdf,
+            "follow_redirects": True,
+            "headers": {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept": "application/pdf, */*",
+            },
+        }
+    return {"timeout": settings.http_timeout_ai}
+
+
+def _http2_enabled() -> bool:
+    if not settings.http_http2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        log.warning("HTTP/2 habilitado mas o pacote 'h2' não está instalado; usando HTTP/1.1")
+        return False
+    return True
+
+
+class HTTPClientRegistry:
+    """Mantém um AsyncClient por finalidade, vinculado ao event loop em uso."""
+
+    def __init__(self) -> None:
+        self._clients: dict[HTTPPurpose, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+
+    def get(self, purpose: HTTPPurpose) -> httpx.AsyncClient:
+        """Retorna o cliente da finalidade, criando-o sob demanda."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        # Conexões do pool pertencem ao loop que as abriu (scripts/testes criam loops novos)
+        if loop is not None and self._loop is not None and loop is not self._loop:
+            self._clients.clear()
+        if loop is not None:
+            self._loop = loop
+
+        client = self._clients.get(purpose)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self._limits(),
+                http2=_http2_enabled(),
+                **_purpose_options(purpose),
+            )
+            self._clients[purpose] = client
+        return client
+
+    def init(self) -> None:
+        """Cria todos os clientes antecipadamente (chamado no startup)."""
+        for purpose in HTTPPurpose:
+            self.get(purpose)
+        log.info(
+            f"Clientes HTTP compartilhados criados (max_connections={settings.http_max_connections}, "
+            f"keepalive={settings.http_max_keepalive_connections}, http2={_http2_enabled()})"
+        )
+
+    async def close(self) -> None:
+        """Fecha todos os clientes."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._loop = None
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                log.warning(f"Erro ao fechar cliente HTTP: {e}")
+
+
+_registry = HTTPClientRegistry()
+
+
+def get_http_client(purpose: HTTPPurpose) -> httpx.AsyncClient:
+    """Retorna o cliente HTTP compartilhado para a finalidade."""
+    return _registry.get(purpose)
+
+
+def init_http_clients() -> None:
+    """Inicializa os clientes HTTP compartilhados."""
+    _registry.init()
+
+
+async def close_http_clients() -> None:
+    """Fecha os clientes HTTP compartilhados."""
+    await _registry.close()
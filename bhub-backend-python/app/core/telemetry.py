@@ -8,11 +8,13 @@ ai_latency = None
 ai_fallback_counter = None
 feed_ingested_counter = None
 feed_failed_counter = None
+feed_stage_latency = None
 
 
 def setup_telemetry(app_name: str = "bhub-backend") -> None:
     """Configura traces e métricas quando as dependências estiverem disponíveis."""
     global ai_latency, ai_fallback_counter, feed_ingested_counter, feed_failed_counter
+    global feed_stage_latency
 
     try:
         from opentelemetry import metrics, trace
@@ -48,6 +50,11 @@ def setup_telemetry(app_name: str = "bhub-backend") -> None:
         "feeds.sync.failed.total",
         description="Total de sincronizações de feed com falha",
     )
+    feed_stage_latency = meter.create_histogram(
+        "feeds.sync.stage.duration_ms",
+        description="Duração de cada etapa da sincronização de feed",
+        unit="ms",
+    )
 
 
 def record_ai_latency(duration_ms: float, provider: str) -> None:
@@ -68,3 +75,10 @@ def record_feed_ingested(count: int, feed_name: str) -> None:
 def record_feed_failed(feed_name: str) -> None:
     if feed_failed_counter:
         feed_failed_counter.add(1, {"feed": feed_name})
+
+
+def record_feed_sync_stages(stage_timings: dict[str, float], feed_name: str) -> None:
+    """Registra as durações (em segundos) de cada etapa da sincronização."""
+    if feed_stage_latency:
+        for stage, seconds in stage_timings.items():
+            feed_stage_latency.record(seconds * 1000, {"stage": stage, "feed": feed_name})
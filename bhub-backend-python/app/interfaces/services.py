@@ -58,7 +58,7 @@ class IFeedAggregator(Protocol):
     async def sync_feed(self, feed_id: int):
         ...
 
-    async def sync_all_active_feeds(self):
+    async def sync_all_active_feeds(self, concurrency: int | None = None):
         ...
 
     async def close(self) -> None:
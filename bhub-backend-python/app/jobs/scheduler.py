@@ -5,6 +5,7 @@ Sistema de jobs agendados.
 import pytz
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from app.config import settings
 from app.core.logging import log
@@ -58,13 +59,21 @@ def setup_scheduler():
         log.info("Scheduler desabilitado (scheduler_mode=off)")
         return
 
-    # Sincronização de feeds a cada hora
+    # Sincronização de feeds: com agendamento adaptativo, verifica feeds vencidos
+    # a cada poucos minutos (cada feed tem seu próprio next_sync_at com jitter)
+    if settings.feed_adaptive_sync:
+        trigger = IntervalTrigger(minutes=settings.feed_sync_tick_minutes)
+    else:
+        trigger = CronTrigger(minute=0)  # A cada hora, no minuto 0
+
     scheduler.add_job(
         sync_all_feeds_job,
-        CronTrigger(minute=0),  # A cada hora, no minuto 0
+        trigger,
         id="sync_feeds",
         name="Sincronização de Feeds",
         replace_existing=True,
+        max_instances=1,
+        coalesce=True,
     )
 
     log.info(f"Jobs agendados configurados (mode={settings.scheduler_mode})")
@@ -42,6 +42,26 @@ async def task_classify_article(ctx: dict[str, Any], article_id: int) -> dict[st
     }
 
 
+async def task_classify_articles(ctx: dict[str, Any], article_ids: list[int]) -> dict[str, Any]:
+    """Classifica um lote de artigos (encode e escrita em lote) em um único job persistente."""
+    db: AsyncSession = ctx["db"]
+
+    from app.ai import get_ai_manager
+    from app.services.classification_service import ClassificationService
+    from app.services.similar_articles import refresh_similar_articles
+
+    service = ClassificationService(db=db, ai_manager=get_ai_manager())
+    classified = await service.classify_articles(article_ids)
+    await refresh_similar_articles(db, list(classified))
+    await db.commit()
+
+    logger.info("Lote classificado: %d/%d artigos", len(classified), len(article_ids))
+    return {
+        "classified": {article_id: slug for article_id, (slug, _) in classified.items()},
+        "not_found": [article_id for article_id in article_ids if article_id not in classified],
+    }
+
+
 async def task_download_pdf(
     ctx: dict[str, Any],
     article_id: int,
@@ -56,6 +76,39 @@ async def task_download_pdf(
     return {"article_id": article_id, "pdf_url": pdf_url, "status": "processed"}
 
 
+async def task_download_pdfs(
+    ctx: dict[str, Any],
+    items: list[tuple[int, str | None]],
+) -> dict[str, Any]:
+    """Baixa PDFs de um lote de artigos open access em um único job persistente."""
+    from app.services.background_tasks import download_pdf_task
+
+    for article_id, _pdf_url in items:
+        await download_pdf_task(article_id)
+    return {"article_ids": [article_id for article_id, _ in items], "status": "processed"}
+
+
+async def task_scrape_authors(ctx: dict[str, Any], article_ids: list[int]) -> dict[str, Any]:
+    """Completa autores ausentes no feed via scraping em job persistente."""
+    db: AsyncSession = ctx["db"]
+
+    from app.services.feed_aggregator import FeedAggregatorService
+
+    filled = await FeedAggregatorService(db).fill_missing_authors(article_ids)
+    return {"article_ids": article_ids, "filled": filled}
+
+
+async def task_refresh_similar_articles(ctx: dict[str, Any], article_ids: list[int]) -> dict[str, Any]:
+    """Grava as listas de artigos similares calculadas na leitura em job persistente."""
+    db: AsyncSession = ctx["db"]
+
+    from app.services.similar_articles import refresh_similar_articles
+
+    await refresh_similar_articles(db, article_ids)
+    await db.commit()
+    return {"article_ids": article_ids}
+
+
 async def startup(ctx: dict[str, Any]) -> None:
     from app.database import async_session_maker
 
@@ -67,6 +120,10 @@ async def shutdown(ctx: dict[str, Any]) -> None:
     if session:
         await session.close()
 
+    from app.core.http_client import close_http_clients
+
+    await close_http_clients()
+
 
 async def on_job_start(ctx: dict[str, Any]) -> None:
     session_factory = ctx["session_factory"]
@@ -82,7 +139,14 @@ async def on_job_end(ctx: dict[str, Any]) -> None:
 class WorkerSettings:
     """Configuração central do worker ARQ."""
 
-    functions = [task_classify_article, task_download_pdf]
+    functions = [
+        task_classify_article,
+        task_classify_articles,
+        task_download_pdf,
+        task_download_pdfs,
+        task_scrape_authors,
+        task_refresh_similar_articles,
+    ]
     on_startup = startup
     on_shutdown = shutdown
     on_job_start = on_job_start
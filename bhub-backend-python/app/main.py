@@ -18,6 +18,7 @@ from app.config import settings
 from app.core.access_token_cookie_middleware import AccessTokenCookieMiddleware
 from app.core.analytics_middleware import AnalyticsMiddleware
 from app.core.auth_cookie_middleware import AuthCookieMiddleware
+from app.core.http_client import close_http_clients, init_http_clients
 from app.core.limiter import limiter
 from app.core.logging import log, setup_logging
 from app.core.security_headers import SecurityHeadersMiddleware
@@ -46,6 +47,9 @@ async def lifespan(app: FastAPI):
     # Inicializar categorias padrão
     await seed_categories()
 
+    # Clientes HTTP compartilhados (feeds, scraping, PDFs, IA)
+    init_http_clients()
+
     # Configurar e iniciar scheduler
     setup_scheduler()
     start_scheduler()
@@ -61,17 +65,23 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             log.warning(f"ARQ não inicializado: {e}")
 
-    # Inicializar ML (em background)
+    # Inicializar ML em background: até ficar pronto, a classificação usa a heurística
     try:
         from app.ml import EmbeddingClassifier
-        await EmbeddingClassifier.initialize()
-
-        # Carregar embeddings das categorias
         from app.models import DEFAULT_CATEGORIES
-        await EmbeddingClassifier.load_category_embeddings(DEFAULT_CATEGORIES)
+
+        EmbeddingClassifier.warmup(DEFAULT_CATEGORIES)
     except Exception as e:
         log.warning(f"ML não inicializado: {e}")
 
+    # Índice vetorial da busca semântica (mmap do disco + sincronização incremental)
+    try:
+        from app.services.semantic_index import load_semantic_index
+
+        await load_semantic_index()
+    except Exception as e:
+        log.warning(f"Índice semântico não carregado: {e}")
+
     log.info("Aplicação iniciada com sucesso")
 
     yield
@@ -79,12 +89,32 @@ async def lifespan(app: FastAPI):
     # Shutdown
     log.info("Encerrando aplicação...")
     stop_scheduler()
+
+    from app.ml import EmbeddingClassifier
+
+    await EmbeddingClassifier.cancel_warmup()
     try:
-        from app.services.task_dispatcher import close_arq_pool
+        from app.services.classification_worker import close_classification_batcher
+        from app.services.task_dispatcher import close_arq_pool, close_local_queue
 
+        await close_classification_batcher()
+        await close_local_queue()
         await close_arq_pool()
     except Exception as e:
-        log.warning(f"Erro ao fechar ARQ pool: {e}")
+        log.warning(f"Erro ao fechar filas de tarefas: {e}")
+
+    from app.services.semantic_index import close_semantic_index
+
+    await close_semantic_index()
+
+    from app.services.feed_parsing import shutdown_parse_executor
+
+    shutdown_parse_executor()
+
+    from app.ml.encode_executor import shutdown_encode_executor
+
+    shutdown_encode_executor()
+    await close_http_clients()
     await close_db()
     log.info("Aplicação encerrada")
 
@@ -331,7 +361,10 @@ async def health_check():
     """Health check da aplicação."""
     from app.ml import EmbeddingClassifier
 
-    ml_status = "loaded" if EmbeddingClassifier.is_initialized() else "not_loaded"
+    # "loading" enquanto o warmup roda; "loaded" só com as categorias prontas
+    ml_status = EmbeddingClassifier.get_status()["state"]
+    if ml_status == "loaded" and not EmbeddingClassifier.is_ready():
+        ml_status = "loading"
 
     return HealthResponse(
         status="healthy",
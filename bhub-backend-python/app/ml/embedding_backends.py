@@ -0,0 +1,89 @@
+"""
+Carregamento do SentenceTransformer por backend de inferência.
+
+- "torch": modelo PyTorch original.
+- "onnx": mesmo modelo exportado para ONNX Runtime (float32, embeddings equivalentes).
+- "onnx-int8": ONNX com quantização dinâmica int8, exportado uma vez para
+  settings.embedding_onnx_dir e reaproveitado nas próximas inicializações.
+
+O backend ONNX requer o extra "onnx" (sentence-transformers[onnx]).
+"""
+
+import os
+import re
+from pathlib import Path
+
+from app.config import settings
+from app.core.logging import log
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def quantized_file_name(quantization: str) -> str:
+    """Arquivo gerado por export_dynamic_quantized_onnx_model (ex.: onnx/model_qint8_avx2.onnx)."""
+    return f"onnx/model_qint8_{quantization}.onnx"
+
+
+def onnx_export_dir(model_name: str) -> Path:
+    """Diretório local com o modelo exportado e quantizado."""
+    return settings.embedding_onnx_dir / re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+
+
+def _onnx_model_kwargs(threads: int) -> dict:
+    kwargs: dict = {"provider": "CPUExecutionProvider"}
+    if threads > 0:
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        kwargs["session_options"] = options
+    return kwargs
+
+
+def load_sentence_transformer(
+    model_name: str | None = None,
+    backend: str | None = None,
+    threads: int | None = None,
+    quantization: str | None = None,
+):
+    """
+    Carrega o modelo de embeddings no backend pedido (padrões vêm de settings).
+
+    Returns:
+        SentenceTransformer pronto para encode()
+    """
+    from sentence_transformers import SentenceTransformer
+
+    model_name = model_name or settings.embedding_model
+    backend = backend or settings.embedding_backend
+    threads = settings.embedding_threads if threads is None else threads
+    quantization = quantization or settings.embedding_onnx_quantization
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de embeddings inválido: {backend}")
+
+    if backend == "torch":
+        if threads > 0:
+            import torch
+
+            torch.set_num_threads(threads)
+        return SentenceTransformer(model_name)
+
+    model_kwargs = _onnx_model_kwargs(threads)
+    if backend == "onnx":
+        return SentenceTransformer(model_name, backend="onnx", model_kwargs=model_kwargs)
+
+    export_dir = onnx_export_dir(model_name)
+    file_name = quantized_file_name(quantization)
+    if not (export_dir / file_name).exists():
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        log.info(f"Exportando {model_name} para ONNX int8 ({quantization}) em {export_dir}...")
+        # Exporta para ONNX (se o repositório não tiver) e salva modelo + tokenizer localmente
+        model = SentenceTransformer(model_name, backend="onnx", model_kwargs=model_kwargs)
+        export_dir.mkdir(parents=True, exist_ok=True)
+        model.save(str(export_dir))
+        export_dynamic_quantized_onnx_model(model, quantization, str(export_dir))
+
+    model_kwargs["file_name"] = file_name
+    return SentenceTransformer(os.fspath(export_dir), backend="onnx", model_kwargs=model_kwargs)
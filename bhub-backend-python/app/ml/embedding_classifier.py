@@ -2,12 +2,20 @@
 Classificador de artigos usando embeddings.
 """
 
+import asyncio
+from typing import TYPE_CHECKING
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
 from app.config import settings
 from app.core.logging import log
+from app.ml.embedding_backends import load_sentence_transformer
+from app.ml.embedding_service import EmbeddingServiceClient, EmbeddingServiceUnavailable
+from app.ml.encode_executor import EncodeQueueFull, encode_executor_stats, run_in_encode_executor
+from app.ml.similarity import cosine_scores, normalize_rows, top_k
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 
 class EmbeddingClassifier:
@@ -17,9 +25,18 @@ class EmbeddingClassifier:
     """
 
     _instance = None
-    _model: SentenceTransformer | None = None
-    _category_embeddings: dict[str, np.ndarray] = {}
+    _model: "SentenceTransformer | None" = None
+    # Com EMBEDDING_SERVICE_SOCKET, o modelo fica no serviço compartilhado
+    _client: EmbeddingServiceClient | None = None
+    _categories: list[dict] = []
+    # Slugs e matriz (n_categorias, dim) float32 com linhas de norma 1, na mesma ordem
+    _category_slugs: list[str] = []
+    _category_matrix: np.ndarray | None = None
     _initialized: bool = False
+    # Carga em background: "not_loaded" | "loading" | "loaded" | "failed"
+    _state: str = "not_loaded"
+    _load_error: str | None = None
+    _warmup_task: asyncio.Task | None = None
 
     def __new__(cls):
         """Singleton pattern."""
@@ -28,26 +45,102 @@ class EmbeddingClassifier:
         return cls._instance
 
     @classmethod
-    async def initialize(cls) -> None:
-        """Inicializa o modelo de embeddings."""
+    async def initialize(cls, local: bool = False) -> None:
+        """
+        Inicializa o modelo de embeddings.
+
+        Com settings.embedding_service_socket (e local=False) apenas conecta ao
+        serviço compartilhado; se ele estiver fora do ar, as chamadas falham e os
+        chamadores usam o fallback heurístico até ele voltar.
+        """
         if cls._initialized:
             return
 
+        # Carga em andamento no warmup: aguardar em vez de carregar o modelo de novo
+        task = cls._warmup_task
+        if (
+            task is not None
+            and not task.done()
+            and task is not asyncio.current_task()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            await asyncio.shield(task)
+            if cls._initialized:
+                return
+
+        if settings.embedding_service_socket and not local:
+            cls._client = EmbeddingServiceClient(settings.embedding_service_socket)
+            try:
+                status = await cls._client.status()
+                log.info(f"Usando serviço de embeddings: {status.get('model')}")
+            except Exception as e:
+                log.warning(f"Serviço de embeddings indisponível ({e}); tentando a cada uso")
+            cls._initialized = True
+            cls._state = "loaded"
+            return
+
         log.info("Inicializando modelo de embeddings...")
+        cls._state = "loading"
 
         try:
-            cls._model = SentenceTransformer(settings.embedding_model)
-            log.info(f"Modelo carregado: {settings.embedding_model}")
+            # Download e carga do modelo são bloqueantes: rodar fora do event loop
+            cls._model = await asyncio.to_thread(load_sentence_transformer)
+            log.info(
+                f"Modelo carregado: {settings.embedding_model} "
+                f"(backend={settings.embedding_backend})"
+            )
             cls._initialized = True
+            cls._state = "loaded"
+            cls._load_error = None
         except Exception as e:
             log.error(f"Erro ao carregar modelo: {e}")
+            cls._state = "failed"
+            cls._load_error = str(e)
             raise
 
+    @classmethod
+    def warmup(cls, categories: list[dict]) -> asyncio.Task:
+        """
+        Carrega o modelo e os embeddings das categorias em background.
+
+        A aplicação começa a atender imediatamente; até is_ready(), os
+        chamadores usam o classificador heurístico.
+        """
+        if cls._warmup_task is not None and not cls._warmup_task.done():
+            return cls._warmup_task
+
+        async def _run() -> None:
+            try:
+                await cls.initialize()
+                await cls.load_category_embeddings(categories)
+                log.info("Classificador de embeddings pronto")
+            except Exception as e:
+                cls._state = "failed"
+                cls._load_error = str(e)
+                log.warning(f"ML não inicializado: {e}")
+
+        cls._state = "loading"
+        cls._warmup_task = asyncio.create_task(_run(), name="embedding-warmup")
+        return cls._warmup_task
+
+    @classmethod
+    async def cancel_warmup(cls) -> None:
+        """Interrompe a espera pelo warmup (encerramento da aplicação)."""
+        task, cls._warmup_task = cls._warmup_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
     @classmethod
     def is_initialized(cls) -> bool:
         """Verifica se o modelo está inicializado."""
         return cls._initialized
 
+    @classmethod
+    def is_ready(cls) -> bool:
+        """Modelo e embeddings das categorias prontos para classificar."""
+        return cls._initialized and (cls._category_matrix is not None or cls._client is not None)
+
     @classmethod
     async def load_category_embeddings(cls, categories: list[dict]) -> None:
         """
@@ -61,8 +154,27 @@ class EmbeddingClassifier:
 
         log.info("Gerando embeddings das categorias...")
 
+        cls._categories = categories
+        try:
+            embeddings = await cls.encode_texts(cls.category_texts(categories))
+        except Exception as e:
+            if cls._client is None:
+                raise
+            # Serviço fora do ar: a matriz é gerada no primeiro uso (score_batch)
+            log.warning(f"Embeddings das categorias adiados: {e}")
+            return
+
+        # Matriz (n_categorias, dim) normalizada: classificar vira um único produto de matrizes
+        cls._category_slugs = [cat["slug"] for cat in categories]
+        cls._category_matrix = normalize_rows(embeddings)
+
+        log.info(f"Embeddings carregados para {len(cls._category_slugs)} categorias")
+
+    @staticmethod
+    def category_texts(categories: list[dict]) -> list[str]:
+        """Texto de cada categoria usado no embedding: nome, descrição e keywords."""
+        texts = []
         for cat in categories:
-            # Combinar descrição e keywords para gerar embedding
             text_parts = [cat["name"]]
 
             if cat.get("description"):
@@ -71,15 +183,83 @@ class EmbeddingClassifier:
             if cat.get("keywords"):
                 text_parts.append(cat["keywords"])
 
-            text = " ".join(text_parts)
+            texts.append(" ".join(text_parts))
+        return texts
 
-            # Gerar embedding
-            embedding = cls._model.encode(text, convert_to_numpy=True)
-            cls._category_embeddings[cat["slug"]] = embedding
+    @classmethod
+    def _encode(cls, texts: list[str]) -> np.ndarray:
+        """Gera embeddings normalizados (float32) em lote."""
+        embeddings = cls._model.encode(
+            texts,
+            batch_size=settings.embedding_batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+
+    @classmethod
+    def _valid_indices(cls, texts: list[str]) -> list[int]:
+        """Índices dos textos longos o bastante para classificar."""
+        return [i for i, text in enumerate(texts) if text and len(text.strip()) >= 10]
+
+    @classmethod
+    async def encode_texts(cls, texts: list[str]) -> np.ndarray:
+        """Embeddings normalizados (len(texts), dim) float32, calculados fora do event loop."""
+        if not cls._initialized:
+            await cls.initialize()
+        if cls._client is not None:
+            return await cls._client.encode(texts)
+        return await cls.encode_local(texts)
+
+    @classmethod
+    async def encode_local(cls, texts: list[str]) -> np.ndarray:
+        """
+        Encode com o modelo carregado neste processo, no pool de encode.
+
+        Raises:
+            EncodeQueueFull: pool saturado (os chamadores usam o fallback)
+        """
+        # encode é CPU-bound: rodar fora do event loop, com fila limitada
+        return await run_in_encode_executor(cls._encode, texts)
+
+    @classmethod
+    async def score_batch(
+        cls,
+        texts: list[str],
+        embeddings: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Similaridade de cada texto com cada categoria.
 
-            log.debug(f"Embedding gerado para categoria: {cat['name']}")
+        Args:
+            texts: Textos a pontuar
+            embeddings: Vetores já calculados, alinhados com texts (evita novo encode)
+
+        Returns:
+            Matriz (len(texts), n_categorias); textos curtos demais ficam com score 0
+
+        Raises:
+            EmbeddingServiceUnavailable: serviço compartilhado fora do ar
+        """
+        if not cls._initialized:
+            await cls.initialize()
 
-        log.info(f"Embeddings carregados para {len(cls._category_embeddings)} categorias")
+        if cls._category_matrix is None and cls._client is not None and cls._categories:
+            await cls.load_category_embeddings(cls._categories)
+            if cls._category_matrix is None:
+                raise EmbeddingServiceUnavailable("embeddings das categorias ainda não carregados")
+        if cls._category_matrix is None:
+            return np.zeros((len(texts), 0), dtype=np.float32)
+
+        scores = np.zeros((len(texts), len(cls._category_slugs)), dtype=np.float32)
+        valid = cls._valid_indices(texts)
+        if valid:
+            if embeddings is None:
+                vectors = await cls.encode_texts([texts[i] for i in valid])
+            else:
+                vectors = np.asarray(embeddings, dtype=np.float32)[valid]
+            scores[valid] = cosine_scores(vectors, cls._category_matrix)
+        return scores
 
     @classmethod
     async def classify(
@@ -97,95 +277,87 @@ class EmbeddingClassifier:
         Returns:
             Tupla (categoria_slug, confiança)
         """
-        if not cls._initialized:
-            await cls.initialize()
-
-        if threshold is None:
-            threshold = settings.classification_threshold
-
-        if not cls._category_embeddings:
-            log.warning("Nenhum embedding de categoria carregado")
-            return ("outros", 0.0)
-
-        if not text or len(text.strip()) < 10:
-            return ("outros", 0.0)
-
-        try:
-            # Gerar embedding do texto
-            text_embedding = cls._model.encode(text, convert_to_numpy=True)
-
-            # Calcular similaridade com cada categoria
-            similarities = {}
-            for cat_slug, cat_embedding in cls._category_embeddings.items():
-                similarity = cls._cosine_similarity(text_embedding, cat_embedding)
-                similarities[cat_slug] = float(similarity)
-
-            # Encontrar categoria com maior similaridade
-            best_category = max(similarities, key=similarities.get)
-            best_score = similarities[best_category]
-
-            log.debug(f"Classificação: {best_category} (score: {best_score:.4f})")
-
-            # Verificar threshold
-            if best_score < threshold:
-                log.debug(f"Score abaixo do threshold ({threshold}), usando 'outros'")
-                return ("outros", best_score)
-
-            return (best_category, best_score)
-
-        except Exception as e:
-            log.error(f"Erro na classificação: {e}")
-            return ("outros", 0.0)
+        [result] = await cls.classify_batch([text], threshold)
+        return result
 
     @classmethod
     async def classify_batch(
         cls,
         texts: list[str],
         threshold: float = None,
+        embeddings: np.ndarray | None = None,
     ) -> list[tuple[str, float]]:
         """
         Classifica múltiplos textos em batch.
-        Mais eficiente que classificar um por um.
-        """
-        if not cls._initialized:
-            await cls.initialize()
+        Um encode em lote (ou os embeddings fornecidos), um produto de matrizes
+        e um argmax por texto.
 
+        Raises:
+            EncodeQueueFull, EmbeddingServiceUnavailable: encoder indisponível; o
+                chamador usa seu fallback em vez de receber "outros" com confiança 0
+        """
         if threshold is None:
             threshold = settings.classification_threshold
 
-        if not cls._category_embeddings:
-            return [("outros", 0.0) for _ in texts]
+        if not texts:
+            return []
 
         try:
-            # Gerar embeddings em batch
-            embeddings = cls._model.encode(texts, convert_to_numpy=True)
+            scores = await cls.score_batch(texts, embeddings)
+        except (EncodeQueueFull, EmbeddingServiceUnavailable):
+            raise
+        except Exception as e:
+            log.error(f"Erro na classificação batch: {e}")
+            return [("outros", 0.0) for _ in texts]
 
-            results = []
-            for embedding in embeddings:
-                # Calcular similaridade
-                similarities = {}
-                for cat_slug, cat_embedding in cls._category_embeddings.items():
-                    similarity = cls._cosine_similarity(embedding, cat_embedding)
-                    similarities[cat_slug] = float(similarity)
+        if scores.shape[1] == 0:
+            log.warning("Nenhum embedding de categoria carregado")
+            return [("outros", 0.0) for _ in texts]
 
-                best_category = max(similarities, key=similarities.get)
-                best_score = similarities[best_category]
+        valid = set(cls._valid_indices(texts))
+        best = scores.argmax(axis=1)
+        results = []
+        for i, (idx, score) in enumerate(zip(best, scores[np.arange(len(texts)), best], strict=True)):
+            score = float(score)
+            if i not in valid:
+                results.append(("outros", 0.0))
+            elif score < threshold:
+                results.append(("outros", score))
+            else:
+                results.append((cls._category_slugs[idx], score))
+        return results
 
-                if best_score < threshold:
-                    results.append(("outros", best_score))
-                else:
-                    results.append((best_category, best_score))
+    @classmethod
+    async def classify_top_k(
+        cls,
+        texts: list[str],
+        k: int = 3,
+        threshold: float = None,
+        embeddings: np.ndarray | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Classificação multi-rótulo: as k categorias mais similares de cada texto,
+        acima do threshold, em ordem decrescente de score.
+        """
+        if threshold is None:
+            threshold = settings.classification_threshold
 
-            return results
+        if not texts:
+            return []
 
-        except Exception as e:
-            log.error(f"Erro na classificação batch: {e}")
-            return [("outros", 0.0) for _ in texts]
+        scores = await cls.score_batch(texts, embeddings)
+        if scores.shape[1] == 0:
+            return [[] for _ in texts]
 
-    @staticmethod
-    def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
-        """Calcula similaridade de cosseno entre dois vetores."""
-        return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+        indices, top_scores = top_k(scores, k)
+        return [
+            [
+                (cls._category_slugs[idx], float(score))
+                for idx, score in zip(row_indices, row_scores, strict=True)
+                if score >= threshold
+            ]
+            for row_indices, row_scores in zip(indices, top_scores, strict=True)
+        ]
 
     @classmethod
     def get_embedding(cls, text: str) -> np.ndarray | None:
@@ -199,8 +371,14 @@ class EmbeddingClassifier:
         """Retorna status do classificador."""
         return {
             "initialized": cls._initialized,
+            "state": cls._state,
+            "ready": cls.is_ready(),
+            "error": cls._load_error,
             "model": settings.embedding_model if cls._initialized else None,
-            "categories_loaded": len(cls._category_embeddings),
+            "mode": ("remote" if cls._client else "local") if cls._initialized else None,
+            "backend": settings.embedding_backend if cls._initialized else None,
+            "categories_loaded": len(cls._category_slugs),
+            "encode_queue": encode_executor_stats() if cls._model is not None else None,
         }
 
 
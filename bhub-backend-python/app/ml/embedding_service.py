@@ -0,0 +1,239 @@
+"""
+Serviço de embeddings compartilhado via socket Unix.
+
+Um único processo carrega o modelo e atende os workers da aplicação, que viram
+clientes leves (sem modelo em memória) quando settings.embedding_service_socket
+está definido. Pedidos simultâneos são agrupados num único encode em lote.
+
+Protocolo: frames com 4 bytes (big-endian) de tamanho seguidos do conteúdo.
+O pedido é um frame JSON ({"op": "encode" | "status", ...}); a
+resposta é um frame JSON e, para "encode", um segundo frame com a matriz
+float32 little-endian (n, dim).
+
+Uso:
+    python -m app.ml.embedding_service
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import struct
+import sys
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import numpy as np
+
+from app.config import settings
+from app.core.logging import log
+
+_HEADER = struct.Struct(">I")
+# Limite de frame: protege o servidor de pedidos malformados
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+class EmbeddingServiceUnavailable(ConnectionError):
+    """Serviço de embeddings fora do ar ou sem resposta."""
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if size > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame de {size} bytes excede o limite")
+    return await reader.readexactly(size)
+
+
+def write_frame(writer: asyncio.StreamWriter, payload: bytes) -> None:
+    writer.write(_HEADER.pack(len(payload)) + payload)
+
+
+class EmbeddingServiceClient:
+    """Cliente do serviço de embeddings (uma conexão por pedido)."""
+
+    def __init__(self, socket_path: str, timeout: float | None = None):
+        self.socket_path = socket_path
+        self.timeout = timeout or settings.embedding_service_timeout_seconds
+
+    async def _request(self, payload: dict) -> dict:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self.socket_path), self.timeout
+            )
+        except (OSError, TimeoutError) as e:
+            raise EmbeddingServiceUnavailable(f"{self.socket_path}: {e}") from e
+        try:
+            write_frame(writer, json.dumps(payload).encode("utf-8"))
+            await writer.drain()
+            response = json.loads(await asyncio.wait_for(read_frame(reader), self.timeout))
+            if not response.get("ok"):
+                raise RuntimeError(response.get("error", "erro no serviço de embeddings"))
+            if "shape" in response:
+                blob = await asyncio.wait_for(read_frame(reader), self.timeout)
+                response["matrix"] = np.frombuffer(blob, dtype="<f4").reshape(response["shape"])
+            return response
+        except (OSError, TimeoutError, asyncio.IncompleteReadError) as e:
+            raise EmbeddingServiceUnavailable(f"{self.socket_path}: {e}") from e
+        finally:
+            writer.close()
+
+    async def encode(self, texts: list[str]) -> np.ndarray:
+        """Embeddings normalizados (len(texts), dim) float32."""
+        response = await self._request({"op": "encode", "texts": texts})
+        return response["matrix"]
+
+    async def status(self) -> dict:
+        response = await self._request({"op": "status"})
+        return response["status"]
+
+
+class EmbeddingServer:
+    """Servidor que agrupa pedidos de encode concorrentes em lotes."""
+
+    def __init__(
+        self,
+        socket_path: str,
+        batch_size: int | None = None,
+        max_wait_seconds: float | None = None,
+        encoder: Callable[[list[str]], Awaitable[np.ndarray]] | None = None,
+    ):
+        self.socket_path = socket_path
+        # Padrão: modelo carregado neste processo (EmbeddingClassifier.encode_local)
+        self.encoder = encoder
+        self.batch_size = batch_size or settings.embedding_batch_size
+        if max_wait_seconds is None:
+            max_wait_seconds = settings.embedding_service_max_wait_ms / 1000
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: asyncio.Queue[tuple[list[str], asyncio.Future]] = asyncio.Queue()
+        self._server: asyncio.AbstractServer | None = None
+        self._batcher: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        path = Path(self.socket_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        self._batcher = asyncio.create_task(self._run_batches(), name="embedding-batches")
+        log.info(f"Serviço de embeddings ouvindo em {self.socket_path}")
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, return_exceptions=True)
+        if Path(self.socket_path).exists():
+            Path(self.socket_path).unlink()
+
+    async def encode(self, texts: list[str]) -> np.ndarray:
+        """Enfileira textos para o próximo lote e aguarda seus embeddings."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, future))
+        return await future
+
+    async def _next_batch(self) -> list[tuple[list[str], asyncio.Future]]:
+        batch = [await self._queue.get()]
+        count = len(batch[0][0])
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_seconds
+        while count < self.batch_size:
+            # Tudo que já está na fila entra sem esperar
+            if not self._queue.empty():
+                item = self._queue.get_nowait()
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except TimeoutError:
+                    break
+            batch.append(item)
+            count += len(item[0])
+        return batch
+
+    async def _run_batches(self) -> None:
+        from app.ml import EmbeddingClassifier
+
+        encoder = self.encoder or EmbeddingClassifier.encode_local
+        while True:
+            batch = await self._next_batch()
+            texts = [text for item_texts, _ in batch for text in item_texts]
+            try:
+                matrix = await encoder(texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            offset = 0
+            for item_texts, future in batch:
+                if not future.done():
+                    future.set_result(matrix[offset : offset + len(item_texts)])
+                offset += len(item_texts)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        from app.ml import EmbeddingClassifier
+
+        try:
+            request = json.loads(await read_frame(reader))
+            op = request.get("op")
+            if op == "encode":
+                matrix = await self.encode(list(request["texts"]))
+                header = {"ok": True, "shape": list(matrix.shape)}
+                write_frame(writer, json.dumps(header).encode("utf-8"))
+                write_frame(writer, np.ascontiguousarray(matrix, dtype="<f4").tobytes())
+            elif op == "status":
+                status = {**EmbeddingClassifier.get_status(), "queued": self._queue.qsize()}
+                write_frame(writer, json.dumps({"ok": True, "status": status}).encode("utf-8"))
+            else:
+                write_frame(writer, json.dumps({"ok": False, "error": f"op inválida: {op}"}).encode())
+            await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        except Exception as e:
+            log.warning(f"Erro no serviço de embeddings: {e}")
+            try:
+                write_frame(writer, json.dumps({"ok": False, "error": str(e)}).encode("utf-8"))
+                await writer.drain()
+            except OSError:
+                pass
+        finally:
+            writer.close()
+
+
+async def serve(socket_path: str | None = None) -> None:
+    """Carrega o modelo e as categorias e atende até ser interrompido."""
+    from app.ml import EmbeddingClassifier
+    from app.models.category import DEFAULT_CATEGORIES
+
+    socket_path = socket_path or settings.embedding_service_socket
+    if not socket_path:
+        raise SystemExit("EMBEDDING_SERVICE_SOCKET não definido")
+
+    await EmbeddingClassifier.initialize(local=True)
+    await EmbeddingClassifier.load_category_embeddings(DEFAULT_CATEGORIES)
+
+    server = EmbeddingServer(socket_path)
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main() -> int:
+    from app.core.logging import setup_logging
+
+    setup_logging()
+    socket_path = sys.argv[1] if len(sys.argv) > 1 else None
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(socket_path))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Pool de threads dedicado ao encode de embeddings.
+
+O encode é CPU-bound e leva dezenas de milissegundos por lote; no pool padrão do
+asyncio (to_thread) ele disputaria threads com o resto da aplicação e, sob carga,
+acumularia uma fila sem limite. Aqui o número de threads é fixo
+(embedding_encode_workers) e os pedidos pendentes são limitados
+(embedding_encode_max_pending): acima do limite o pedido é recusado com
+EncodeQueueFull e os chamadores usam o fallback (heurística, busca lexical).
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+from app.config import settings
+
+T = TypeVar("T")
+
+
+class EncodeQueueFull(RuntimeError):
+    """Pedidos de encode pendentes acima de embedding_encode_max_pending."""
+
+
+@dataclass
+class EncodeStats:
+    """Métricas do pool de encode (contadores desde o início do processo)."""
+
+    queued: int = 0  # aguardando uma thread
+    running: int = 0
+    max_queued: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    run_seconds_total: float = 0.0
+
+
+_executor: ThreadPoolExecutor | None = None
+_stats = EncodeStats()
+_lock = threading.Lock()
+
+
+def get_encode_executor() -> ThreadPoolExecutor:
+    """Retorna o pool de encode, criado sob demanda."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.embedding_encode_workers),
+            thread_name_prefix="embedding-encode",
+        )
+    return _executor
+
+
+def _run_tracked(func: Callable[..., T], args: tuple, submitted_at: float) -> T:
+    started = time.perf_counter()
+    wait = started - submitted_at
+    with _lock:
+        _stats.queued -= 1
+        _stats.running += 1
+        _stats.wait_seconds_total += wait
+        _stats.wait_seconds_max = max(_stats.wait_seconds_max, wait)
+    ok = False
+    try:
+        result = func(*args)
+        ok = True
+        return result
+    finally:
+        with _lock:
+            _stats.running -= 1
+            _stats.run_seconds_total += time.perf_counter() - started
+            if ok:
+                _stats.completed += 1
+            else:
+                _stats.failed += 1
+
+
+def _on_done(future: Future) -> None:
+    # Cancelado antes de começar: _run_tracked não rodou e o pedido segue contado na fila
+    if future.cancelled():
+        with _lock:
+            _stats.queued -= 1
+
+
+async def run_in_encode_executor(func: Callable[..., T], *args: Any) -> T:
+    """
+    Executa func no pool de encode.
+
+    Raises:
+        EncodeQueueFull: se já houver embedding_encode_max_pending pedidos pendentes
+    """
+    executor = get_encode_executor()
+    with _lock:
+        if _stats.queued + _stats.running >= settings.embedding_encode_max_pending:
+            _stats.rejected += 1
+            raise EncodeQueueFull(
+                f"{_stats.queued + _stats.running} encodes pendentes "
+                f"(limite {settings.embedding_encode_max_pending})"
+            )
+        _stats.submitted += 1
+        _stats.queued += 1
+        _stats.max_queued = max(_stats.max_queued, _stats.queued)
+
+    future = executor.submit(_run_tracked, func, args, time.perf_counter())
+    future.add_done_callback(_on_done)
+    return await asyncio.wrap_future(future)
+
+
+def encode_executor_stats() -> dict:
+    """Profundidade da fila, pedidos em execução, recusas e tempos médios."""
+    with _lock:
+        stats = asdict(_stats)
+    finished = stats["completed"] + stats["failed"]
+    stats["wait_ms_avg"] = stats["wait_seconds_total"] * 1000 / finished if finished else 0.0
+    stats["run_ms_avg"] = stats["run_seconds_total"] * 1000 / finished if finished else 0.0
+    stats["workers"] = max(1, settings.embedding_encode_workers)
+    stats["max_pending"] = settings.embedding_encode_max_pending
+    return stats
+
+
+def shutdown_encode_executor() -> None:
+    """Encerra o pool de encode, se criado."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,47 @@
+"""
+Operações vetoriais para similaridade de cosseno em lote.
+
+Só depende de NumPy, para poder ser usado (e testado) sem sentence-transformers.
+"""
+
+import numpy as np
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    Normaliza cada linha para norma L2 = 1 e converte para float32.
+
+    Linhas nulas continuam nulas (similaridade 0 com qualquer vetor).
+    """
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def cosine_scores(queries: np.ndarray, normalized_matrix: np.ndarray) -> np.ndarray:
+    """
+    Similaridade de cosseno (n_queries, n_linhas) entre consultas e uma matriz já normalizada.
+
+    Uma única multiplicação de matrizes; as consultas são normalizadas aqui.
+    """
+    return normalize_rows(queries) @ normalized_matrix.T
+
+
+def top_k(scores: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Os k maiores scores de cada linha, em ordem decrescente.
+
+    Returns:
+        Tupla (índices, scores), ambos com forma (n_linhas, min(k, n_colunas))
+    """
+    scores = np.atleast_2d(scores)
+    k = max(1, min(k, scores.shape[1]))
+    if k < scores.shape[1]:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    indices = np.take_along_axis(candidates, order, axis=1)
+    return indices, np.take_along_axis(scores, indices, axis=1)
@@ -0,0 +1,385 @@
+"""
+Índice vetorial para busca top-k por similaridade de cosseno.
+
+A base é uma matriz normalizada (float32) ordenada por ID, persistida em .npy e
+mapeada em memória ao carregar; vetores adicionados ou alterados depois ficam num
+delta em memória até o próximo save(), que compacta tudo. Cada save() grava uma
+versão nova (subdiretório) e troca o link "current" de uma vez, sob uma trava de
+arquivo: processos que gravam o mesmo diretório não misturam arquivos entre si. A busca padrão é exata
+(força bruta com NumPy). Com backend="hnsw" e hnswlib instalado, coleções a partir
+de hnsw_min_size usam um índice HNSW aproximado, atualizado incrementalmente.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.core.logging import log
+from app.ml.similarity import normalize_rows, top_k
+
+IDS_FILE = "ids.npy"
+VECTORS_FILE = "vectors.npy"
+HNSW_FILE = "index.hnsw"
+META_FILE = "meta.json"
+CURRENT_LINK = "current"
+LOCK_FILE = ".lock"
+VERSION_PREFIX = "v-"
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos
+    fcntl = None
+
+
+@contextlib.contextmanager
+def _directory_lock(directory: Path) -> Iterator[None]:
+    """Trava exclusiva entre processos para gravar no diretório do índice."""
+    with open(directory / LOCK_FILE, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _current_version(directory: Path) -> Path:
+    """Versão apontada por "current" (ou o próprio diretório, no formato antigo)."""
+    link = directory / CURRENT_LINK
+    return directory / os.readlink(link) if link.is_symlink() else directory
+
+
+def _load_hnswlib():
+    try:
+        import hnswlib
+    except ImportError:
+        return None
+    return hnswlib
+
+
+class VectorIndex:
+    """Vetores de artigos (ID -> vetor normalizado) com busca top-k."""
+
+    def __init__(
+        self,
+        dim: int | None = None,
+        backend: str = "numpy",
+        hnsw_min_size: int = 20000,
+        hnsw_ef_search: int = 64,
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 200,
+    ):
+        self.dim = dim
+        self.backend = backend
+        self.hnsw_min_size = hnsw_min_size
+        self.hnsw_ef_search = hnsw_ef_search
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        # Metadados livres persistidos junto (ex.: marca da última sincronização)
+        self.meta: dict[str, Any] = {}
+
+        self._base_ids = np.zeros(0, dtype=np.int64)
+        self._base_vectors = np.zeros((0, dim or 0), dtype=np.float32)
+        self._base_alive = np.zeros(0, dtype=bool)
+        self._delta: dict[int, np.ndarray] = {}
+        self._delta_cache: tuple[np.ndarray, np.ndarray] | None = None
+        self._hnsw = None
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return int(self._base_alive.sum()) + len(self._delta)
+
+    def __contains__(self, article_id: int) -> bool:
+        if article_id in self._delta:
+            return True
+        row = self._base_rows(np.asarray([article_id], dtype=np.int64))[0]
+        return bool(row >= 0 and self._base_alive[row])
+
+    @property
+    def dirty(self) -> bool:
+        """Há alterações ainda não gravadas em disco."""
+        return self._dirty
+
+    @property
+    def pending(self) -> int:
+        """Vetores no delta em memória (fora da base mapeada)."""
+        return len(self._delta)
+
+    @property
+    def uses_hnsw(self) -> bool:
+        return self._hnsw is not None
+
+    def _base_rows(self, ids: np.ndarray) -> np.ndarray:
+        """Linhas da base com os IDs dados (-1 quando ausentes)."""
+        if not len(self._base_ids):
+            return np.full(len(ids), -1, dtype=np.int64)
+        rows = np.searchsorted(self._base_ids, ids)
+        rows = np.minimum(rows, len(self._base_ids) - 1)
+        return np.where(self._base_ids[rows] == ids, rows, -1)
+
+    def _retire(self, ids: np.ndarray) -> None:
+        """Tira da base (sem reescrever o arquivo) os vetores dos IDs dados."""
+        rows = self._base_rows(ids)
+        rows = rows[rows >= 0]
+        if len(rows):
+            if not self._base_alive.flags.writeable:
+                self._base_alive = self._base_alive.copy()
+            self._base_alive[rows] = False
+
+    def add(self, ids: Sequence[int], vectors: np.ndarray) -> None:
+        """Adiciona vetores ou substitui os de IDs já indexados."""
+        if not len(ids):
+            return
+        vectors = normalize_rows(vectors)
+        if len(ids) != len(vectors):
+            raise ValueError(f"{len(ids)} IDs para {len(vectors)} vetores")
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Dimensão {vectors.shape[1]} incompatível com o índice ({self.dim})")
+
+        id_array = np.asarray(ids, dtype=np.int64)
+        with self._lock:
+            self._retire(id_array)
+            for article_id, vector in zip(id_array.tolist(), vectors, strict=True):
+                self._delta[article_id] = vector
+            self._delta_cache = None
+            self._dirty = True
+            if self._hnsw is not None:
+                self._hnsw_add(id_array, vectors)
+            else:
+                self._maybe_build_hnsw()
+
+    def remove(self, ids: Sequence[int]) -> None:
+        """Remove IDs do índice (IDs desconhecidos são ignorados)."""
+        if not len(ids):
+            return
+        id_array = np.asarray(ids, dtype=np.int64)
+        with self._lock:
+            self._retire(id_array)
+            for article_id in id_array.tolist():
+                if self._delta.pop(article_id, None) is not None:
+                    self._delta_cache = None
+                if self._hnsw is not None:
+                    # Rótulo ausente do HNSW levanta RuntimeError
+                    with contextlib.suppress(RuntimeError):
+                        self._hnsw.mark_deleted(article_id)
+            self._dirty = True
+
+    def _delta_matrix(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._delta_cache is None:
+            if self._delta:
+                ids = np.fromiter(self._delta, dtype=np.int64, count=len(self._delta))
+                self._delta_cache = (ids, np.stack(list(self._delta.values())))
+            else:
+                self._delta_cache = (
+                    np.zeros(0, dtype=np.int64),
+                    np.zeros((0, self.dim or 0), dtype=np.float32),
+                )
+        return self._delta_cache
+
+    def search(self, query: np.ndarray, k: int = 10) -> list[tuple[int, float]]:
+        """
+        Os k vetores mais próximos da consulta.
+
+        Returns:
+            Lista de (id, similaridade de cosseno), em ordem decrescente
+        """
+        return self.search_many(query, k)[0]
+
+    def search_many(self, queries: np.ndarray, k: int = 10) -> list[list[tuple[int, float]]]:
+        """Como search(), para várias consultas (n, dim) de uma vez."""
+        queries = normalize_rows(queries)
+        with self._lock:
+            k = min(k, len(self))
+            if k <= 0:
+                return [[] for _ in range(len(queries))]
+            if self.dim is not None and queries.shape[1] != self.dim:
+                raise ValueError(f"Consulta com dimensão {queries.shape[1]}, índice {self.dim}")
+
+            if self._hnsw is not None:
+                try:
+                    self._hnsw.set_ef(max(self.hnsw_ef_search, k))
+                    labels, distances = self._hnsw.knn_query(queries, k=k)
+                    # Espaço "ip": distância = 1 - produto interno
+                    return [
+                        [
+                            (int(label), float(1.0 - distance))
+                            for label, distance in zip(row_labels, row_distances, strict=True)
+                        ]
+                        for row_labels, row_distances in zip(labels, distances, strict=True)
+                    ]
+                except RuntimeError as e:
+                    log.warning(f"Busca HNSW falhou, usando força bruta: {e}")
+
+            delta_ids, delta_vectors = self._delta_matrix()
+            if len(self._base_ids):
+                base_scores = np.asarray(queries @ self._base_vectors.T, dtype=np.float32)
+                base_scores[:, ~self._base_alive] = -np.inf
+            else:
+                base_scores = np.zeros((len(queries), 0), dtype=np.float32)
+            ids = np.concatenate([self._base_ids, delta_ids])
+            scores = np.concatenate([base_scores, queries @ delta_vectors.T], axis=1)
+
+        indices, best = top_k(scores, k)
+        return [
+            [(int(ids[i]), float(score)) for i, score in zip(row, row_scores, strict=True)]
+            for row, row_scores in zip(indices, best, strict=True)
+        ]
+
+    # ------------------------------------------------------------------
+    # HNSW (opcional)
+    # ------------------------------------------------------------------
+
+    def _new_hnsw(self, capacity: int):
+        hnswlib = _load_hnswlib()
+        if hnswlib is None:
+            log.warning("hnswlib não instalado: índice vetorial usando força bruta (NumPy)")
+            self.backend = "numpy"
+            return None
+        index = hnswlib.Index(space="ip", dim=self.dim)
+        index.init_index(
+            max_elements=max(capacity, 1),
+            ef_construction=self.hnsw_ef_construction,
+            M=self.hnsw_m,
+        )
+        index.set_ef(self.hnsw_ef_search)
+        return index
+
+    def _maybe_build_hnsw(self) -> None:
+        """Constrói o HNSW quando habilitado e a coleção atinge o tamanho mínimo."""
+        if self.backend != "hnsw" or self._hnsw is not None or len(self) < self.hnsw_min_size:
+            return
+        index = self._new_hnsw(len(self) * 2)
+        if index is None:
+            return
+        alive = self._base_alive
+        if alive.any():
+            index.add_items(self._base_vectors[alive], self._base_ids[alive])
+        delta_ids, delta_vectors = self._delta_matrix()
+        if len(delta_ids):
+            index.add_items(delta_vectors, delta_ids)
+        self._hnsw = index
+        log.info(f"Índice HNSW construído com {len(self)} vetores")
+
+    def _hnsw_add(self, ids: np.ndarray, vectors: np.ndarray) -> None:
+        needed = self._hnsw.get_current_count() + len(ids)
+        if needed > self._hnsw.get_max_elements():
+            self._hnsw.resize_index(needed * 2)
+        # Rótulos existentes são atualizados (e desmarcados se estavam removidos)
+        self._hnsw.add_items(vectors, ids)
+
+    # ------------------------------------------------------------------
+    # Persistência
+    # ------------------------------------------------------------------
+
+    def save(self, directory: Path) -> None:
+        """
+        Compacta base + delta e grava em disco.
+
+        Os arquivos vão para uma versão nova; a troca do link "current" publica todos
+        de uma vez. Versões além da nova e da anterior (que leitores podem estar
+        abrindo) são removidas.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock, _directory_lock(directory):
+            alive = self._base_alive
+            delta_ids, delta_vectors = self._delta_matrix()
+            ids = np.concatenate([self._base_ids[alive], delta_ids])
+            vectors = np.concatenate(
+                [
+                    np.asarray(self._base_vectors[alive], dtype=np.float32).reshape(-1, self.dim or 0),
+                    delta_vectors.reshape(-1, self.dim or 0),
+                ]
+            )
+            order = np.argsort(ids, kind="stable")
+            ids, vectors = ids[order], np.ascontiguousarray(vectors[order])
+
+            previous = _current_version(directory)
+            version = directory / f"{VERSION_PREFIX}{uuid.uuid4().hex[:12]}"
+            version.mkdir()
+            np.save(version / IDS_FILE, ids)
+            np.save(version / VECTORS_FILE, vectors)
+            if self._hnsw is not None:
+                self._hnsw.save_index(str(version / HNSW_FILE))
+            meta = {**self.meta, "dim": self.dim, "count": len(ids)}
+            (version / META_FILE).write_text(json.dumps(meta))
+
+            link = directory / f".{CURRENT_LINK}-{version.name}"
+            os.symlink(version.name, link)
+            os.replace(link, directory / CURRENT_LINK)
+            self._prune(directory, keep={version.name, previous.name})
+
+            # Passa a servir a base recém-gravada via mmap
+            self._set_base(*self._map(version))
+            self._delta.clear()
+            self._delta_cache = None
+            self._dirty = False
+
+    @staticmethod
+    def _prune(directory: Path, keep: set[str]) -> None:
+        """Remove versões antigas e os arquivos do formato sem versões."""
+        for path in directory.glob(f"{VERSION_PREFIX}*"):
+            if path.name not in keep:
+                shutil.rmtree(path, ignore_errors=True)
+        for name in (IDS_FILE, VECTORS_FILE, HNSW_FILE, META_FILE):
+            with contextlib.suppress(FileNotFoundError):
+                (directory / name).unlink()
+
+    @staticmethod
+    def _map(directory: Path) -> tuple[np.ndarray, np.ndarray]:
+        ids = np.load(directory / IDS_FILE)
+        vectors = np.load(directory / VECTORS_FILE, mmap_mode="r")
+        return ids, vectors
+
+    def _set_base(self, ids: np.ndarray, vectors: np.ndarray) -> None:
+        self._base_ids = ids
+        self._base_vectors = vectors
+        self._base_alive = np.ones(len(ids), dtype=bool)
+
+    @classmethod
+    def load(cls, directory: Path, **options) -> "VectorIndex":
+        """
+        Carrega um índice salvo, com os vetores mapeados em memória.
+
+        Sem arquivos (ou com arquivos inválidos) retorna um índice vazio.
+        """
+        index = cls(**options)
+        directory = _current_version(directory)
+        meta_path = directory / META_FILE
+        if not meta_path.exists():
+            return index
+        try:
+            meta = json.loads(meta_path.read_text())
+            ids, vectors = cls._map(directory)
+            if vectors.ndim != 2 or len(ids) != len(vectors):
+                raise ValueError(f"ids {ids.shape} e vetores {vectors.shape} incompatíveis")
+        except (OSError, ValueError) as e:
+            log.warning(f"Índice vetorial em {directory} ignorado: {e}")
+            return cls(**options)
+
+        index.meta = {k: v for k, v in meta.items() if k not in ("dim", "count")}
+        index.dim = meta.get("dim") or vectors.shape[1]
+        index._set_base(ids, vectors)
+
+        hnsw_path = directory / HNSW_FILE
+        if index.backend == "hnsw" and hnsw_path.exists():
+            hnswlib = _load_hnswlib()
+            if hnswlib is not None:
+                hnsw = hnswlib.Index(space="ip", dim=index.dim)
+                hnsw.load_index(str(hnsw_path), max_elements=max(len(ids) * 2, 1))
+                hnsw.set_ef(index.hnsw_ef_search)
+                index._hnsw = hnsw
+        if index._hnsw is None:
+            index._maybe_build_hnsw()
+        return index
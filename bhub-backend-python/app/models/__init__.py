@@ -11,10 +11,14 @@ from app.models.analytics import (
 )
 from app.models.article import Article, SourceType
 from app.models.article_category import article_categories
+from app.models.article_embedding import ArticleEmbedding
+from app.models.article_neighbor import ArticleNeighbor
 from app.models.author import Author, article_authors
+from app.models.author_scrape_cache import AuthorScrapeCache
 from app.models.banner import Banner, BannerPosition
 from app.models.base import BaseModel, TimestampMixin
 from app.models.category import DEFAULT_CATEGORIES, Category
+from app.models.classification_cache import ClassificationCacheEntry
 from app.models.contact import ContactMessage, MessageStatus
 from app.models.feed import (
     PDF_FEED_NAME,
@@ -41,6 +45,7 @@ __all__ = [
     # Category
     "Category",
     "DEFAULT_CATEGORIES",
+    "ClassificationCacheEntry",
     # Feed
     "Feed",
     "FeedType",
@@ -52,11 +57,14 @@ __all__ = [
     # Author
     "Author",
     "article_authors",
+    "AuthorScrapeCache",
     # Article-Category Association
     "article_categories",
     # Article
     "Article",
     "SourceType",
+    "ArticleEmbedding",
+    "ArticleNeighbor",
     # PDF
     "PDFMetadata",
     "ProcessingStatus",
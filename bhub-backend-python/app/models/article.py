@@ -91,6 +91,9 @@ class Article(BaseModel):
     view_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     download_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
+    # Fingerprint do conteúdo do feed (título, resumo, autores, DOI) para detectar edições
+    content_hash: Mapped[str | None] = mapped_column(String(32), nullable=True)
+
     # Cache de tradução
     translation_cache: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
 
@@ -0,0 +1,43 @@
+"""
+Modelo para embeddings persistidos de artigos.
+"""
+
+from sqlalchemy import ForeignKey, Index, Integer, LargeBinary, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class ArticleEmbedding(BaseModel):
+    """
+    Vetor float32 do texto de um artigo (título + abstract + keywords) para um modelo.
+    Recalculado apenas quando o hash do texto muda.
+    """
+
+    __tablename__ = "article_embeddings"
+    __table_args__ = (
+        UniqueConstraint("article_id", "model_name", name="uq_article_embeddings_article_model"),
+        # Sincronização incremental do índice semântico
+        Index("ix_article_embeddings_model_updated", "model_name", "updated_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    article_id: Mapped[int] = mapped_column(
+        ForeignKey("articles.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    model_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+
+    # MD5 do texto usado para gerar o vetor
+    content_hash: Mapped[str] = mapped_column(String(32), nullable=False)
+
+    dim: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # float32 little-endian, dim * 4 bytes
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"ArticleEmbedding(article_id={self.article_id}, model={self.model_name})"
@@ -0,0 +1,46 @@
+"""
+Modelo para vizinhos pré-calculados de artigos (artigos similares).
+"""
+
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class ArticleNeighbor(BaseModel):
+    """
+    Um dos N artigos mais similares a outro, pela similaridade de cosseno dos
+    embeddings de um modelo. A lista de um artigo é lida em ordem de rank.
+    """
+
+    __tablename__ = "article_neighbors"
+    __table_args__ = (
+        UniqueConstraint(
+            "article_id", "model_name", "neighbor_id", name="uq_article_neighbors_pair"
+        ),
+        Index("ix_article_neighbors_lookup", "article_id", "model_name", "rank"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    article_id: Mapped[int] = mapped_column(
+        ForeignKey("articles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    neighbor_id: Mapped[int] = mapped_column(
+        ForeignKey("articles.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    model_name: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    # 0 = mais similar
+    rank: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"ArticleNeighbor(article_id={self.article_id}, neighbor_id={self.neighbor_id}, rank={self.rank})"
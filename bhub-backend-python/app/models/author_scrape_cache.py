@@ -0,0 +1,34 @@
+"""
+Modelo para cache de autores extraídos de páginas de artigos.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class AuthorScrapeCache(BaseModel):
+    """
+    Lista de autores obtida via scraping da página do artigo (fallback Springer/Wiley).
+    Evita buscar a mesma página novamente enquanto a entrada não expirar.
+    """
+
+    __tablename__ = "author_scrape_cache"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    # Hash SHA256 de "doi:<doi>" ou "url:<url>"
+    cache_key: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+
+    source_url: Mapped[str] = mapped_column(String(500), nullable=False)
+
+    # JSON: [{"name": "...", "role": "author"}]; lista vazia = página sem autores
+    authors: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"AuthorScrapeCache(key={self.cache_key[:8]}..., url={self.source_url})"
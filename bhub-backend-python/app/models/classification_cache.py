@@ -0,0 +1,36 @@
+"""
+Modelo para cache de resultados de classificação por IA.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class ClassificationCacheEntry(BaseModel):
+    """
+    Resultado de classificação de um texto por um provedor de IA.
+    Evita chamar o LLM/API de novo para o mesmo texto, modelo e prompt.
+    """
+
+    __tablename__ = "classification_cache"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    # Hash SHA256 de tipo + provedor + modelo + versão do prompt + texto normalizado
+    cache_key: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+
+    provider: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    # JSON: [["clinica", 0.9], ...]
+    results: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"ClassificationCacheEntry(key={self.cache_key[:8]}..., provider={self.provider})"
@@ -5,10 +5,10 @@ Modelo de feed (fonte de artigos).
 from __future__ import annotations
 
 import enum
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Float, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -36,6 +36,15 @@ class SyncFrequency(str, enum.Enum):
     MANUAL = "MANUAL"
 
 
+# Intervalo base de sincronização por frequência configurada
+SYNC_INTERVALS = {
+    SyncFrequency.HOURLY: timedelta(hours=1),
+    SyncFrequency.DAILY: timedelta(days=1),
+    SyncFrequency.WEEKLY: timedelta(weeks=1),
+    SyncFrequency.MANUAL: timedelta(days=365),  # Praticamente nunca
+}
+
+
 class Feed(BaseModel):
     """
     Fonte de artigos.
@@ -73,6 +82,17 @@ class Feed(BaseModel):
         DateTime(timezone=True), nullable=True
     )
 
+    # Agendamento adaptativo: próxima sincronização e cadência observada de publicação
+    next_sync_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+    publish_interval_minutes: Mapped[float | None] = mapped_column(Float, nullable=True)
+    idle_sync_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Validadores HTTP para requisições condicionais (If-None-Match / If-Modified-Since)
+    http_etag: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    http_last_modified: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
     # Contadores de erro
     error_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -110,17 +130,13 @@ class Feed(BaseModel):
         if self.last_sync_at is None:
             return True
 
-        from datetime import timedelta
-
         now = datetime.utcnow()
-        intervals = {
-            SyncFrequency.HOURLY: timedelta(hours=1),
-            SyncFrequency.DAILY: timedelta(days=1),
-            SyncFrequency.WEEKLY: timedelta(weeks=1),
-            SyncFrequency.MANUAL: timedelta(days=365),  # Praticamente nunca
-        }
-
-        interval = intervals.get(self.sync_frequency, timedelta(hours=1))
+
+        # Agendamento adaptativo (ver app/services/feed_scheduling.py)
+        if self.next_sync_at is not None:
+            return now >= self.next_sync_at.replace(tzinfo=None)
+
+        interval = SYNC_INTERVALS.get(self.sync_frequency, timedelta(hours=1))
         return now - self.last_sync_at.replace(tzinfo=None) > interval
 
     def __repr__(self) -> str:
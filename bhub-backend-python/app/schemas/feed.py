@@ -81,8 +81,11 @@ class FeedSyncResult(BaseSchema):
     success: bool
     new_articles: int = 0
     updated_articles: int = 0
+    not_modified: bool = False  # Servidor respondeu 304: nada foi baixado nem processado
     errors: list[str] = []
     duration_seconds: float = 0.0
+    # Segundos por etapa: fetch, parse, dedup, insert, update, commit, dispatch
+    stage_timings: dict[str, float] = {}
 
 
 class FeedSyncAllResult(BaseSchema):
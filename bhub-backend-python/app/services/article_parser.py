@@ -33,7 +33,7 @@ class ArticleParserService:
 
     def parse_entry(self, entry: dict, journal_name: str | None = None) -> dict[str, Any]:
         """Extrai dados de uma entrada de feed."""
-        return {
+        data = {
             "title": self._extract_title(entry, journal_name),
             "abstract": self._extract_abstract(entry),
             "url": self._extract_url(entry),
@@ -47,6 +47,23 @@ class ArticleParserService:
             "is_open_access": self._detect_open_access(entry),
             "pdf_url": self._extract_pdf_url(entry),
         }
+        data["content_hash"] = self.compute_content_hash(data)
+        return data
+
+    @staticmethod
+    def compute_content_hash(data: dict[str, Any]) -> str:
+        """
+        Gera fingerprint compacto do conteúdo editorial (título, resumo, autores e DOI).
+        Usado na sincronização para detectar entradas corrigidas pela revista.
+        """
+        def norm(value: str | None) -> str:
+            return " ".join((value or "").split()).lower()
+
+        authors = ";".join(norm(a.get("name")) for a in data.get("authors") or [] if a)
+        content = "\x1f".join(
+            [norm(data.get("title")), norm(data.get("abstract")), authors, norm(data.get("doi"))]
+        )
+        return hashlib.md5(content.encode()).hexdigest()
 
     def _extract_title(self, entry: dict, journal_name: str | None = None) -> str:
         """Extrai título do artigo."""
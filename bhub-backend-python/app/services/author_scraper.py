@@ -0,0 +1,232 @@
+"""
+Fallback de autores via scraping da página do artigo.
+
+Alguns publishers (Springer, Wiley) não incluem autores no feed. A busca na página
+roda em job adiado, com cache por DOI/URL e limite de concorrência e ritmo por domínio,
+para que a sincronização do feed não espere pelo scraping.
+"""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from urllib.parse import urlparse
+
+import httpx
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.http_client import BROWSER_USER_AGENT, HTTPPurpose, get_http_client
+from app.core.logging import log
+from app.models.author_scrape_cache import AuthorScrapeCache
+from app.services.feed_parsing import parse_html_authors, run_in_parse_executor
+
+# Domínios cujos feeds costumam vir sem autores
+AUTHOR_SCRAPE_DOMAINS = ("springer.com", "wiley.com")
+
+
+def scrape_domain(url: str | None) -> str | None:
+    """Retorna o host da URL se ele pertence a um domínio com fallback de scraping."""
+    if not url:
+        return None
+    try:
+        domain = urlparse(url).netloc.lower()
+    except ValueError:
+        return None
+    if any(domain == d or domain.endswith("." + d) for d in AUTHOR_SCRAPE_DOMAINS):
+        return domain
+    return None
+
+
+def needs_author_scrape(article_data: dict) -> bool:
+    """Indica se a entrada veio sem autores e a página pode completá-los."""
+    return not article_data.get("authors") and scrape_domain(article_data.get("url")) is not None
+
+
+def author_cache_key(url: str, doi: str | None = None) -> str:
+    """Chave do cache: DOI quando disponível (estável entre mirrors), senão a URL."""
+    key_data = f"doi:{doi.strip().lower()}" if doi else f"url:{url.strip()}"
+    return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+
+class DomainThrottle:
+    """
+    Concorrência (author_scrape_per_domain_concurrency) e intervalo mínimo entre
+    requisições (author_scrape_min_interval_seconds) de scraping em um domínio,
+    compartilhados por todos os jobs do processo.
+    """
+
+    def __init__(self, domain: str):
+        self.domain = domain
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._next_slot = 0.0
+
+    def _bind(self) -> None:
+        # Semaphore e relógio pertencem a um event loop: recriar se o loop mudou
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(max(1, settings.author_scrape_per_domain_concurrency))
+            self._next_slot = 0.0
+
+    async def _wait_turn(self) -> None:
+        """Garante intervalo mínimo entre requisições ao domínio."""
+        interval = settings.author_scrape_min_interval_seconds
+        if interval <= 0:
+            return
+
+        now = self._loop.time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Aguarda vaga e vez no domínio para uma requisição."""
+        self._bind()
+        async with self._slots:
+            await self._wait_turn()
+            yield
+
+
+_domain_throttles: dict[str, DomainThrottle] = {}
+
+
+def get_domain_throttle(domain: str) -> DomainThrottle:
+    """Limitador compartilhado de um domínio (todas as instâncias do serviço usam o mesmo)."""
+    throttle = _domain_throttles.get(domain)
+    if throttle is None:
+        throttle = _domain_throttles[domain] = DomainThrottle(domain)
+    return throttle
+
+
+class AuthorScrapingService:
+    """Busca autores nas páginas dos artigos com cache e limites por domínio."""
+
+    HEADERS = {"User-Agent": BROWSER_USER_AGENT}
+
+    def __init__(self, db: AsyncSession, http_client: httpx.AsyncClient | None = None):
+        self.db = db
+        self.http_client = http_client or get_http_client(HTTPPurpose.SCRAPING)
+
+    async def scrape_many(
+        self, targets: dict[int, tuple[str, str | None]]
+    ) -> dict[int, list[dict]]:
+        """
+        Obtém autores para vários artigos.
+
+        Args:
+            targets: article_id -> (url, doi)
+
+        Returns:
+            article_id -> lista de autores (apenas artigos com autores encontrados)
+        """
+        if not targets:
+            return {}
+
+        keys = {
+            article_id: author_cache_key(url, doi) for article_id, (url, doi) in targets.items()
+        }
+        cached = await self._get_cached(set(keys.values()))
+
+        # Uma busca por chave, mesmo que vários artigos compartilhem a mesma página
+        missing: dict[str, str] = {}
+        for article_id, key in keys.items():
+            if key not in cached:
+                missing.setdefault(key, targets[article_id][0])
+
+        if missing:
+            log.info(
+                f"Scraping de autores: {len(missing)} páginas a buscar, "
+                f"{len(keys) - len(missing)} artigos servidos pelo cache"
+            )
+            fetched = await asyncio.gather(*(self._fetch_authors(url) for url in missing.values()))
+            scraped = {
+                key: authors
+                for key, authors in zip(missing, fetched, strict=True)
+                # Falhas de rede não entram no cache para serem tentadas de novo
+                if authors is not None
+            }
+            await self._store(scraped, missing)
+            cached.update(scraped)
+
+        return {
+            article_id: cached[key] for article_id, key in keys.items() if cached.get(key)
+        }
+
+    async def _get_cached(self, keys: set[str]) -> dict[str, list[dict]]:
+        """Carrega entradas válidas do cache com uma única consulta."""
+        result = await self.db.execute(
+            select(AuthorScrapeCache.cache_key, AuthorScrapeCache.authors).where(
+                AuthorScrapeCache.cache_key.in_(keys),
+                AuthorScrapeCache.expires_at > datetime.now(UTC),
+            )
+        )
+        return {key: json.loads(authors) for key, authors in result.tuples().all()}
+
+    async def _store(self, scraped: dict[str, list[dict]], urls: dict[str, str]) -> None:
+        """Grava (ou substitui entradas expiradas de) resultados no cache."""
+        if not scraped:
+            return
+
+        expires_at = datetime.now(UTC) + timedelta(
+            hours=settings.author_scrape_cache_ttl_hours
+        )
+        if self.db.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        # Upsert: jobs concorrentes para a mesma URL/DOI não colidem na chave única
+        stmt = dialect_insert(AuthorScrapeCache.__table__)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["cache_key"],
+                set_={
+                    "source_url": stmt.excluded.source_url,
+                    "authors": stmt.excluded.authors,
+                    "expires_at": stmt.excluded.expires_at,
+                    "updated_at": func.now(),
+                },
+            ),
+            [
+                {
+                    "cache_key": key,
+                    "source_url": urls[key][:500],
+                    "authors": json.dumps(authors, ensure_ascii=False),
+                    "expires_at": expires_at,
+                }
+                for key, authors in scraped.items()
+            ],
+        )
+
+    async def _fetch_authors(self, url: str) -> list[dict] | None:
+        """Busca e extrai autores de uma página. Retorna None em erro transitório."""
+        domain = urlparse(url).netloc.lower()
+
+        async with get_domain_throttle(domain).slot():
+            try:
+                log.info(f"Buscando autores via scraping para: {url}")
+                response = await self.http_client.get(
+                    url, headers=self.HEADERS, follow_redirects=True
+                )
+            except httpx.HTTPError as e:
+                log.warning(f"Falha no fallback de scraping de autores ({url}): {e}")
+                return None
+
+        if response.status_code == 429 or response.status_code >= 500:
+            log.warning(f"Scraping de autores adiado ({response.status_code}): {url}")
+            return None
+        if response.status_code != 200:
+            # 404/403 etc. são estáveis: guardar lista vazia evita novas tentativas até o TTL
+            return []
+
+        authors = await run_in_parse_executor(parse_html_authors, response.text)
+        if authors:
+            log.info(f"Autores encontrados via scraping: {len(authors)}")
+        return authors or []
@@ -0,0 +1,217 @@
+"""
+Cache de resultados de classificação por IA.
+
+A chave é o SHA256 do tipo de classificação, provedor, modelo, versão do prompt e
+texto normalizado: reclassificar o mesmo texto (ressincronização de um periódico,
+artigos repetidos entre feeds, scripts de reclassificação) vira uma consulta em vez
+de uma chamada ao LLM/API. Um LRU em memória fica na frente da tabela
+classification_cache; entradas expiram após classification_cache_ttl_hours.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.logging import log
+from app.models.classification_cache import ClassificationCacheEntry
+from app.services.translation_cache_service import normalize_text
+
+# Resultado de AIManager.classify (uma categoria) ou de classify_multiple
+KIND_SINGLE = "single"
+KIND_MULTIPLE = "multiple"
+
+# (provedor, modelo, versão do prompt)
+Identity = tuple[str, str, str]
+Results = list[tuple[str, float]]
+
+# cache_key -> (expira em, epoch; provedor; resultados)
+_memory: OrderedDict[str, tuple[float, str, Results]] = OrderedDict()
+_stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0}
+
+
+def classification_cache_key(text: str, identity: Identity, kind: str = KIND_SINGLE) -> str:
+    """Chave de cache de um texto para um provedor/modelo/prompt."""
+    provider, model, prompt_version = identity
+    key_data = f"{kind}|{provider}|{model}|{prompt_version}|{normalize_text(text)}"
+    return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+
+def classification_identities(ai_manager) -> list[Identity]:
+    """Identidades dos provedores do AIManager; vazio se ele não as expõe (stubs)."""
+    identities = getattr(ai_manager, "classify_cache_identities", None)
+    return identities() if identities else []
+
+
+def _remember(key: str, expires_at: float, provider: str, results: Results) -> None:
+    _memory[key] = (expires_at, provider, results)
+    _memory.move_to_end(key)
+    while len(_memory) > max(0, settings.classification_cache_memory_size):
+        _memory.popitem(last=False)
+
+
+def _recall(key: str) -> tuple[str, Results] | None:
+    entry = _memory.get(key)
+    if entry is None:
+        return None
+    expires_at, provider, results = entry
+    if expires_at <= time.time():
+        del _memory[key]
+        return None
+    _memory.move_to_end(key)
+    return provider, results
+
+
+def classification_cache_stats() -> dict:
+    """Acertos (memória/banco), falhas, gravações e tamanho do LRU."""
+    lookups = _stats["memory_hits"] + _stats["db_hits"] + _stats["misses"]
+    hits = _stats["memory_hits"] + _stats["db_hits"]
+    return {
+        **_stats,
+        "hit_rate": hits / lookups if lookups else 0.0,
+        "memory_entries": len(_memory),
+    }
+
+
+def clear_classification_memory_cache() -> None:
+    """Esvazia o LRU em memória (a tabela é mantida)."""
+    _memory.clear()
+
+
+class ClassificationCacheService:
+    """Leitura e gravação em lote do cache de classificações."""
+
+    # Máximo de chaves por consulta IN (...)
+    BATCH_SIZE = 500
+
+    def __init__(self, db: AsyncSession | None):
+        # Sem sessão, apenas o LRU em memória é usado
+        self.db = db
+
+    async def get_many(
+        self,
+        texts: Sequence[str],
+        identities: Sequence[Identity],
+        kind: str = KIND_SINGLE,
+    ) -> dict[int, tuple[str, Results]]:
+        """
+        Resultados em cache para cada texto, preferindo o provedor de maior
+        prioridade (ordem de identities).
+
+        Returns:
+            índice do texto -> (provedor, resultados) dos textos encontrados
+        """
+        if not texts or not identities:
+            return {}
+
+        keys = [
+            [classification_cache_key(text, identity, kind) for identity in identities]
+            for text in texts
+        ]
+        found: dict[str, tuple[str, Results]] = {}
+        missing: list[str] = []
+        for text_keys in keys:
+            for key in text_keys:
+                cached = _recall(key)
+                if cached is not None:
+                    found[key] = cached
+                else:
+                    missing.append(key)
+
+        memory_keys = set(found)
+        if missing and self.db is not None:
+            try:
+                # Savepoint: uma falha aqui não aborta a transação de quem chamou (PostgreSQL)
+                async with self.db.begin_nested():
+                    found.update(await self._fetch(missing))
+            except Exception as e:
+                log.warning(f"Falha ao ler cache de classificações: {e}")
+
+        results: dict[int, tuple[str, Results]] = {}
+        for i, text_keys in enumerate(keys):
+            key = next((key for key in text_keys if key in found), None)
+            if key is None:
+                _stats["misses"] += 1
+                continue
+            _stats["memory_hits" if key in memory_keys else "db_hits"] += 1
+            results[i] = found[key]
+        return results
+
+    async def _fetch(self, keys: list[str]) -> dict[str, tuple[str, Results]]:
+        """Entradas válidas da tabela, copiadas para o LRU."""
+        found: dict[str, tuple[str, Results]] = {}
+        for i in range(0, len(keys), self.BATCH_SIZE):
+            result = await self.db.execute(
+                select(
+                    ClassificationCacheEntry.cache_key,
+                    ClassificationCacheEntry.provider,
+                    ClassificationCacheEntry.results,
+                    ClassificationCacheEntry.expires_at,
+                ).where(
+                    ClassificationCacheEntry.cache_key.in_(keys[i : i + self.BATCH_SIZE]),
+                    ClassificationCacheEntry.expires_at > datetime.now(UTC),
+                )
+            )
+            for key, provider, raw, expires_at in result.tuples().all():
+                results = [(slug, float(confidence)) for slug, confidence in json.loads(raw)]
+                if expires_at.tzinfo is None:
+                    expires_at = expires_at.replace(tzinfo=UTC)
+                _remember(key, expires_at.timestamp(), provider, results)
+                found[key] = (provider, results)
+        return found
+
+    async def set_many(
+        self,
+        entries: Sequence[tuple[str, Identity, Results]],
+        kind: str = KIND_SINGLE,
+    ) -> None:
+        """Grava (texto, identidade do provedor que respondeu, resultados). O commit fica com o chamador."""
+        if not entries:
+            return
+
+        expires_at = datetime.now(UTC) + timedelta(hours=settings.classification_cache_ttl_hours)
+        rows = {}
+        for text, identity, results in entries:
+            key = classification_cache_key(text, identity, kind)
+            _remember(key, expires_at.timestamp(), identity[0], list(results))
+            rows[key] = {
+                "cache_key": key,
+                "provider": identity[0],
+                "model": identity[1][:100],
+                "results": json.dumps([[slug, confidence] for slug, confidence in results]),
+                "expires_at": expires_at,
+            }
+        _stats["stores"] += len(rows)
+
+        if self.db is None:
+            return
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(ClassificationCacheEntry.__table__)
+        try:
+            async with self.db.begin_nested():
+                await self.db.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["cache_key"],
+                        set_={
+                            "provider": stmt.excluded.provider,
+                            "model": stmt.excluded.model,
+                            "results": stmt.excluded.results,
+                            "expires_at": stmt.excluded.expires_at,
+                            "updated_at": func.now(),
+                        },
+                    ),
+                    list(rows.values()),
+                )
+        except Exception as e:
+            log.warning(f"Falha ao gravar cache de classificações: {e}")
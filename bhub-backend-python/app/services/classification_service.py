@@ -6,7 +6,9 @@ e criação automática de categorias quando necessário.
 import re
 import unicodedata
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import insert as sa_insert
+from sqlalchemy import select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +16,13 @@ from app.core.logging import log
 from app.interfaces.services import IAIManager
 from app.models import Article, Category, article_categories
 from app.models.category import DEFAULT_CATEGORIES
+from app.services.classification_cache import (
+    KIND_MULTIPLE,
+    ClassificationCacheService,
+    classification_identities,
+)
+from app.services.embedding_store import EmbeddingStore, article_embedding_text
+from app.services.semantic_index import add_to_semantic_index
 
 
 class ClassificationService:
@@ -23,34 +32,297 @@ class ClassificationService:
         self.db = db
         self.ai_manager = ai_manager
 
+    async def _classify_with_ai(self, text: str) -> tuple[str, float, object] | None:
+        """Tenta o AIManager; None quando nenhum provedor respondeu."""
+        if not self.ai_manager:
+            return None
+        try:
+            return self._ai_answer(await self.ai_manager.classify(text))
+        except Exception as e:
+            log.warning(f"Erro na classificação via AIManager: {e}")
+        return None
+
+    @staticmethod
+    def _ai_answer(result: tuple) -> tuple[str, float, object] | None:
+        """(categoria, confiança, provedor) de uma resposta do AIManager; None se nenhum respondeu."""
+        category_slug = result[0]
+        confidence = result[1]
+        provider = result[2] if len(result) >= 3 else None
+        answered = len(result) < 3 or provider is not None
+        if category_slug and answered:
+            return category_slug, confidence, provider
+        return None
+
+    async def _classify_many_with_ai(self, texts: list[str]) -> list[tuple[str, float, object] | None]:
+        """Vários textos pelo AIManager, em lote quando ele oferece classify_batch."""
+        if not texts:
+            return []
+        classify_batch = getattr(self.ai_manager, "classify_batch", None)
+        if classify_batch is not None and len(texts) > 1:
+            try:
+                return [self._ai_answer(result) for result in await classify_batch(texts)]
+            except Exception as e:
+                log.warning(f"Erro na classificação em lote via AIManager: {e}")
+        return [await self._classify_with_ai(text) for text in texts]
+
+    async def _classify_with_ai_cached(self, texts: list[str]) -> list[tuple[str, float] | None]:
+        """
+        Classificação via AIManager com cache: textos já classificados pelo mesmo
+        provedor/modelo/prompt não chamam a IA de novo.
+        """
+        results: list[tuple[str, float] | None] = [None] * len(texts)
+        if not self.ai_manager:
+            return results
+
+        cache = ClassificationCacheService(self.db)
+        identities = classification_identities(self.ai_manager)
+        for i, (_, cached) in (await cache.get_many(texts, identities)).items():
+            results[i] = cached[0]
+
+        by_provider = {identity[0]: identity for identity in identities}
+        missing = [i for i, result in enumerate(results) if result is None]
+        answers = await self._classify_many_with_ai([texts[i] for i in missing])
+        new_entries = []
+        for i, answer in zip(missing, answers, strict=True):
+            if answer is None:
+                continue
+            category_slug, confidence, provider = answer
+            results[i] = (category_slug, confidence)
+            identity = by_provider.get(getattr(provider, "value", provider))
+            # Confiança 0 indica resposta inválida do provedor: não fica no cache
+            if identity and confidence > 0:
+                new_entries.append((texts[i], identity, [results[i]]))
+        await cache.set_many(new_entries)
+        return results
+
     async def classify(self, text: str) -> tuple[str, float]:
         """Classifica texto com IA configurada e fallback local/heurístico."""
+        [result] = await self.classify_batch([text])
+        return result
+
+    async def classify_batch(
+        self,
+        texts: list[str],
+        embeddings: np.ndarray | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Classifica textos em lote preservando fallback por item.
+
+        Os textos sem resposta do AIManager passam juntos pelo EmbeddingClassifier
+        (um encode em lote, ou os embeddings fornecidos alinhados com texts); o que
+        ainda ficar sem categoria usa a heurística.
+        """
+        results = await self._classify_with_ai_cached(texts)
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            local = await self._classify_locally(
+                [texts[i] for i in pending],
+                embeddings[pending] if embeddings is not None else None,
+            )
+            for i, result in zip(pending, local, strict=True):
+                results[i] = result
+
+        return [result or ("outros", 0.0) for result in results]
+
+    async def _classify_locally(
+        self,
+        texts: list[str],
+        embeddings: np.ndarray | None = None,
+    ) -> list[tuple[str, float] | None]:
+        """Fallback sem IA: EmbeddingClassifier em lote e, para o que sobrar, heurística."""
+        from app.ml import EmbeddingClassifier, HeuristicClassifier
+
+        results: list[tuple[str, float] | None] = [None] * len(texts)
+        try:
+            if EmbeddingClassifier and EmbeddingClassifier.is_ready():
+                embedded = await EmbeddingClassifier.classify_batch(texts, embeddings=embeddings)
+                for i, (category_slug, confidence) in enumerate(embedded):
+                    if category_slug != "outros" or confidence > 0:
+                        results[i] = (category_slug, confidence)
+        except Exception as e:
+            # Ex.: pool de encode saturado ou serviço de embeddings fora do ar
+            log.warning(f"Classificação por embeddings indisponível: {e}")
+
+        try:
+            if HeuristicClassifier:
+                for i, text in enumerate(texts):
+                    if results[i] is None:
+                        results[i] = HeuristicClassifier.classify(text)
+        except Exception as e:
+            log.warning(f"Fallback local de classificação falhou: {e}")
+
+        return results
+
+    async def classify_batch_multiple(
+        self,
+        texts: list[str],
+        embeddings: np.ndarray | None = None,
+        min_confidence: float = 0.3,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Classificação multi-rótulo em lote, com a mesma ordem de fallback de
+        classify_with_multiple_categories.
+
+        Resposta da IA com confiança mínima vale como categoria única; os demais textos
+        tentam o LLM local (classify_multiple) e depois as top-k categorias por embeddings,
+        num único cálculo em lote. O que sobrar usa o fallback de classify_batch.
+
+        Returns:
+            Uma lista (slug, confiança) por texto, com a categoria principal primeiro
+        """
+        answers = await self._classify_with_ai_cached(texts)
+        results: list[list[tuple[str, float]] | None] = [
+            [answer] if answer and answer[1] >= min_confidence else None for answer in answers
+        ]
+
         if self.ai_manager:
+            for i, result in enumerate(results):
+                if result is None:
+                    results[i] = await self._classify_multiple_with_local_llm(
+                        self.db, self.ai_manager, texts[i]
+                    )
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
             try:
-                result = await self.ai_manager.classify(text)
-                category_slug = result[0]
-                confidence = result[1]
-                if category_slug:
-                    return category_slug, confidence
+                from app.ml import EmbeddingClassifier
+
+                if EmbeddingClassifier and EmbeddingClassifier.is_ready():
+                    top = await EmbeddingClassifier.classify_top_k(
+                        [texts[i] for i in pending],
+                        k=3,
+                        threshold=min_confidence,
+                        embeddings=embeddings[pending] if embeddings is not None else None,
+                    )
+                    for i, categories in zip(pending, top, strict=True):
+                        results[i] = categories or None
             except Exception as e:
-                log.warning(f"Erro na classificação via AIManager: {e}")
+                log.debug(f"Classificação múltipla por embeddings falhou: {e}")
+
+        # Sem categoria acima do mínimo: resposta fraca da IA ou fallback local
+        pending = [i for i, result in enumerate(results) if result is None]
+        unanswered = [i for i in pending if answers[i] is None]
+        if unanswered:
+            local = await self._classify_locally(
+                [texts[i] for i in unanswered],
+                embeddings[unanswered] if embeddings is not None else None,
+            )
+            for i, result in zip(unanswered, local, strict=True):
+                answers[i] = result
+        for i in pending:
+            results[i] = [answers[i] or ("outros", 0.0)]
 
-        try:
-            from app.ml import EmbeddingClassifier, HeuristicClassifier
+        return results
 
-            if EmbeddingClassifier.is_initialized():
-                category_slug, confidence = await EmbeddingClassifier.classify(text)
-                if category_slug != "outros" or confidence > 0:
-                    return category_slug, confidence
+    async def classify_articles(self, article_ids: list[int]) -> dict[int, tuple[str, float]]:
+        """
+        Classifica vários artigos (multi-rótulo) e persiste as categorias em lote.
 
-            return HeuristicClassifier.classify(text)
-        except Exception as e:
-            log.warning(f"Fallback local de classificação falhou: {e}")
-            return "outros", 0.0
+        Uma consulta para os artigos, uma classificação em lote, um INSERT das
+        associações e um UPDATE em lote dos artigos. O commit fica com o chamador.
 
-    async def classify_batch(self, texts: list[str]) -> list[tuple[str, float]]:
-        """Classifica textos em lote preservando fallback por item."""
-        return [await self.classify(text) for text in texts]
+        Returns:
+            article_id -> (slug, confiança) da categoria principal dos artigos encontrados
+        """
+        if not article_ids:
+            return {}
+
+        from app.ml import ImpactRatingService
+
+        result = await self.db.execute(
+            select(
+                Article.id,
+                Article.title,
+                Article.abstract,
+                Article.keywords,
+                Article.journal_name,
+                Article.doi,
+                Article.impact_score,
+            ).where(Article.id.in_(article_ids))
+        )
+        rows = result.all()
+        if not rows:
+            return {}
+
+        texts = [article_embedding_text(row.title, row.abstract, row.keywords) for row in rows]
+
+        # Vetores persistidos: só artigos novos ou com texto alterado passam pelo encoder
+        embeddings = None
+        store = EmbeddingStore(self.db)
+        ids, vectors = await store.ensure([(row.id, text) for row, text in zip(rows, texts, strict=True)])
+        if len(ids) == len(rows):
+            embeddings = vectors
+        add_to_semantic_index(ids, vectors)
+        classified = await self.classify_batch_multiple(texts, embeddings)
+
+        # impact_score ainda no valor padrão é calculado junto
+        impact_scores = await ImpactRatingService.calculate_impact_batch(
+            [
+                {
+                    "title": row.title,
+                    "abstract": row.abstract,
+                    "keywords": row.keywords,
+                    "journal_name": row.journal_name,
+                    "has_doi": bool(row.doi),
+                }
+                for row in rows
+            ]
+        )
+
+        categories: dict[str, Category] = {}
+        for category_slug, _ in (item for result in classified for item in result):
+            if category_slug not in categories:
+                categories[category_slug] = await self.get_or_create_category(
+                    self.db, category_slug, auto_created=True
+                )
+
+        ids = [row.id for row in rows]
+        existing = await self.db.execute(
+            select(article_categories.c.article_id, article_categories.c.category_id).where(
+                article_categories.c.article_id.in_(ids)
+            )
+        )
+        linked = set(existing.tuples().all())
+
+        default_category_names = {cat["name"] for cat in DEFAULT_CATEGORIES}
+        links = []
+        updates = []
+        for row, article_categories_found, impact_score in zip(
+            rows, classified, impact_scores, strict=True
+        ):
+            for position, (category_slug, confidence) in enumerate(article_categories_found):
+                category = categories[category_slug]
+                if (row.id, category.id) in linked:
+                    continue
+                linked.add((row.id, category.id))
+                links.append({
+                    "article_id": row.id,
+                    "category_id": category.id,
+                    "confidence": confidence,
+                    "is_primary": position == 0,
+                    "auto_created": category.name not in default_category_names,
+                })
+            primary_slug, primary_confidence = article_categories_found[0]
+            needs_impact = row.impact_score is None or abs(row.impact_score - 5.0) < 0.01
+            updates.append({
+                "id": row.id,
+                "category_id": categories[primary_slug].id,
+                "classification_confidence": primary_confidence,
+                "impact_score": impact_score if needs_impact else row.impact_score,
+            })
+
+        if links:
+            await self.db.execute(sa_insert(article_categories), links)
+        await self.db.execute(update(Article), updates)
+        # Vetores gravados antes da classificação por IA: marca final para a sincronização
+        # incremental do índice semântico em outros processos
+        await store.stamp_written()
+
+        log.info(f"Lote de {len(rows)} artigos classificado")
+        return {
+            row.id: result[0] for row, result in zip(rows, classified, strict=True)
+        }
 
     async def classify_article(self, article_id: int) -> tuple[str, float] | None:
         """Classifica um artigo e persiste a categoria principal."""
@@ -148,6 +420,7 @@ class ClassificationService:
         text: str,
         ai_manager,
         min_confidence: float = 0.3,
+        embedding: np.ndarray | None = None,
     ) -> list[tuple[str, float]]:
         """
         Classifica texto retornando múltiplas categorias com suas confianças.
@@ -157,36 +430,96 @@ class ClassificationService:
             text: Texto para classificar
             ai_manager: Instância do AIManager
             min_confidence: Confiança mínima para incluir categoria
+            embedding: Vetor já armazenado do artigo (evita novo encode no fallback)
 
         Returns:
             Lista de tuplas (category_slug, confidence)
         """
+        cache = ClassificationCacheService(db)
+        identities = classification_identities(ai_manager)
+        by_provider = {identity[0]: identity for identity in identities}
+
         # Primeiro, tentar classificação via AIManager (prioriza DeepSeek/APIs externas)
-        try:
-            category_slug, confidence, provider = await ai_manager.classify(text)
-            if category_slug and confidence >= min_confidence:
-                log.debug(f"Classificação via {provider}: {category_slug} ({confidence:.2f})")
+        cached = await cache.get_many([text], identities)
+        if cached:
+            provider, [(category_slug, confidence)] = cached[0]
+            if confidence >= min_confidence:
+                log.debug(f"Classificação em cache ({provider}): {category_slug} ({confidence:.2f})")
                 return [(category_slug, confidence)]
-        except Exception as e:
-            log.warning(f"Erro na classificação via AIManager: {e}")
+        else:
+            try:
+                category_slug, confidence, provider = await ai_manager.classify(text)
+                identity = by_provider.get(getattr(provider, "value", provider))
+                if identity and category_slug and confidence > 0:
+                    await cache.set_many([(text, identity, [(category_slug, confidence)])])
+                if category_slug and confidence >= min_confidence:
+                    log.debug(f"Classificação via {provider}: {category_slug} ({confidence:.2f})")
+                    return [(category_slug, confidence)]
+            except Exception as e:
+                log.warning(f"Erro na classificação via AIManager: {e}")
 
         # Fallback: Tentar classificação múltipla com LLM local (se disponível)
+        categories = await ClassificationService._classify_multiple_with_local_llm(
+            db, ai_manager, text
+        )
+        if categories:
+            return categories
+
+        # Fallback: top-k categorias por similaridade de embeddings
+        try:
+            from app.ml import EmbeddingClassifier
+
+            if EmbeddingClassifier and EmbeddingClassifier.is_ready():
+                [categories] = await EmbeddingClassifier.classify_top_k(
+                    [text],
+                    k=3,
+                    threshold=min_confidence,
+                    embeddings=embedding[None, :] if embedding is not None else None,
+                )
+                if categories:
+                    log.debug(f"Classificação múltipla por embeddings: {categories}")
+                    return categories
+        except Exception as e:
+            log.debug(f"Classificação múltipla por embeddings falhou: {e}")
+
+        # Se não encontrou nenhuma categoria, retornar "outros" com baixa confiança
+        return [("outros", 0.3)]
+
+    @staticmethod
+    async def _classify_multiple_with_local_llm(
+        db, ai_manager, text: str
+    ) -> list[tuple[str, float]] | None:
+        """Categorias do LLM local (classify_multiple), com cache; None se indisponível."""
         try:
             from app.ai.local_llm_service import LocalLLMService
             from app.ai.manager import AIProvider
 
-            if AIProvider.LOCAL_LLM in ai_manager.providers:
-                provider = ai_manager.providers[AIProvider.LOCAL_LLM]
-                if isinstance(provider, LocalLLMService):
-                    categories = await provider.classify_multiple(text)
-                    if categories and categories != [("outros", 0.0)]:
-                        log.debug(f"Classificação múltipla LLM local: {categories}")
-                        return categories
+            provider = getattr(ai_manager, "providers", {}).get(AIProvider.LOCAL_LLM)
+            if not isinstance(provider, LocalLLMService):
+                return None
+
+            cache = ClassificationCacheService(db)
+            identity = next(
+                (
+                    identity
+                    for identity in classification_identities(ai_manager)
+                    if identity[0] == AIProvider.LOCAL_LLM.value
+                ),
+                None,
+            )
+            cached = await cache.get_many([text], [identity], KIND_MULTIPLE) if identity else {}
+            if cached:
+                categories = cached[0][1]
+            else:
+                categories = await provider.classify_multiple(text)
+                if identity and categories and categories != [("outros", 0.0)]:
+                    await cache.set_many([(text, identity, categories)], KIND_MULTIPLE)
+            if categories and categories != [("outros", 0.0)]:
+                log.debug(f"Classificação múltipla LLM local: {categories}")
+                return categories
         except Exception as e:
             log.debug(f"Classificação múltipla LLM local falhou: {e}")
-
-        # Se não encontrou nenhuma categoria, retornar "outros" com baixa confiança
-        return [("outros", 0.3)]
+        return None
 
     @staticmethod
     async def assign_categories_to_article(
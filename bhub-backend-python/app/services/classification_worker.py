@@ -0,0 +1,145 @@
+"""
+Worker de classificação com micro-batching.
+
+Os IDs de artigos enfileirados são agrupados em lotes de até
+settings.classification_batch_size, esperando no máximo
+settings.classification_batch_max_wait_seconds pelo lote encher. Cada lote é
+classificado com ClassificationService.classify_articles (um encode em lote e
+escrita em lote) em uma sessão própria.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from app.config import settings
+from app.core.logging import log
+
+
+async def classify_articles_batch(article_ids: list[int]) -> None:
+    """Classifica um lote de artigos (e atualiza os similares) em uma sessão própria."""
+    from app.ai import get_ai_manager
+    from app.database import get_session_context
+    from app.services.classification_service import ClassificationService
+    from app.services.similar_articles import refresh_similar_articles
+
+    async with get_session_context() as db:
+        service = ClassificationService(db=db, ai_manager=get_ai_manager())
+        classified = await service.classify_articles(article_ids)
+        await refresh_similar_articles(db, list(classified))
+        await db.commit()
+
+
+class ClassificationBatcher:
+    """Fila de IDs de artigos consumida em micro-lotes por um único worker."""
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_wait_seconds: float,
+        maxsize: int = 0,
+        process_batch: Callable[[list[int]], Awaitable[None]] = classify_articles_batch,
+    ) -> None:
+        self.batch_size = max(1, batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_seconds)
+        self.maxsize = max(0, maxsize)
+        self.process_batch = process_batch
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_started(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        # Fila e worker pertencem ao loop que os criou (scripts/testes criam loops novos)
+        if self._queue is None or loop is not self._loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._task = loop.create_task(self._run(self._queue), name="classification-batcher")
+        return self._queue
+
+    async def submit(self, article_ids: list[int]) -> None:
+        """Enfileira artigos; aguarda se a fila estiver cheia."""
+        queue = self._ensure_started()
+        for article_id in article_ids:
+            await queue.put(article_id)
+
+    async def _next_batch(self, queue: asyncio.Queue) -> list[int]:
+        """Aguarda o primeiro ID e junta outros até encher o lote ou o prazo acabar."""
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_seconds
+        while len(batch) < self.batch_size:
+            # Tudo que já está na fila entra sem esperar
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch = await self._next_batch(queue)
+            try:
+                await self.process_batch(list(dict.fromkeys(batch)))
+            except Exception as e:
+                log.error(f"Erro ao classificar lote de {len(batch)} artigos: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def join(self) -> None:
+        """Aguarda a classificação de tudo que já foi enfileirado."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Drena a fila (até timeout) e encerra o worker."""
+        if self._queue is None:
+            return
+        same_loop = self._loop is asyncio.get_running_loop()
+        if same_loop:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except TimeoutError:
+                log.warning(
+                    f"Worker de classificação encerrado com {self._queue.qsize()} artigos pendentes"
+                )
+        if self._task is not None:
+            self._task.cancel()
+            if same_loop:
+                await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._queue = None
+        self._loop = None
+
+
+_batcher: ClassificationBatcher | None = None
+
+
+def get_classification_batcher() -> ClassificationBatcher:
+    """Retorna o worker de classificação compartilhado, criado sob demanda."""
+    global _batcher
+    if _batcher is None:
+        _batcher = ClassificationBatcher(
+            batch_size=settings.classification_batch_size,
+            max_wait_seconds=settings.classification_batch_max_wait_seconds,
+            maxsize=settings.local_task_queue_size,
+        )
+    return _batcher
+
+
+async def close_classification_batcher() -> None:
+    """Drena e encerra o worker de classificação, se tiver sido criado."""
+    global _batcher
+    if _batcher is None:
+        return
+    await _batcher.close()
+    _batcher = None
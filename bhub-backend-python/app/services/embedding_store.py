@@ -0,0 +1,292 @@
+"""
+Armazenamento persistente de embeddings de artigos.
+
+Os vetores float32 ficam em article_embeddings, por (artigo, modelo), junto com o
+hash do texto que os gerou: só são recalculados quando título, abstract ou
+keywords mudam. Leituras em lote retornam uma matriz NumPy contígua.
+"""
+
+import hashlib
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.logging import log
+from app.models import Article, ArticleEmbedding
+
+Encoder = Callable[[list[str]], Awaitable[np.ndarray]]
+
+
+def article_embedding_text(
+    title: str | None,
+    abstract: str | None = None,
+    keywords: str | None = None,
+) -> str:
+    """Texto de um artigo usado para gerar o embedding (o mesmo da classificação)."""
+    return " ".join(filter(None, [title, abstract, keywords]))
+
+
+def embedding_content_hash(text: str) -> str:
+    """Hash MD5 do texto que gerou o vetor."""
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def default_encoder() -> Encoder | None:
+    """Encoder do EmbeddingClassifier, se o modelo estiver carregado."""
+    try:
+        from app.ml import EmbeddingClassifier
+    except ImportError:
+        return None
+    if EmbeddingClassifier and EmbeddingClassifier.is_initialized():
+        return EmbeddingClassifier.encode_texts
+    return None
+
+
+class EmbeddingStore:
+    """Leitura e atualização incremental dos embeddings de artigos."""
+
+    # Máximo de IDs por consulta IN (...)
+    BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        model_name: str | None = None,
+        encoder: Encoder | None = None,
+    ):
+        self.db = db
+        self.model_name = model_name or settings.embedding_model_key
+        self.encoder = encoder
+        # Artigos cujos vetores esta instância gravou (ver stamp_written)
+        self._written: set[int] = set()
+
+    def _clock(self):
+        # Horário do banco no momento do comando: now() do PostgreSQL é o início da transação
+        if self.db.get_bind().dialect.name == "postgresql":
+            return func.clock_timestamp()
+        return func.now()
+
+    @staticmethod
+    def _to_matrix(blobs: Sequence[bytes], dim: int) -> np.ndarray:
+        """Junta os vetores serializados numa matriz (n, dim) float32 contígua."""
+        if not blobs:
+            return np.zeros((0, dim), dtype=np.float32)
+        return np.frombuffer(b"".join(blobs), dtype="<f4").reshape(len(blobs), dim).copy()
+
+    async def _fetch_rows(self, article_ids: Sequence[int]) -> dict[int, tuple[str, int, bytes]]:
+        """article_id -> (content_hash, dim, vector) dos vetores armazenados."""
+        rows: dict[int, tuple[str, int, bytes]] = {}
+        unique_ids = list(dict.fromkeys(article_ids))
+        for i in range(0, len(unique_ids), self.BATCH_SIZE):
+            result = await self.db.execute(
+                select(
+                    ArticleEmbedding.article_id,
+                    ArticleEmbedding.content_hash,
+                    ArticleEmbedding.dim,
+                    ArticleEmbedding.vector,
+                ).where(
+                    ArticleEmbedding.model_name == self.model_name,
+                    ArticleEmbedding.article_id.in_(unique_ids[i : i + self.BATCH_SIZE]),
+                )
+            )
+            for article_id, content_hash, dim, vector in result.tuples().all():
+                rows[article_id] = (content_hash, dim, vector)
+        return rows
+
+    async def get_many(self, article_ids: Sequence[int]) -> tuple[list[int], np.ndarray]:
+        """
+        Vetores armazenados dos artigos, na ordem pedida.
+
+        Returns:
+            Tupla (ids encontrados, matriz (len(ids), dim))
+        """
+        rows = await self._fetch_rows(article_ids)
+        found = [article_id for article_id in dict.fromkeys(article_ids) if article_id in rows]
+        if not found:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        dim = rows[found[0]][1]
+        return found, self._to_matrix([rows[article_id][2] for article_id in found], dim)
+
+    async def all_vectors(self, after_id: int = 0) -> tuple[list[int], np.ndarray]:
+        """Todos os vetores do modelo (opcionalmente só article_id > after_id), por article_id."""
+        result = await self.db.execute(
+            select(ArticleEmbedding.article_id, ArticleEmbedding.dim, ArticleEmbedding.vector)
+            .where(
+                ArticleEmbedding.model_name == self.model_name,
+                ArticleEmbedding.article_id > after_id,
+            )
+            .order_by(ArticleEmbedding.article_id)
+        )
+        rows = result.tuples().all()
+        if not rows:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        return [row[0] for row in rows], self._to_matrix([row[2] for row in rows], rows[0][1])
+
+    async def changed_since(
+        self, since: datetime | None = None
+    ) -> tuple[list[int], np.ndarray, datetime | None]:
+        """
+        Vetores do modelo gravados ou atualizados a partir de since (todos se None).
+
+        updated_at só fica visível no commit de quem gravou: o chamador relê uma
+        janela (vector_index_sync_margin_seconds) antes da última marca.
+
+        Returns:
+            Tupla (ids, matriz (len(ids), dim), maior updated_at lido)
+        """
+        stmt = select(
+            ArticleEmbedding.article_id,
+            ArticleEmbedding.dim,
+            ArticleEmbedding.vector,
+            ArticleEmbedding.updated_at,
+        ).where(ArticleEmbedding.model_name == self.model_name)
+        if since is not None:
+            stmt = stmt.where(ArticleEmbedding.updated_at >= since)
+        result = await self.db.execute(stmt.order_by(ArticleEmbedding.article_id))
+        rows = result.tuples().all()
+        if not rows:
+            return [], np.zeros((0, 0), dtype=np.float32), None
+        return (
+            [row[0] for row in rows],
+            self._to_matrix([row[2] for row in rows], rows[0][1]),
+            max(row[3] for row in rows),
+        )
+
+    async def ensure(
+        self, items: Sequence[tuple[int, str]]
+    ) -> tuple[list[int], np.ndarray]:
+        """
+        Garante vetores atualizados para (article_id, texto), calculando só os
+        ausentes ou cujo texto mudou.
+
+        Sem encoder disponível, retorna apenas os vetores já atualizados.
+
+        Returns:
+            Tupla (ids com vetor, na ordem de items; matriz (len(ids), dim))
+        """
+        items = list(dict(items).items())
+        if not items:
+            return [], np.zeros((0, 0), dtype=np.float32)
+
+        hashes = {article_id: embedding_content_hash(text) for article_id, text in items}
+        rows = await self._fetch_rows([article_id for article_id, _ in items])
+        vectors: dict[int, np.ndarray] = {
+            article_id: np.frombuffer(row[2], dtype="<f4")
+            for article_id, row in rows.items()
+            if row[0] == hashes[article_id]
+        }
+
+        stale = [(article_id, text) for article_id, text in items if article_id not in vectors]
+        encoder = self.encoder or default_encoder()
+        encoded = None
+        if stale and encoder is not None:
+            try:
+                encoded = np.asarray(await encoder([text for _, text in stale]), dtype=np.float32)
+            except Exception as e:
+                # Ex.: serviço de embeddings fora do ar; segue com os vetores já gravados
+                log.warning(f"Falha ao calcular embeddings: {e}")
+        if encoded is not None:
+            await self.upsert(
+                [
+                    (article_id, hashes[article_id], vector)
+                    for (article_id, _), vector in zip(stale, encoded, strict=True)
+                ]
+            )
+            for (article_id, _), vector in zip(stale, encoded, strict=True):
+                vectors[article_id] = vector
+            log.debug(f"Embeddings calculados: {len(stale)} de {len(items)} artigos")
+
+        found = [article_id for article_id, _ in items if article_id in vectors]
+        if not found:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        return found, np.ascontiguousarray(
+            np.stack([vectors[article_id] for article_id in found]), dtype=np.float32
+        )
+
+    async def ensure_for_articles(self, article_ids: Sequence[int]) -> tuple[list[int], np.ndarray]:
+        """Como ensure(), lendo título/abstract/keywords dos artigos no banco."""
+        items: list[tuple[int, str]] = []
+        unique_ids = list(dict.fromkeys(article_ids))
+        for i in range(0, len(unique_ids), self.BATCH_SIZE):
+            result = await self.db.execute(
+                select(Article.id, Article.title, Article.abstract, Article.keywords).where(
+                    Article.id.in_(unique_ids[i : i + self.BATCH_SIZE])
+                )
+            )
+            items.extend(
+                (article_id, article_embedding_text(title, abstract, keywords))
+                for article_id, title, abstract, keywords in result.tuples().all()
+            )
+        order = {article_id: i for i, article_id in enumerate(unique_ids)}
+        items.sort(key=lambda item: order[item[0]])
+        return await self.ensure(items)
+
+    async def upsert(self, rows: Sequence[tuple[int, str, np.ndarray]]) -> None:
+        """Grava (article_id, content_hash, vetor), substituindo o vetor anterior do modelo."""
+        if not rows:
+            return
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(ArticleEmbedding.__table__).values(updated_at=self._clock())
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["article_id", "model_name"],
+                set_={
+                    "content_hash": stmt.excluded.content_hash,
+                    "dim": stmt.excluded.dim,
+                    "vector": stmt.excluded.vector,
+                    "updated_at": self._clock(),
+                },
+            ),
+            [
+                {
+                    "article_id": article_id,
+                    "model_name": self.model_name,
+                    "content_hash": content_hash,
+                    "dim": int(np.asarray(vector).shape[-1]),
+                    "vector": np.asarray(vector, dtype="<f4").tobytes(),
+                }
+                for article_id, content_hash, vector in rows
+            ],
+        )
+        self._written.update(article_id for article_id, _, _ in rows)
+
+    async def stamp_written(self) -> None:
+        """
+        Remarca updated_at dos vetores gravados por esta instância com o horário atual.
+
+        Chamado logo antes do commit quando a transação fez trabalho demorado depois
+        de gravar os vetores (ex.: classificação por IA): sem isso, o updated_at ficaria
+        anterior à marca de sincronização de outros processos e o vetor seria pulado.
+        """
+        if not self._written:
+            return
+        ids = list(self._written)
+        for i in range(0, len(ids), self.BATCH_SIZE):
+            await self.db.execute(
+                update(ArticleEmbedding)
+                .where(
+                    ArticleEmbedding.model_name == self.model_name,
+                    ArticleEmbedding.article_id.in_(ids[i : i + self.BATCH_SIZE]),
+                )
+                .values(updated_at=self._clock())
+            )
+
+    async def delete(self, article_ids: Sequence[int]) -> None:
+        """Remove os vetores dos artigos para o modelo."""
+        if not article_ids:
+            return
+        await self.db.execute(
+            delete(ArticleEmbedding).where(
+                ArticleEmbedding.model_name == self.model_name,
+                ArticleEmbedding.article_id.in_(list(article_ids)),
+            )
+        )
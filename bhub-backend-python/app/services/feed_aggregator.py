@@ -2,43 +2,87 @@
 Serviço de agregação de feeds RSS/Atom.
 """
 
+import asyncio
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from typing import NamedTuple
+from urllib.parse import urlparse
 
-import feedparser
 import httpx
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, case, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.config import settings
+from app.core.http_client import HTTPPurpose, get_http_client
 from app.core.logging import log
-from app.models import Article, Author, Feed, SourceType
+from app.models import Article, Author, Feed, SourceType, article_authors, article_categories
 from app.schemas.feed import FeedSyncAllResult, FeedSyncResult, FeedTestResult
 from app.services.article_parser import ArticleParserService
-from app.services.task_dispatcher import dispatch_classify_article, dispatch_download_pdf
+from app.services.author_scraper import AuthorScrapingService, needs_author_scrape, scrape_domain
+from app.services.feed_parsing import parse_feed_document, run_in_parse_executor
+from app.services.feed_scheduling import schedule_next_sync, spread_first_sync
+from app.services.task_dispatcher import (
+    dispatch_classify_articles,
+    dispatch_download_pdfs,
+    dispatch_scrape_authors,
+)
+
+
+class KnownArticle(NamedTuple):
+    """Artigo já armazenado, como visto pela deduplicação da sincronização."""
+
+    id: int
+    content_hash: str | None
+    doi: str | None
+
+
+class SyncStageTimer:
+    """Acumula a duração (em segundos) de cada etapa de uma sincronização."""
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
 
 
 class FeedAggregatorService:
     """Serviço para agregação de feeds RSS/Atom."""
 
-    def __init__(self, db: AsyncSession, ai_manager=None):
+    # Máximo de external_ids por consulta IN (...) na deduplicação
+    DEDUP_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        ai_manager=None,
+        http_client: httpx.AsyncClient | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
         self.db = db
         self.ai_manager = ai_manager
         self.parser = ArticleParserService()
-        self.http_client = httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/rss+xml, application/xml, text/xml, */*",
-            },
-        )
+        self._session_factory = session_factory
+        # Cliente compartilhado de feeds; o registro é dono do ciclo de vida
+        self.http_client = http_client or get_http_client(HTTPPurpose.FEEDS)
 
     async def close(self):
-        """Fecha o cliente HTTP."""
-        await self.http_client.aclose()
+        """Mantido por compatibilidade: o cliente compartilhado é fechado no shutdown."""
+
+    async def sync_all_active_feeds(self, concurrency: int | None = None) -> FeedSyncAllResult:
+        """
+        Sincroniza todos os feeds ativos.
 
-    async def sync_all_active_feeds(self) -> FeedSyncAllResult:
-        """Sincroniza todos os feeds ativos."""
+        Com concurrency > 1 (padrão: settings.feed_sync_concurrency), cada feed roda em
+        sua própria AsyncSession, limitado por um semáforo global e outro por host.
+        """
         start_time = time.time()
         log.bind(feed_sync=True).info("Iniciando sincronização de todos os feeds")
 
@@ -51,33 +95,27 @@ class FeedAggregatorService:
         )
         feeds = result.scalars().all()
 
+        # Feeds já sincronizados mas sem agendamento ganham um primeiro horário espalhado
+        # no intervalo; feeds nunca sincronizados continuam sendo buscados de imediato
+        unscheduled = [f for f in feeds if f.next_sync_at is None and f.last_sync_at is not None]
+        for feed in unscheduled:
+            spread_first_sync(feed)
+        if any(f.next_sync_at is not None for f in unscheduled):
+            await self.db.commit()
+
         feeds_to_sync = [f for f in feeds if f.needs_sync]
 
-        results: list[FeedSyncResult] = []
-        total_new_articles = 0
-        successful = 0
-        failed = 0
-
-        for feed in feeds_to_sync:
-            try:
-                sync_result = await self.sync_feed(feed.id)
-                results.append(sync_result)
-                total_new_articles += sync_result.new_articles
-                if sync_result.success:
-                    successful += 1
-                else:
-                    failed += 1
-            except Exception as e:
-                log.error(f"Erro ao sincronizar feed {feed.name}: {e}")
-                results.append(
-                    FeedSyncResult(
-                        feed_id=feed.id,
-                        feed_name=feed.name,
-                        success=False,
-                        errors=[str(e)],
-                    )
-                )
-                failed += 1
+        if concurrency is None:
+            concurrency = settings.feed_sync_concurrency
+
+        if concurrency > 1 and len(feeds_to_sync) > 1:
+            results = await self._sync_feeds_concurrently(feeds_to_sync, concurrency)
+        else:
+            results = [await self._sync_feed_safe(feed.id, feed.name) for feed in feeds_to_sync]
+
+        total_new_articles = sum(r.new_articles for r in results)
+        successful = sum(1 for r in results if r.success)
+        failed = len(results) - successful
 
         duration = time.time() - start_time
         log.bind(feed_sync=True).info(
@@ -94,6 +132,53 @@ class FeedAggregatorService:
             duration_seconds=duration,
         )
 
+    async def _sync_feed_safe(self, feed_id: int, feed_name: str) -> FeedSyncResult:
+        """Executa sync_feed convertendo exceções inesperadas em resultado de falha."""
+        try:
+            return await self.sync_feed(feed_id)
+        except Exception as e:
+            log.error(f"Erro ao sincronizar feed {feed_name}: {e}")
+            return FeedSyncResult(
+                feed_id=feed_id,
+                feed_name=feed_name,
+                success=False,
+                errors=[str(e)],
+            )
+
+    async def _sync_feeds_concurrently(
+        self, feeds: list[Feed], concurrency: int
+    ) -> list[FeedSyncResult]:
+        """Sincroniza feeds em paralelo, cada um com sua própria sessão de banco."""
+        session_factory = self._session_factory
+        if session_factory is None:
+            from app.database import async_session_maker
+
+            session_factory = async_session_maker
+
+        global_limit = asyncio.Semaphore(concurrency)
+        per_host_limit = max(1, settings.feed_sync_per_host_limit)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+
+        async def run(feed_id: int, feed_name: str, host: str) -> FeedSyncResult:
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host_limit))
+            # Vaga do host antes da global: feeds de um host lento esperando na fila
+            # do host não seguram vagas globais; a sessão só abre com as duas vagas
+            async with host_limit, global_limit, session_factory() as session:
+                worker = FeedAggregatorService(
+                    session,
+                    ai_manager=self.ai_manager,
+                    http_client=self.http_client,
+                )
+                return await worker._sync_feed_safe(feed_id, feed_name)
+
+        log.bind(feed_sync=True).info(
+            f"Sincronizando {len(feeds)} feeds em paralelo "
+            f"(concurrency={concurrency}, por host={per_host_limit})"
+        )
+        # Ler atributos antes de disparar as tasks: a sessão principal não é compartilhada
+        jobs = [(f.id, f.name, urlparse(f.feed_url).netloc.lower()) for f in feeds]
+        return list(await asyncio.gather(*(run(*job) for job in jobs)))
+
     async def sync_feed(self, feed_id: int) -> FeedSyncResult:
         """Sincroniza um feed específico."""
         start_time = time.time()
@@ -113,74 +198,145 @@ class FeedAggregatorService:
         log.info(f"Sincronizando feed: {feed.name}")
         errors: list[str] = []
         new_articles = 0
+        timer = SyncStageTimer()
 
         try:
-            # Fazer requisição HTTP
-            response = await self.http_client.get(feed.feed_url)
-            response.raise_for_status()
+            # Fazer requisição HTTP condicional com os validadores da última resposta
+            with timer.stage("fetch"):
+                response = await self.http_client.get(
+                    feed.feed_url, headers=self._conditional_headers(feed)
+                )
+                content = response.text
 
-            # Parse do feed
-            parsed = feedparser.parse(response.text)
+            if response.status_code == 304:
+                return await self._finish_not_modified(feed, start_time, timer)
 
-            if parsed.bozo and parsed.bozo_exception:
-                log.warning(f"Feed malformado: {feed.name} - {parsed.bozo_exception}")
+            response.raise_for_status()
+            # Validadores só são gravados com o sucesso da sincronização: se a ingestão
+            # falhar, a próxima execução precisa baixar o feed de novo em vez de receber 304
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+            # Parse do feed e normalização das entradas fora do event loop
+            with timer.stage("parse"):
+                parsed = await run_in_parse_executor(
+                    parse_feed_document, content, feed.id, feed.journal_name
+                )
 
-            # Processar cada item
-            articles_to_classify = []
+            if parsed["bozo_exception"]:
+                log.warning(f"Feed malformado: {feed.name} - {parsed['bozo_exception']}")
+
+            # Deduplicar todas as entradas com uma única consulta antes de processar
+            entry_ids = [item["external_id"] for item in parsed["entries"]]
+            with timer.stage("dedup"):
+                known_articles = await self._fetch_existing_articles(entry_ids)
+
+            # Itens novos são preparados para inserção em lote; conhecidos só são
+            # atualizados quando o fingerprint de conteúdo mudou
+            pending: list[tuple[str, dict]] = []
+            changed: list[tuple[KnownArticle, dict]] = []
+            seen_ids: set[str] = set()
+            for item in parsed["entries"]:
+                external_id = item["external_id"]
+                article_data = item["data"]
+                # Entradas repetidas no mesmo feed também são ignoradas
+                if external_id in seen_ids:
+                    continue
+                seen_ids.add(external_id)
+                known = known_articles.get(external_id)
+                if known is None:
+                    pending.append((external_id, article_data))
+                elif article_data["content_hash"] != known.content_hash:
+                    changed.append((known, article_data))
+
+            with timer.stage("insert"):
+                created_ids = await self._bulk_insert_articles(feed, pending)
+            with timer.stage("update"):
+                updated_ids = await self._apply_entry_updates(changed)
+            updated_articles = len(updated_ids)
+
+            articles_to_classify = list(updated_ids)
             articles_to_download_pdf = []
-            for entry in parsed.entries:
-                try:
-                    created_article_id, article_data = await self._process_feed_entry(feed, entry)
-                    if created_article_id:
-                        new_articles += 1
-                        articles_to_classify.append(created_article_id)
-
-                        # Verificar se é open access e tem PDF URL para download
-                        if article_data and article_data.get("is_open_access") and article_data.get("pdf_url"):
-                            articles_to_download_pdf.append(
-                                (created_article_id, article_data.get("pdf_url"))
-                            )
-                except Exception as e:
-                    log.error(f"Erro ao processar entrada: {e}")
-                    errors.append(str(e))
+            articles_missing_authors = []
+            for external_id, article_data in pending:
+                created_article_id = created_ids.get(external_id)
+                if not created_article_id:
+                    continue
+                new_articles += 1
+                articles_to_classify.append(created_article_id)
+
+                # Autores ausentes no feed são buscados na página em job adiado
+                if needs_author_scrape(article_data):
+                    articles_missing_authors.append(created_article_id)
+
+                # Verificar se é open access e tem PDF URL para download
+                if article_data.get("is_open_access") and article_data.get("pdf_url"):
+                    articles_to_download_pdf.append(
+                        (created_article_id, article_data.get("pdf_url"))
+                    )
 
             # Atualizar estatísticas do feed
+            feed.http_etag = etag
+            feed.http_last_modified = last_modified
             feed.last_sync_at = datetime.utcnow()
             feed.last_successful_sync_at = datetime.utcnow()
             feed.error_count = 0
             feed.last_error = None
             feed.articles_last_sync = new_articles
             feed.total_articles += new_articles
+            schedule_next_sync(
+                feed,
+                new_articles,
+                [item["data"].get("publication_date") for item in parsed["entries"]],
+            )
 
-            await self.db.commit()
-            from app.core.telemetry import record_feed_ingested
+            with timer.stage("commit"):
+                await self.db.commit()
+            from app.core.telemetry import record_feed_ingested, record_feed_sync_stages
 
             record_feed_ingested(new_articles, feed.name)
 
-            # Disparar tarefas de classificação em background após commit
-            if articles_to_classify:
-                for art_id in articles_to_classify:
-                    job_id = await dispatch_classify_article(art_id)
-                    log.debug(f"Classificação enfileirada: job={job_id} artigo={art_id}")
-                log.info(f"Enfileiradas {len(articles_to_classify)} tarefas de classificação")
+            with timer.stage("dispatch"):
+                # Disparar tarefas de classificação em background após commit, em lote
+                if articles_to_classify:
+                    job_ids = await dispatch_classify_articles(articles_to_classify)
+                    log.info(
+                        f"Enfileiradas {len(articles_to_classify)} classificações "
+                        f"em {len(job_ids)} jobs"
+                    )
 
-            # Disparar tarefas de download de PDF para artigos open access
-            if articles_to_download_pdf:
-                for art_id, pdf_url in articles_to_download_pdf:
-                    job_id = await dispatch_download_pdf(art_id, pdf_url)
-                    log.debug(f"Download de PDF enfileirado: job={job_id} artigo={art_id}")
-                log.info(f"Enfileiradas {len(articles_to_download_pdf)} tarefas de download de PDF")
+                # Disparar tarefas de download de PDF para artigos open access
+                if articles_to_download_pdf:
+                    job_ids = await dispatch_download_pdfs(articles_to_download_pdf)
+                    log.info(
+                        f"Enfileirados {len(articles_to_download_pdf)} downloads de PDF "
+                        f"em {len(job_ids)} jobs"
+                    )
+
+                if articles_missing_authors:
+                    job_id = await dispatch_scrape_authors(articles_missing_authors)
+                    log.info(
+                        f"Scraping de autores enfileirado: job={job_id} "
+                        f"artigos={len(articles_missing_authors)}"
+                    )
 
+            record_feed_sync_stages(timer.timings, feed.name)
             duration = time.time() - start_time
-            log.info(f"Feed {feed.name} sincronizado: {new_articles} novos artigos em {duration:.2f}s")
+            log.info(
+                f"Feed {feed.name} sincronizado: {new_articles} novos artigos, "
+                f"{updated_articles} atualizados em {duration:.2f}s "
+                f"({self._format_stage_timings(timer.timings)})"
+            )
 
             return FeedSyncResult(
                 feed_id=feed.id,
                 feed_name=feed.name,
                 success=True,
                 new_articles=new_articles,
+                updated_articles=updated_articles,
                 errors=errors,
                 duration_seconds=duration,
+                stage_timings=timer.timings,
             )
 
         except Exception as e:
@@ -189,10 +345,16 @@ class FeedAggregatorService:
 
             record_feed_failed(feed.name)
 
+            # Descartar a ingestão parcial; o refresh restaura o feed (inclusive os
+            # validadores HTTP) como estava no banco antes desta sincronização
+            await self.db.rollback()
+            await self.db.refresh(feed)
+
             # Atualizar contagem de erros
             feed.last_sync_at = datetime.utcnow()
             feed.error_count += 1
             feed.last_error = str(e)
+            schedule_next_sync(feed, 0)
 
             await self.db.commit()
 
@@ -202,144 +364,363 @@ class FeedAggregatorService:
                 success=False,
                 errors=[str(e)],
                 duration_seconds=time.time() - start_time,
+                stage_timings=timer.timings,
             )
 
-    async def _process_feed_entry(self, feed: Feed, entry: dict) -> tuple[int | None, dict | None]:
-        """Processa uma entrada do feed e cria artigo se necessário. Retorna ID do artigo criado."""
-        # Gerar ID externo
-        external_id = self.parser.generate_external_id(entry, feed.id)
+    @staticmethod
+    def _format_stage_timings(timings: dict[str, float]) -> str:
+        """Resumo legível das etapas para o log: 'fetch=0.12s parse=0.03s ...'."""
+        return " ".join(f"{stage}={seconds:.2f}s" for stage, seconds in timings.items())
+
+    @staticmethod
+    def _conditional_headers(feed: Feed) -> dict[str, str]:
+        """Monta If-None-Match / If-Modified-Since a partir dos validadores salvos."""
+        headers = {}
+        if feed.http_etag:
+            headers["If-None-Match"] = feed.http_etag
+        if feed.http_last_modified:
+            headers["If-Modified-Since"] = feed.http_last_modified
+        return headers
+
+    async def _finish_not_modified(
+        self, feed: Feed, start_time: float, timer: SyncStageTimer
+    ) -> FeedSyncResult:
+        """Registra um 304: apenas atualiza os timestamps do feed, sem parse nem inserções."""
+        now = datetime.utcnow()
+        feed.last_sync_at = now
+        feed.last_successful_sync_at = now
+        feed.error_count = 0
+        feed.last_error = None
+        feed.articles_last_sync = 0
+        schedule_next_sync(feed, 0)
+        with timer.stage("commit"):
+            await self.db.commit()
+
+        from app.core.telemetry import record_feed_sync_stages
 
-        # Verificar se já existe
-        existing = await self.db.execute(
-            select(Article).where(Article.external_id == external_id)
-        )
-        if existing.scalar_one_or_none():
-            return None, None
-
-        # Parse dos dados do artigo
-        article_data = self.parser.parse_entry(entry, journal_name=feed.journal_name)
-
-        # Fallback de autor: se não vier no feed, tentar buscar na página (específico para Springer/BAP)
-        if not article_data.get("authors") and article_data.get("url"):
-            domain = ""
-            try:
-                from urllib.parse import urlparse
-                domain = urlparse(article_data["url"]).netloc
-            except:
-                pass
-
-            # Adicionar domínios que sabemos que precisam disso
-            if "springer.com" in domain or "wiley.com" in domain:
-                try:
-                    log.info(f"Buscando autores via scraping para: {article_data['url']}")
-                    # Usar headers de navegador para evitar bloqueio
-                    headers = {
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
-                    }
-                    page_response = await self.http_client.get(article_data["url"], headers=headers, follow_redirects=True)
-                    if page_response.status_code == 200:
-                        scraped_authors = self.parser.parse_html_authors(page_response.text)
-                        if scraped_authors:
-                            article_data["authors"] = scraped_authors
-                            log.info(f"Autores encontrados via scraping: {len(scraped_authors)}")
-                except Exception as e:
-                    log.warning(f"Falha no fallback de scraping de autores: {e}")
-
-        # Classificação movida para background_tasks
-
-        # Criar artigo
-        article = Article(
-            external_id=external_id,
-            title=article_data["title"],
-            abstract=article_data.get("abstract"),
-            keywords=article_data.get("keywords"),
-            original_url=article_data.get("url"),
-            publication_date=article_data.get("publication_date"),
-            doi=article_data.get("doi"),
-            journal_name=feed.journal_name or article_data.get("journal"),
-            language=article_data.get("language", "en"),
-            source_type=SourceType.RSS,
+        record_feed_sync_stages(timer.timings, feed.name)
+        duration = time.time() - start_time
+        log.info(f"Feed {feed.name} não modificado (304) em {duration:.2f}s")
+
+        return FeedSyncResult(
             feed_id=feed.id,
-            image_url=article_data.get("image_url"),
-            pdf_url=article_data.get("pdf_url"),
-            category_id=None, # Será preenchido via background task
-            classification_confidence=None,
-            is_open_access=article_data.get("is_open_access", False),
+            feed_name=feed.name,
+            success=True,
+            not_modified=True,
+            duration_seconds=duration,
+            stage_timings=timer.timings,
         )
 
-        self.db.add(article)
-        await self.db.flush()
+    async def _fetch_existing_articles(self, external_ids: list[str]) -> dict[str, KnownArticle]:
+        """Busca os artigos já existentes pelos external_ids, em consultas IN (...) por lote."""
+        unique_ids = list(dict.fromkeys(external_ids))
+        existing: dict[str, KnownArticle] = {}
+        # Lotes mantêm o número de parâmetros abaixo do limite do SQLite em feeds grandes
+        for i in range(0, len(unique_ids), self.DEDUP_BATCH_SIZE):
+            chunk = unique_ids[i : i + self.DEDUP_BATCH_SIZE]
+            result = await self.db.execute(
+                select(
+                    Article.external_id, Article.id, Article.content_hash, Article.doi
+                ).where(Article.external_id.in_(chunk))
+            )
+            for external_id, article_id, content_hash, doi in result.all():
+                existing[external_id] = KnownArticle(article_id, content_hash, doi)
+        return existing
+
+    async def _apply_entry_updates(self, changed: list[tuple[KnownArticle, dict]]) -> list[int]:
+        """
+        Atualiza artigos cujo fingerprint mudou e retorna os IDs que devem ser reclassificados.
+
+        Artigos antigos sem fingerprint apenas recebem o hash, sem reprocessamento.
+        """
+        if not changed:
+            return []
+
+        backfill = [
+            {"id": known.id, "content_hash": data["content_hash"]}
+            for known, data in changed
+            if known.content_hash is None
+        ]
+        if backfill:
+            await self.db.execute(update(Article), backfill)
+
+        edited = [(known, data) for known, data in changed if known.content_hash is not None]
+        if not edited:
+            return []
+
+        # DOI é único: só trocar se o novo DOI não pertence a outro artigo
+        new_dois = [data["doi"] for known, data in edited if data.get("doi") and data["doi"] != known.doi]
+        doi_owners: dict[str, int] = {}
+        for i in range(0, len(new_dois), self.DEDUP_BATCH_SIZE):
+            result = await self.db.execute(
+                select(Article.doi, Article.id).where(
+                    Article.doi.in_(new_dois[i : i + self.DEDUP_BATCH_SIZE])
+                )
+            )
+            doi_owners.update(result.tuples().all())
+
+        rows = []
+        for known, data in edited:
+            doi = data.get("doi") or known.doi
+            if doi != known.doi and doi in doi_owners:
+                log.warning(f"DOI {doi} já pertence ao artigo {doi_owners[doi]}; mantendo o atual")
+                doi = known.doi
+            if doi:
+                doi_owners[doi] = known.id
+            rows.append({
+                "id": known.id,
+                "title": data["title"],
+                "abstract": data.get("abstract"),
+                "keywords": data.get("keywords"),
+                "doi": doi,
+                "publication_date": data.get("publication_date"),
+                "image_url": data.get("image_url"),
+                "pdf_url": data.get("pdf_url"),
+                "is_open_access": data.get("is_open_access", False),
+                "content_hash": data["content_hash"],
+                # Categorias são recalculadas pela reclassificação
+                "category_id": None,
+                "classification_confidence": None,
+            })
+        await self.db.execute(update(Article), rows)
+
+        article_ids = [row["id"] for row in rows]
+        await self.db.execute(
+            delete(article_categories).where(article_categories.c.article_id.in_(article_ids))
+        )
 
-        # Processar autores
-        author_names = article_data.get("authors", [])
-        await self._process_authors(article, author_names)
+        # Substituir autores apenas quando o feed traz autores (preserva os obtidos via scraping)
+        new_authors = {known.id: data["authors"] for known, data in edited if data.get("authors")}
+        if new_authors:
+            await self._unlink_authors(list(new_authors))
+            await self._bulk_link_authors(new_authors)
 
-        return article.id, article_data
+        log.info(f"{len(article_ids)} artigos editados no feed serão reclassificados")
+        return article_ids
 
-    async def _process_authors(self, article: Article, author_names: list[dict]):
-        """Processa e associa autores ao artigo."""
-        if not author_names:
-            return
+    async def _unlink_authors(self, article_ids: list[int]) -> None:
+        """Remove associações de autores dos artigos, decrementando article_count."""
+        result = await self.db.execute(
+            select(article_authors.c.author_id, func.count())
+            .where(article_authors.c.article_id.in_(article_ids))
+            .group_by(article_authors.c.author_id)
+        )
+        authors_by_decrement: dict[int, list[int]] = {}
+        for author_id, count in result.all():
+            authors_by_decrement.setdefault(count, []).append(author_id)
 
-        # Obter autores existentes
-        existing_authors = {}
-        if author_names: # author_names is now a list of dicts [{'name': '...', 'role': '...'}]
-            names_to_check = [a['name'] for a in author_names if a and a.get('name')]
-            if names_to_check:
-                normalized_names = [Author.normalize_name(n) for n in names_to_check if Author.normalize_name(n)]
-                if normalized_names:
-                    stmt = select(Author).where(Author.normalized_name.in_(normalized_names))
-                    result = await self.db.execute(stmt)
-                    existing_authors = {a.normalized_name: a for a in result.scalars().all()}
+        await self.db.execute(
+            delete(article_authors).where(article_authors.c.article_id.in_(article_ids))
+        )
+        for decrement, ids in authors_by_decrement.items():
+            await self.db.execute(
+                update(Author)
+                .where(Author.id.in_(ids))
+                .values(
+                    article_count=case(
+                        (Author.article_count > decrement, Author.article_count - decrement),
+                        else_=0,
+                    )
+                )
+                .execution_options(synchronize_session=False)
+            )
 
-        # Importar dinamicamente para evitar circular imports se necessário, ou usar o já importado
-        from sqlalchemy import insert
+    async def fill_missing_authors(self, article_ids: list[int]) -> int:
+        """
+        Completa autores de artigos importados sem eles, via scraping da página.
 
-        from app.models.author import article_authors
+        Executado pelo job adiado disparado na sincronização. Retorna quantos
+        artigos receberam autores.
+        """
+        if not article_ids:
+            return 0
 
-        for idx, author_info in enumerate(author_names):
-            name = author_info.get('name')
-            role = author_info.get('role', 'author')
+        # Ignorar artigos que já ganharam autores (p.ex. após edição no feed)
+        linked = select(article_authors.c.article_id).where(
+            article_authors.c.article_id.in_(article_ids)
+        )
+        result = await self.db.execute(
+            select(Article.id, Article.original_url, Article.doi).where(
+                Article.id.in_(article_ids), Article.id.not_in(linked)
+            )
+        )
+        targets = {
+            article_id: (url, doi)
+            for article_id, url, doi in result.tuples().all()
+            if scrape_domain(url)
+        }
+        if not targets:
+            return 0
+
+        scraper = AuthorScrapingService(self.db)
+        authors_by_article = await scraper.scrape_many(targets)
+        await self._bulk_link_authors(authors_by_article)
+        await self.db.commit()
+        return len(authors_by_article)
+
+    async def _bulk_insert_articles(
+        self, feed: Feed, items: list[tuple[str, dict]]
+    ) -> dict[str, int]:
+        """
+        Insere artigos novos e seus autores em lote.
+
+        Um INSERT ... ON CONFLICT DO NOTHING RETURNING para os artigos, um upsert de
+        autores por normalized_name, um INSERT para as associações e um UPDATE em lote
+        de article_count. Retorna o mapa external_id -> id dos artigos criados;
+        artigos que outra sincronização concorrente gravou antes (mesmo DOI ou
+        external_id) ficam de fora.
+        """
+        if not items:
+            return {}
+
+        # DOI é único: descartar os que já existem no banco ou se repetem no lote
+        dois = [data["doi"] for _, data in items if data.get("doi")]
+        taken_dois: set[str] = set()
+        for i in range(0, len(dois), self.DEDUP_BATCH_SIZE):
+            result = await self.db.execute(
+                select(Article.doi).where(Article.doi.in_(dois[i : i + self.DEDUP_BATCH_SIZE]))
+            )
+            taken_dois.update(result.scalars().all())
+
+        rows = []
+        authors_by_external_id: dict[str, list[dict]] = {}
+        for external_id, article_data in items:
+            doi = article_data.get("doi")
+            if doi:
+                if doi in taken_dois:
+                    log.warning(f"Artigo com DOI já cadastrado ignorado: {doi}")
+                    continue
+                taken_dois.add(doi)
+
+            rows.append({
+                "external_id": external_id,
+                "title": article_data["title"],
+                "abstract": article_data.get("abstract"),
+                "keywords": article_data.get("keywords"),
+                "original_url": article_data.get("url"),
+                "publication_date": article_data.get("publication_date"),
+                "doi": doi,
+                "journal_name": feed.journal_name or article_data.get("journal"),
+                "language": article_data.get("language", "en"),
+                "source_type": SourceType.RSS,
+                "feed_id": feed.id,
+                "image_url": article_data.get("image_url"),
+                "pdf_url": article_data.get("pdf_url"),
+                "category_id": None,  # Será preenchido via background task
+                "classification_confidence": None,
+                "is_open_access": article_data.get("is_open_access", False),
+                "content_hash": article_data.get("content_hash"),
+            })
+            authors_by_external_id[external_id] = article_data.get("authors") or []
+
+        if not rows:
+            return {}
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
 
-            if not name or len(name.strip()) < 2:
-                continue
+        result = await self.db.execute(
+            dialect_insert(Article)
+            .on_conflict_do_nothing()
+            .returning(Article.id, Article.external_id),
+            rows,
+        )
+        created_ids = {external_id: article_id for article_id, external_id in result.all()}
+
+        await self._bulk_link_authors(
+            {
+                created_ids[external_id]: author_names
+                for external_id, author_names in authors_by_external_id.items()
+                if external_id in created_ids
+            }
+        )
 
-            norm_name = Author.normalize_name(name)
+        return created_ids
 
-            if not norm_name:
-                continue
+    async def _bulk_link_authors(self, authors_by_article: dict[int, list[dict]]) -> None:
+        """Faz upsert dos autores e associa todos aos artigos com inserções em lote."""
+        # author_names é uma lista de dicts [{'name': '...', 'role': '...'}]
+        links: list[tuple[int, str, int, str]] = []
+        display_names: dict[str, str] = {}
+        for article_id, author_names in authors_by_article.items():
+            for idx, author_info in enumerate(author_names):
+                name = author_info.get("name") if author_info else None
+                if not name or len(name.strip()) < 2:
+                    continue
 
-            author = existing_authors.get(norm_name)
-            if not author:
-                # Double check in DB to avoid dupes from other concurrent tasks (rare but possible)
-                # or from same batch if logic above failed
-                stmt = select(Author).where(Author.normalized_name == norm_name)
-                result = await self.db.execute(stmt)
-                author = result.scalar_one_or_none()
-
-                if author:
-                    existing_authors[norm_name] = author
-                else:
-                    author = Author(name=name.strip(), normalized_name=norm_name)
-                    self.db.add(author)
-                    await self.db.flush() # Ensure ID is generated
-                    existing_authors[norm_name] = author
-
-            check_stmt = select(article_authors).where(
-                article_authors.c.article_id == article.id,
-                article_authors.c.author_id == author.id
-            )
-            existing_assoc = await self.db.execute(check_stmt)
-            if existing_assoc.first() is None:
-                # Inserir associação com role
-                stmt = insert(article_authors).values(
-                    article_id=article.id,
-                    author_id=author.id,
-                    position=idx,
-                    role=role
+                norm_name = Author.normalize_name(name)
+                if not norm_name:
+                    continue
+
+                display_names.setdefault(norm_name, name.strip())
+                links.append((article_id, norm_name, idx, author_info.get("role", "author")))
+
+        if not links:
+            return
+
+        # Upsert por normalized_name em um único comando (ON CONFLICT DO NOTHING), em
+        # ordem de normalized_name: jobs concorrentes travam os autores na mesma ordem
+        if self.db.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        await self.db.execute(
+            dialect_insert(Author.__table__).on_conflict_do_nothing(
+                index_elements=["normalized_name"]
+            ),
+            [
+                {"name": display_names[norm_name], "normalized_name": norm_name, "article_count": 0}
+                for norm_name in sorted(display_names)
+            ],
+        )
+
+        author_ids: dict[str, int] = {}
+        normalized_names = sorted(display_names)
+        for i in range(0, len(normalized_names), self.DEDUP_BATCH_SIZE):
+            result = await self.db.execute(
+                select(Author.normalized_name, Author.id).where(
+                    Author.normalized_name.in_(normalized_names[i : i + self.DEDUP_BATCH_SIZE])
                 )
-                await self.db.execute(stmt)
-                author.article_count += 1
+            )
+            author_ids.update(result.tuples().all())
+
+        # Associações com role; o mesmo autor aparece uma vez por artigo
+        assoc_rows = []
+        seen: set[tuple[int, int]] = set()
+        new_links_per_author: dict[int, int] = {}
+        for article_id, norm_name, position, role in links:
+            author_id = author_ids.get(norm_name)
+            if author_id is None or (article_id, author_id) in seen:
+                continue
+            seen.add((article_id, author_id))
+            assoc_rows.append({
+                "article_id": article_id,
+                "author_id": author_id,
+                "position": position,
+                "role": role,
+            })
+            new_links_per_author[author_id] = new_links_per_author.get(author_id, 0) + 1
+
+        if not assoc_rows:
+            return
+
+        await self.db.execute(insert(article_authors), assoc_rows)
+
+        # Contadores em lote, na mesma ordem de normalized_name do upsert
+        authors = Author.__table__
+        await self.db.execute(
+            update(authors)
+            .where(authors.c.id == bindparam("b_author_id"))
+            .values(article_count=authors.c.article_count + bindparam("b_increment")),
+            [
+                {"b_author_id": author_id, "b_increment": new_links_per_author[author_id]}
+                for author_id in (author_ids.get(norm_name) for norm_name in normalized_names)
+                if author_id in new_links_per_author
+            ],
+        )
 
     async def test_feed(self, feed_url: str) -> FeedTestResult:
         """Testa um feed sem salvar dados."""
@@ -347,9 +728,9 @@ class FeedAggregatorService:
             response = await self.http_client.get(feed_url)
             response.raise_for_status()
 
-            parsed = feedparser.parse(response.text)
+            parsed = await run_in_parse_executor(parse_feed_document, response.text, 0)
 
-            if not parsed.entries:
+            if not parsed["entries"]:
                 return FeedTestResult(
                     success=False,
                     error="Feed não contém entradas",
@@ -357,8 +738,8 @@ class FeedAggregatorService:
 
             # Pegar amostras
             sample_items = []
-            for entry in parsed.entries[:3]:
-                data = self.parser.parse_entry(entry)
+            for item in parsed["entries"][:3]:
+                data = item["data"]
                 sample_items.append({
                     "title": data.get("title", "")[:100],
                     "url": data.get("url", ""),
@@ -367,9 +748,9 @@ class FeedAggregatorService:
 
             return FeedTestResult(
                 success=True,
-                feed_title=parsed.feed.get("title"),
-                feed_description=parsed.feed.get("description"),
-                items_count=len(parsed.entries),
+                feed_title=parsed["title"],
+                feed_description=parsed["description"],
+                items_count=len(parsed["entries"]),
                 sample_items=sample_items,
             )
 
@@ -0,0 +1,112 @@
+"""
+Parsing de feeds fora do event loop.
+
+feedparser e BeautifulSoup são CPU-bound; rodam em um ProcessPoolExecutor
+(ou ThreadPoolExecutor como fallback) e devolvem apenas dicts simples ao lado async.
+"""
+
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+import feedparser
+
+from app.config import settings
+from app.core.logging import log
+from app.services.article_parser import ArticleParserService
+
+T = TypeVar("T")
+
+_executor: Executor | None = None
+
+
+def parse_feed_document(
+    content: str, feed_id: int, journal_name: str | None = None
+) -> dict[str, Any]:
+    """
+    Faz o parse completo de um documento RSS/Atom.
+
+    Retorna os metadados do feed e, para cada entrada, o external_id e os dados
+    normalizados de ArticleParserService.parse_entry.
+    """
+    parsed = feedparser.parse(content)
+    parser = ArticleParserService()
+
+    return {
+        "bozo_exception": (
+            str(parsed.bozo_exception) if parsed.bozo and parsed.bozo_exception else None
+        ),
+        "title": parsed.feed.get("title"),
+        "description": parsed.feed.get("description"),
+        "entries": [
+            {
+                "external_id": parser.generate_external_id(entry, feed_id),
+                "data": parser.parse_entry(entry, journal_name=journal_name),
+            }
+            for entry in parsed.entries
+        ],
+    }
+
+
+def parse_html_authors(html_content: str) -> list[dict[str, str]]:
+    """Extrai autores de uma página HTML de artigo."""
+    return ArticleParserService().parse_html_authors(html_content)
+
+
+def _create_executor() -> Executor | None:
+    mode = settings.feed_parse_executor
+    workers = max(1, settings.feed_parse_workers)
+
+    if mode == "inline":
+        return None
+
+    if mode == "process":
+        try:
+            # spawn evita herdar threads/conexões do processo do servidor
+            return ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError) as e:
+            log.warning(f"ProcessPool indisponível para parsing de feeds; usando threads: {e}")
+
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feed-parse")
+
+
+def get_parse_executor() -> Executor | None:
+    """Retorna o executor de parsing, criado sob demanda (None = parsing inline)."""
+    global _executor
+    if _executor is None and settings.feed_parse_executor != "inline":
+        _executor = _create_executor()
+    return _executor
+
+
+async def run_in_parse_executor(func: Callable[..., T], *args: Any) -> T:
+    """Executa uma função de parsing no executor configurado."""
+    global _executor
+    executor = get_parse_executor()
+    if executor is None:
+        return func(*args)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, func, *args)
+    except BrokenProcessPool as e:
+        # Worker morreu (OOM, sinal): trocar para threads em vez de falhar todos os feeds
+        if _executor is executor:
+            log.warning(f"Pool de parsing de feeds quebrado; usando threads: {e}")
+            executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.feed_parse_workers), thread_name_prefix="feed-parse"
+            )
+        return await loop.run_in_executor(_executor, func, *args)
+
+
+def shutdown_parse_executor() -> None:
+    """Encerra o executor de parsing, se criado."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,125 @@
+"""
+Agendamento adaptativo da sincronização de feeds.
+
+Cada feed aprende sua cadência real de publicação a partir das datas das entradas,
+recua exponencialmente quando fica ocioso ou falha, e recebe jitter para que os
+feeds não sejam todos buscados no mesmo minuto.
+"""
+
+import random
+import statistics
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from app.config import settings
+from app.models.feed import SYNC_INTERVALS, Feed, SyncFrequency
+
+# Peso da observação mais recente na média móvel da cadência de publicação
+PUBLISH_INTERVAL_EWMA_ALPHA = 0.3
+
+# Quantas datas distintas (as mais recentes) entram na estimativa
+PUBLISH_INTERVAL_SAMPLE = 20
+
+# Fator de recuo por sincronização sem artigos novos, e limite de expoente
+IDLE_BACKOFF_FACTOR = 1.5
+MAX_BACKOFF_EXPONENT = 6
+
+# Jitter relativo aplicado ao intervalo (±25%), nunca menor que um tick do agendador
+# nem maior que metade do intervalo
+JITTER_RATIO = 0.25
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def estimate_publish_interval(publication_dates: Iterable[datetime | None]) -> float | None:
+    """
+    Estima o intervalo típico entre publicações, em minutos.
+
+    Usa a mediana dos intervalos entre datas distintas; edições publicadas em lote
+    (várias entradas com a mesma data) contam como uma única publicação.
+    """
+    dates = sorted(
+        {_as_naive_utc(d) for d in publication_dates if d is not None}, reverse=True
+    )[:PUBLISH_INTERVAL_SAMPLE]
+    if len(dates) < 2:
+        return None
+
+    gaps = [(newer - older).total_seconds() / 60 for newer, older in zip(dates, dates[1:], strict=False)]
+    return statistics.median(gaps)
+
+
+def compute_sync_interval(feed: Feed) -> timedelta:
+    """Calcula o intervalo até a próxima sincronização, sem jitter."""
+    base = SYNC_INTERVALS.get(feed.sync_frequency, timedelta(hours=1))
+    max_interval = max(base, timedelta(hours=settings.feed_sync_max_interval_hours))
+
+    if feed.error_count:
+        # Falhas: recuo exponencial a partir do intervalo base
+        interval = base * 2 ** min(feed.error_count, MAX_BACKOFF_EXPONENT)
+    else:
+        # Buscar duas vezes por período de publicação, nunca abaixo do intervalo configurado
+        interval = base
+        if feed.publish_interval_minutes:
+            interval = max(interval, timedelta(minutes=feed.publish_interval_minutes / 2))
+        interval *= IDLE_BACKOFF_FACTOR ** min(feed.idle_sync_count, MAX_BACKOFF_EXPONENT)
+
+    return min(interval, max_interval)
+
+
+def _jitter_seconds(interval: timedelta) -> float:
+    """Deslocamento aleatório para que feeds de mesma cadência não vençam no mesmo tick."""
+    tick = settings.feed_sync_tick_minutes * 60
+    half_width = min(max(interval.total_seconds() * JITTER_RATIO, tick), interval.total_seconds() / 2)
+    return half_width * random.uniform(-1, 1)
+
+
+def schedule_next_sync(
+    feed: Feed,
+    new_articles: int,
+    publication_dates: Iterable[datetime | None] = (),
+    now: datetime | None = None,
+) -> None:
+    """
+    Atualiza cadência aprendida, contador de ociosidade e next_sync_at do feed.
+
+    Deve ser chamado após cada tentativa de sincronização, já com error_count atualizado.
+    """
+    if not settings.feed_adaptive_sync or feed.sync_frequency == SyncFrequency.MANUAL:
+        feed.next_sync_at = None
+        return
+
+    now = now or datetime.utcnow()
+
+    observed = estimate_publish_interval(publication_dates)
+    if observed:
+        if feed.publish_interval_minutes:
+            feed.publish_interval_minutes = (
+                PUBLISH_INTERVAL_EWMA_ALPHA * observed
+                + (1 - PUBLISH_INTERVAL_EWMA_ALPHA) * feed.publish_interval_minutes
+            )
+        else:
+            feed.publish_interval_minutes = observed
+
+    if not feed.error_count:
+        feed.idle_sync_count = 0 if new_articles else (feed.idle_sync_count or 0) + 1
+
+    interval = compute_sync_interval(feed)
+    feed.next_sync_at = now + interval + timedelta(seconds=_jitter_seconds(interval))
+
+
+def spread_first_sync(feed: Feed, now: datetime | None = None) -> None:
+    """
+    Agenda feeds já sincronizados que ainda não têm next_sync_at (ex.: criados antes do
+    agendamento adaptativo) num instante aleatório dentro do primeiro intervalo, em vez
+    de buscá-los todos no mesmo tick.
+    """
+    if not settings.feed_adaptive_sync or feed.sync_frequency == SyncFrequency.MANUAL:
+        return
+
+    now = now or datetime.utcnow()
+    interval = compute_sync_interval(feed)
+    feed.next_sync_at = now + timedelta(seconds=random.uniform(0, interval.total_seconds()))
@@ -10,10 +10,12 @@ from pathlib import Path
 from typing import BinaryIO
 
 import fitz  # PyMuPDF
+import httpx
 import pdfplumber
 
 from app.config import settings
 from app.core.exceptions import PDFProcessingError
+from app.core.http_client import HTTPPurpose, get_http_client
 from app.core.logging import log
 
 
@@ -23,8 +25,9 @@ class PDFService:
     MAX_FILE_SIZE = settings.max_pdf_size_mb * 1024 * 1024  # MB para bytes
     ALLOWED_MIME_TYPES = ["application/pdf"]
 
-    def __init__(self):
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
         self.upload_path = settings.pdf_upload_path
+        self.http_client = http_client
 
     async def process_pdf(
         self,
@@ -378,8 +381,6 @@ class PDFService:
         """
         from urllib.parse import urlparse
 
-        import httpx
-
         log.info(f"Baixando PDF de: {pdf_url}")
 
         # Validar URL (prevenir SSRF)
@@ -394,54 +395,47 @@ class PDFService:
             # Mas vamos tentar mesmo assim, pode ser um redirect
 
         try:
-            # Fazer download com timeout
-            async with httpx.AsyncClient(
-                timeout=60.0,  # Timeout maior para PDFs
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "application/pdf, */*",
-                },
-            ) as client:
-                response = await client.get(pdf_url)
-                response.raise_for_status()
-
-                # Verificar content-type
-                content_type = response.headers.get("content-type", "").lower()
-                if "pdf" not in content_type and not pdf_url.lower().endswith('.pdf'):
-                    log.warning(f"Content-Type não é PDF: {content_type}")
-                    # Mas vamos processar mesmo assim
-
-                # Ler conteúdo
-                content = response.content
-
-                # Validar tamanho
-                if len(content) > self.MAX_FILE_SIZE:
-                    log.error(f"PDF muito grande: {len(content)} bytes (máximo: {self.MAX_FILE_SIZE})")
-                    return None
-
-                # Validar que é um PDF válido
-                if not content.startswith(b"%PDF"):
-                    log.error("Arquivo baixado não é um PDF válido")
-                    return None
-
-                # Gerar nome de arquivo seguro
-                safe_title = re.sub(r"[^\w\-.]", "_", article_title[:100])
-                filename = f"{safe_title}.pdf"
-
-                # Processar PDF usando o método existente
-                import io
-                file_obj = io.BytesIO(content)
-                pdf_data = await self.process_pdf(file_obj, filename)
-
-                # Verificar duplicata
-                if await self.check_duplicate(pdf_data["file_hash"], db):
-                    log.info(f"PDF já existe no sistema (hash: {pdf_data['file_hash'][:8]}...)")
-                    # Retornar None para indicar que não precisa processar
-                    return None
-
-                log.info(f"PDF baixado e processado com sucesso: {pdf_data['file_path']}")
-                return pdf_data
+            # Fazer download com o cliente compartilhado de PDFs (timeout maior)
+            client = self.http_client or get_http_client(HTTPPurpose.PDF)
+            response = await client.get(pdf_url)
+            response.raise_for_status()
+
+            # Verificar content-type
+            content_type = response.headers.get("content-type", "").lower()
+            if "pdf" not in content_type and not pdf_url.lower().endswith('.pdf'):
+                log.warning(f"Content-Type não é PDF: {content_type}")
+                # Mas vamos processar mesmo assim
+
+            # Ler conteúdo
+            content = response.content
+
+            # Validar tamanho
+            if len(content) > self.MAX_FILE_SIZE:
+                log.error(f"PDF muito grande: {len(content)} bytes (máximo: {self.MAX_FILE_SIZE})")
+                return None
+
+            # Validar que é um PDF válido
+            if not content.startswith(b"%PDF"):
+                log.error("Arquivo baixado não é um PDF válido")
+                return None
+
+            # Gerar nome de arquivo seguro
+            safe_title = re.sub(r"[^\w\-.]", "_", article_title[:100])
+            filename = f"{safe_title}.pdf"
+
+            # Processar PDF usando o método existente
+            import io
+            file_obj = io.BytesIO(content)
+            pdf_data = await self.process_pdf(file_obj, filename)
+
+            # Verificar duplicata
+            if await self.check_duplicate(pdf_data["file_hash"], db):
+                log.info(f"PDF já existe no sistema (hash: {pdf_data['file_hash'][:8]}...)")
+                # Retornar None para indicar que não precisa processar
+                return None
+
+            log.info(f"PDF baixado e processado com sucesso: {pdf_data['file_path']}")
+            return pdf_data
 
         except httpx.TimeoutException:
             log.error(f"Timeout ao baixar PDF: {pdf_url}")
@@ -1,16 +1,21 @@
 """
-Serviço de busca full-text com SQLite FTS5.
+Serviço de busca full-text com SQLite FTS5 e busca semântica por embeddings.
 """
 
+import asyncio
 import re
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import func, select, text
+from sqlalchemy import case, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.core.logging import log
+from app.ml.vector_index import VectorIndex
 from app.models import Article, Category
 from app.schemas.article import ArticleResponse
+from app.services.embedding_store import default_encoder
+from app.services.semantic_index import refresh_semantic_index
 
 
 class SearchService:
@@ -30,7 +35,13 @@ class SearchService:
         offset: int = 0,
     ) -> list[ArticleResponse]:
         """Busca artigos e retorna schemas prontos para a API."""
-        if self._is_postgres():
+        if default_encoder() is not None:
+            # Full-text + vetorial; LIKE só se ambos vierem vazios (ex.: índice ainda vazio)
+            ranked = await self.search_with_ranking(query, limit=limit, offset=offset, hybrid=True)
+            article_ids = [article_id for article_id, _ in ranked]
+            if not article_ids:
+                article_ids = await self.search_like_fallback(query, limit=limit, offset=offset)
+        elif self._is_postgres():
             article_ids = await self._search_postgres_ids(query, limit=limit, offset=offset)
         else:
             article_ids = await self.search_fts5(query, limit=limit, offset=offset)
@@ -121,6 +132,57 @@ class SearchService:
             log.warning(f"FTS5 search failed: {e}")
             return []
 
+    async def search_semantic(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[int]:
+        """
+        Busca artigos por similaridade de cosseno entre o embedding da consulta e os
+        embeddings dos artigos (índice vetorial).
+
+        Retorna lista vazia se o modelo de embeddings não estiver carregado.
+
+        Returns:
+            Lista de IDs de artigos ordenados por similaridade
+        """
+        index = await self._semantic_index(query)
+        if index is None:
+            return []
+        hits = await self._vector_candidates(query, index, limit + offset)
+        return hits[offset:]
+
+    async def _semantic_index(self, query: str) -> VectorIndex | None:
+        """Índice vetorial sincronizado, ou None se a busca semântica não estiver disponível."""
+        if default_encoder() is None or not query.strip():
+            return None
+        try:
+            index = await refresh_semantic_index(self.db)
+        except Exception as e:
+            log.warning(f"Semantic index refresh failed: {e}")
+            return None
+        return index if len(index) else None
+
+    async def _vector_candidates(self, query: str, index: VectorIndex, limit: int) -> list[int]:
+        """
+        IDs mais similares à consulta, acima de semantic_search_min_score.
+
+        Não usa a sessão do banco: pode rodar em paralelo com consultas SQL.
+        """
+        encoder = default_encoder()
+        if encoder is None:
+            return []
+        try:
+            query_vector = (await encoder([query]))[0]
+            hits = await asyncio.to_thread(index.search, query_vector, limit)
+        except Exception as e:
+            log.warning(f"Semantic search failed: {e}")
+            return []
+        return [
+            article_id for article_id, score in hits if score >= settings.semantic_search_min_score
+        ]
+
     async def search_with_ranking(
         self,
         query: str,
@@ -129,13 +191,22 @@ class SearchService:
         category_id: int | None = None,
         boost_recent: bool = True,
         boost_impact: bool = True,
+        hybrid: bool = False,
     ) -> list[tuple[int, float]]:
         """
         Busca com ranking customizado.
 
+        Com hybrid=True, combina candidatos full-text e do índice vetorial por
+        reciprocal-rank fusion (ver _search_hybrid).
+
         Returns:
             Lista de tuplas (article_id, score)
         """
+        if hybrid:
+            return await self._search_hybrid(
+                query, limit, offset, category_id, boost_recent, boost_impact
+            )
+
         if self._is_postgres():
             ids = await self._search_postgres_ids(
                 query,
@@ -196,6 +267,71 @@ class SearchService:
             log.warning(f"FTS5 ranked search failed: {e}")
             return []
 
+    async def _search_hybrid(
+        self,
+        query: str,
+        limit: int,
+        offset: int,
+        category_id: int | None,
+        boost_recent: bool,
+        boost_impact: bool,
+    ) -> list[tuple[int, float]]:
+        """
+        Ranking híbrido: reciprocal-rank fusion de candidatos full-text (FTS5/tsvector)
+        e do índice vetorial, mais os boosts de destaque, recência e impacto.
+
+        Os dois conjuntos (até search_hybrid_candidates cada) são buscados em
+        paralelo; o embedding multilíngue encontra artigos em outro idioma sem o
+        fallback LIKE.
+        """
+        candidates = max(settings.search_hybrid_candidates, limit + offset)
+        # A sincronização do índice usa a sessão: antes do gather
+        index = await self._semantic_index(query)
+
+        async def no_vectors() -> list[int]:
+            return []
+
+        lexical, semantic = await asyncio.gather(
+            self.search_fts5(query, limit=candidates),
+            self._vector_candidates(query, index, candidates) if index else no_vectors(),
+        )
+
+        k = settings.search_rrf_k
+        fused: dict[int, float] = {}
+        for ranking in (lexical, semantic):
+            for rank, article_id in enumerate(ranking, 1):
+                fused[article_id] = fused.get(article_id, 0.0) + 1.0 / (k + rank)
+        if not fused:
+            return []
+
+        # Boosts na escala de uma posição no topo de uma lista (1 / (k + 1))
+        boost = case((Article.highlighted == True, 1.0), else_=0.0)
+        if boost_recent:
+            recent_date = datetime.now(UTC) - timedelta(days=30)
+            boost = boost + case((Article.publication_date > recent_date, 0.4), else_=0.0)
+        if boost_impact:
+            boost = boost + (func.coalesce(Article.impact_score, 5.0) - 5.0) * 0.06
+
+        stmt = select(Article.id, boost).where(
+            Article.id.in_(list(fused)),
+            Article.is_published == True,
+        )
+        if category_id:
+            stmt = stmt.where(Article.category_id == category_id)
+
+        result = await self.db.execute(stmt)
+        unit = 1.0 / (k + 1)
+        scored = [
+            (article_id, fused[article_id] + unit * float(extra or 0.0))
+            for article_id, extra in result.tuples().all()
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        log.debug(
+            f"Busca híbrida: {len(lexical)} candidatos full-text, {len(semantic)} vetoriais, "
+            f"{len(scored)} após filtros"
+        )
+        return scored[offset : offset + limit]
+
     async def search_like_fallback(
         self,
         query: str,
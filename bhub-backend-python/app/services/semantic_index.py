@@ -0,0 +1,119 @@
+"""
+Índice vetorial dos artigos para a busca semântica.
+
+Carregado do disco (vetores mapeados em memória) na inicialização e mantido em dia
+de forma incremental: os artigos classificados neste processo entram direto no
+índice, e os gravados por outros processos (worker ARQ, scripts) são lidos de
+article_embeddings pelo updated_at, no máximo a cada vector_index_refresh_seconds.
+Cada leitura relê a janela vector_index_sync_margin_seconds antes da última marca,
+para pegar vetores de transações que commitaram depois dela.
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.logging import log
+from app.ml.vector_index import VectorIndex
+from app.services.embedding_store import EmbeddingStore
+
+# Vetores no delta em memória a partir dos quais o índice é compactado em disco
+COMPACT_AFTER = 5000
+
+_index: VectorIndex | None = None
+_last_refresh = 0.0
+
+
+def semantic_index_dir(model_name: str | None = None) -> Path:
+    """Diretório do índice de um modelo (um índice por modelo de embeddings)."""
+    name = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name or settings.embedding_model_key)
+    return settings.vector_index_dir / name
+
+
+def _index_options() -> dict:
+    return {
+        "backend": settings.vector_index_backend,
+        "hnsw_min_size": settings.vector_index_hnsw_min_size,
+        "hnsw_ef_search": settings.vector_index_hnsw_ef_search,
+    }
+
+
+def get_semantic_index() -> VectorIndex:
+    """Retorna o índice compartilhado, carregando-o do disco na primeira chamada."""
+    global _index
+    if _index is None:
+        _index = VectorIndex.load(semantic_index_dir(), **_index_options())
+        if len(_index):
+            log.info(f"Índice vetorial carregado: {len(_index)} artigos")
+    return _index
+
+
+def add_to_semantic_index(article_ids: Sequence[int], vectors: np.ndarray) -> None:
+    """Atualiza o índice com vetores recém-calculados, se ele estiver carregado."""
+    if _index is None or not len(article_ids):
+        return
+    try:
+        _index.add(article_ids, vectors)
+    except ValueError as e:
+        log.warning(f"Vetores não adicionados ao índice semântico: {e}")
+
+
+async def refresh_semantic_index(db: AsyncSession, force: bool = False) -> VectorIndex:
+    """Lê os vetores novos ou alterados desde a última sincronização."""
+    global _last_refresh
+    index = get_semantic_index()
+    now = time.monotonic()
+    if not force and now - _last_refresh < settings.vector_index_refresh_seconds:
+        return index
+    _last_refresh = now
+
+    synced_at = index.meta.get("synced_at")
+    since = None
+    if synced_at:
+        margin = timedelta(seconds=settings.vector_index_sync_margin_seconds)
+        since = datetime.fromisoformat(synced_at) - margin
+    ids, vectors, latest = await EmbeddingStore(db).changed_since(since)
+    if ids:
+        index.add(ids, vectors)
+        index.meta["synced_at"] = latest.isoformat()
+        log.debug(f"Índice semântico sincronizado: {len(ids)} vetores")
+
+    if index.pending >= COMPACT_AFTER:
+        await save_semantic_index()
+    return index
+
+
+async def load_semantic_index() -> VectorIndex:
+    """Carrega o índice do disco e o sincroniza com o banco (inicialização)."""
+    from app.database import get_session_context
+
+    index = await asyncio.to_thread(get_semantic_index)
+    async with get_session_context() as db:
+        await refresh_semantic_index(db, force=True)
+    return index
+
+
+async def save_semantic_index() -> None:
+    """Grava o índice em disco se houver alterações."""
+    if _index is None or not _index.dirty:
+        return
+    await asyncio.to_thread(_index.save, semantic_index_dir())
+    log.info(f"Índice semântico gravado: {len(_index)} artigos")
+
+
+async def close_semantic_index() -> None:
+    """Grava e descarta o índice compartilhado."""
+    global _index, _last_refresh
+    try:
+        await save_semantic_index()
+    except OSError as e:
+        log.warning(f"Falha ao gravar índice semântico: {e}")
+    _index = None
+    _last_refresh = 0.0
@@ -0,0 +1,242 @@
+"""
+Artigos similares a partir dos embeddings.
+
+A lista dos N vizinhos mais próximos de cada artigo fica em article_neighbors e é
+servida com uma consulta pelo índice (article_id, model_name, rank). Quando novos
+artigos são classificados, suas listas são calculadas no índice vetorial e eles
+entram nas listas dos vizinhos que passam a superar. Artigos sem lista têm a sua
+calculada em memória na leitura (sem escrita durante a requisição) e a gravação
+enfileirada. Sem embeddings, vale a mesma categoria.
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.config import settings
+from app.core.logging import log
+from app.models import Article, ArticleNeighbor
+from app.services.embedding_store import EmbeddingStore
+from app.services.semantic_index import refresh_semantic_index
+
+NeighborList = list[tuple[int, float]]
+
+
+class SimilarArticlesService:
+    """Leitura e atualização incremental das listas de artigos similares."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.model_name = settings.embedding_model_key
+        self.size = max(1, settings.similar_articles_cache_size)
+
+    async def get_similar(self, article: Article, limit: int = 6) -> list[Article]:
+        """Artigos publicados mais similares, do mais ao menos similar."""
+        similar = await self._cached(article.id, limit)
+        if not similar:
+            similar = await self._computed(article.id, limit)
+        if similar:
+            return similar
+        return await self._same_category(article, limit)
+
+    async def _computed(self, article_id: int, limit: int) -> list[Article]:
+        """Vizinhos calculados no índice, sem gravar; a lista é gravada por um job."""
+        lists = await self.compute([article_id], include_incoming=False)
+        neighbors = [other for other, _ in lists.get(article_id, [])]
+        if not neighbors:
+            return []
+
+        from app.services.task_dispatcher import dispatch_refresh_similar_articles
+
+        try:
+            await dispatch_refresh_similar_articles([article_id])
+        except Exception as e:
+            log.warning(f"Falha ao enfileirar artigos similares de {article_id}: {e}")
+
+        result = await self.db.execute(
+            select(Article)
+            .where(Article.id.in_(neighbors), Article.is_published == True)
+            .options(
+                selectinload(Article.authors),
+                selectinload(Article.category),
+            )
+        )
+        by_id = {a.id: a for a in result.scalars().all()}
+        return [by_id[other] for other in neighbors if other in by_id][:limit]
+
+    async def _cached(self, article_id: int, limit: int) -> list[Article]:
+        result = await self.db.execute(
+            select(Article)
+            .join(ArticleNeighbor, ArticleNeighbor.neighbor_id == Article.id)
+            .where(
+                ArticleNeighbor.article_id == article_id,
+                ArticleNeighbor.model_name == self.model_name,
+                Article.is_published == True,
+            )
+            .options(
+                selectinload(Article.authors),
+                selectinload(Article.category),
+            )
+            .order_by(ArticleNeighbor.rank)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def _same_category(self, article: Article, limit: int) -> list[Article]:
+        """Fallback sem embeddings: artigos mais recentes da mesma categoria."""
+        if not article.category_id:
+            return []
+        result = await self.db.execute(
+            select(Article)
+            .where(
+                Article.is_published == True,
+                Article.id != article.id,
+                Article.category_id == article.category_id,
+            )
+            .options(
+                selectinload(Article.authors),
+                selectinload(Article.category),
+            )
+            .order_by(Article.publication_date.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def refresh(self, article_ids: Sequence[int]) -> int:
+        """
+        Calcula as listas dos artigos dados e as insere nas listas já existentes dos
+        seus vizinhos quando entram no top-N delas.
+
+        Returns:
+            Número de listas gravadas
+        """
+        lists = await self.compute(article_ids)
+        await self._store(lists)
+        return len(lists)
+
+    async def compute(
+        self, article_ids: Sequence[int], include_incoming: bool = True
+    ) -> dict[int, NeighborList]:
+        """
+        Listas dos artigos dados e, com include_incoming, as listas já gravadas dos
+        vizinhos em que eles passam a entrar. Nada é gravado no banco.
+        """
+        found, vectors = await EmbeddingStore(self.db).get_many(article_ids)
+        if not found:
+            return {}
+
+        index = await refresh_semantic_index(self.db)
+        # Garante os vetores dos próprios artigos no índice, mesmo antes da sincronização
+        absent = [i for i, article_id in enumerate(found) if article_id not in index]
+        if absent:
+            index.add([found[i] for i in absent], vectors[absent])
+        hits = await asyncio.to_thread(index.search_many, vectors, self.size + 1)
+
+        # O índice pode ainda conter artigos removidos do banco
+        candidates = {other for row in hits for other, _ in row}
+        result = await self.db.execute(select(Article.id).where(Article.id.in_(candidates)))
+        existing = set(result.scalars().all())
+        if missing := candidates - existing:
+            index.remove(list(missing))
+
+        lists: dict[int, NeighborList] = {
+            article_id: [
+                (other, score) for other, score in row if other != article_id and other in existing
+            ][: self.size]
+            for article_id, row in zip(found, hits, strict=True)
+        }
+        if not include_incoming:
+            return lists
+
+        # Similaridade é simétrica: o artigo novo é candidato na lista de cada vizinho
+        incoming: dict[int, NeighborList] = {}
+        for article_id, neighbors in lists.items():
+            for other, score in neighbors:
+                if other not in lists:
+                    incoming.setdefault(other, []).append((article_id, score))
+
+        for other, current in (await self._load_lists(list(incoming))).items():
+            merged = dict(current)
+            merged.update(incoming[other])
+            ranked = sorted(merged.items(), key=lambda item: item[1], reverse=True)[: self.size]
+            if ranked != current:
+                lists[other] = ranked
+
+        log.debug(
+            f"Artigos similares: {len(found)} listas calculadas, "
+            f"{len(lists) - len(found)} atualizadas"
+        )
+        return lists
+
+    async def _load_lists(self, article_ids: list[int]) -> dict[int, NeighborList]:
+        """Listas já gravadas (artigos sem lista ficam de fora)."""
+        if not article_ids:
+            return {}
+        result = await self.db.execute(
+            select(ArticleNeighbor.article_id, ArticleNeighbor.neighbor_id, ArticleNeighbor.score)
+            .where(
+                ArticleNeighbor.model_name == self.model_name,
+                ArticleNeighbor.article_id.in_(article_ids),
+            )
+            .order_by(ArticleNeighbor.article_id, ArticleNeighbor.rank)
+        )
+        lists: dict[int, NeighborList] = {}
+        for article_id, neighbor_id, score in result.tuples().all():
+            lists.setdefault(article_id, []).append((neighbor_id, score))
+        return lists
+
+    async def _store(self, lists: dict[int, NeighborList]) -> None:
+        """
+        Substitui as listas dos artigos dados. Upsert por (artigo, modelo, vizinho):
+        gravações concorrentes da mesma lista não violam a chave única.
+        """
+        if not lists:
+            return
+        await self.db.execute(
+            delete(ArticleNeighbor).where(
+                ArticleNeighbor.model_name == self.model_name,
+                ArticleNeighbor.article_id.in_(list(lists)),
+            )
+        )
+        rows = [
+            {
+                "article_id": article_id,
+                "neighbor_id": neighbor_id,
+                "model_name": self.model_name,
+                "rank": rank,
+                "score": score,
+            }
+            for article_id, neighbors in lists.items()
+            for rank, (neighbor_id, score) in enumerate(neighbors)
+        ]
+        if not rows:
+            return
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(ArticleNeighbor.__table__)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["article_id", "model_name", "neighbor_id"],
+                set_={"rank": stmt.excluded.rank, "score": stmt.excluded.score},
+            ),
+            rows,
+        )
+
+
+async def refresh_similar_articles(db: AsyncSession, article_ids: Sequence[int]) -> None:
+    """Atualiza as listas de artigos similares sem interromper quem chamou em caso de erro."""
+    if not article_ids:
+        return
+    try:
+        # Savepoint: um erro desfaz só as listas e a transação de quem chamou segue válida
+        async with db.begin_nested():
+            await SimilarArticlesService(db).refresh(article_ids)
+    except Exception as e:
+        log.warning(f"Falha ao atualizar artigos similares: {e}")
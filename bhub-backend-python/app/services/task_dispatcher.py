@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from app.config import settings
@@ -12,6 +13,98 @@ from app.core.logging import log
 _arq_pool: Any | None = None
 
 
+class LocalTaskQueue:
+    """
+    Fila em processo para o fallback sem ARQ.
+
+    Um número fixo de workers consome a fila; com a fila cheia, submit() aguarda
+    (backpressure) em vez de criar tasks sem limite.
+    """
+
+    def __init__(self, workers: int, maxsize: int) -> None:
+        self.workers = max(1, workers)
+        self.maxsize = max(1, maxsize)
+        self._queue: asyncio.Queue | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_started(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        # Fila e workers pertencem ao loop que os criou (scripts/testes criam loops novos)
+        if self._queue is None or loop is not self._loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._tasks = [
+                loop.create_task(self._worker(self._queue), name=f"local-task-worker-{i}")
+                for i in range(self.workers)
+            ]
+        return self._queue
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            func, args = await queue.get()
+            try:
+                await func(*args)
+            except Exception as e:
+                log.error(f"Erro em tarefa local {getattr(func, '__name__', func)}: {e}")
+            finally:
+                queue.task_done()
+
+    async def submit(self, func: Callable[..., Awaitable[Any]], *args: Any) -> None:
+        """Enfileira func(*args); aguarda se a fila estiver cheia."""
+        await self._ensure_started().put((func, args))
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def join(self) -> None:
+        """Aguarda o processamento de tudo que já foi enfileirado."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Drena a fila (até timeout) e encerra os workers."""
+        if self._queue is None:
+            return
+        if self._loop is asyncio.get_running_loop():
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except TimeoutError:
+                log.warning(f"Fila local encerrada com {self._queue.qsize()} tarefas pendentes")
+        for task in self._tasks:
+            task.cancel()
+        if self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+
+
+_local_queue: LocalTaskQueue | None = None
+
+
+def get_local_queue() -> LocalTaskQueue:
+    """Retorna a fila local compartilhada, criada sob demanda."""
+    global _local_queue
+    if _local_queue is None:
+        _local_queue = LocalTaskQueue(settings.local_task_workers, settings.local_task_queue_size)
+    return _local_queue
+
+
+async def close_local_queue() -> None:
+    """Drena e encerra a fila local, se tiver sido criada."""
+    global _local_queue
+    if _local_queue is None:
+        return
+    await _local_queue.close()
+    _local_queue = None
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    size = max(1, size)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
 async def get_arq_pool() -> Any:
     """Retorna o pool ARQ inicializado sob demanda."""
     global _arq_pool
@@ -45,7 +138,7 @@ async def close_arq_pool() -> None:
 
 
 async def dispatch_classify_article(article_id: int) -> str:
-    """Enfileira classificação e retorna job_id; em dev/test, cai para task local."""
+    """Enfileira classificação e retorna job_id; em dev/test, usa o worker local."""
     if settings.enable_arq:
         try:
             pool = await get_arq_pool()
@@ -58,14 +151,46 @@ async def dispatch_classify_article(article_id: int) -> str:
         except Exception as e:
             log.warning(f"Falha ao enfileirar classificação no ARQ; usando fallback local: {e}")
 
-    from app.services.background_tasks import classify_article_task
+    from app.services.classification_worker import get_classification_batcher
 
-    asyncio.create_task(classify_article_task(article_id))
+    await get_classification_batcher().submit([article_id])
     return f"local-classify-{article_id}"
 
 
+async def dispatch_classify_articles(article_ids: list[int]) -> list[str]:
+    """
+    Enfileira a classificação de vários artigos.
+
+    Com ARQ, um job por lote de settings.task_dispatch_batch_size IDs; sem ARQ,
+    os artigos vão para o worker local de classificação em micro-lotes. Retorna os job_ids.
+    """
+    if not article_ids:
+        return []
+
+    article_ids = list(article_ids)
+    job_ids: list[str] = []
+    enqueued = 0
+    if settings.enable_arq:
+        try:
+            pool = await get_arq_pool()
+            for chunk in _chunks(article_ids, settings.task_dispatch_batch_size):
+                job = await pool.enqueue_job("task_classify_articles", chunk, _defer_by=2)
+                job_ids.append(job.job_id)
+                enqueued += len(chunk)
+            return job_ids
+        except Exception as e:
+            log.warning(f"Falha ao enfileirar classificação no ARQ; usando fallback local: {e}")
+
+    from app.services.classification_worker import get_classification_batcher
+
+    # Lotes já enfileirados no ARQ não são classificados de novo localmente
+    pending = article_ids[enqueued:]
+    await get_classification_batcher().submit(pending)
+    return job_ids + [f"local-classify-{article_id}" for article_id in pending]
+
+
 async def dispatch_download_pdf(article_id: int, pdf_url: str | None = None) -> str:
-    """Enfileira download de PDF e retorna job_id; em dev/test, cai para task local."""
+    """Enfileira download de PDF e retorna job_id; em dev/test, usa a fila local."""
     if settings.enable_arq:
         try:
             pool = await get_arq_pool()
@@ -76,5 +201,71 @@ async def dispatch_download_pdf(article_id: int, pdf_url: str | None = None) ->
 
     from app.services.background_tasks import download_pdf_task
 
-    asyncio.create_task(download_pdf_task(article_id))
+    await get_local_queue().submit(download_pdf_task, article_id)
     return f"local-pdf-{article_id}"
+
+
+async def dispatch_download_pdfs(items: list[tuple[int, str | None]]) -> list[str]:
+    """Enfileira downloads de PDF de vários artigos (article_id, pdf_url); retorna os job_ids."""
+    if not items:
+        return []
+
+    items = list(items)
+    job_ids: list[str] = []
+    enqueued = 0
+    if settings.enable_arq:
+        try:
+            pool = await get_arq_pool()
+            for chunk in _chunks(items, settings.task_dispatch_batch_size):
+                job = await pool.enqueue_job("task_download_pdfs", [list(item) for item in chunk])
+                job_ids.append(job.job_id)
+                enqueued += len(chunk)
+            return job_ids
+        except Exception as e:
+            log.warning(f"Falha ao enfileirar download no ARQ; usando fallback local: {e}")
+
+    from app.services.background_tasks import download_pdf_task
+
+    # Só os lotes que não entraram no ARQ vão para a fila local
+    pending = items[enqueued:]
+    queue = get_local_queue()
+    for article_id, _pdf_url in pending:
+        await queue.submit(download_pdf_task, article_id)
+    return job_ids + [f"local-pdf-{article_id}" for article_id, _ in pending]
+
+
+async def dispatch_scrape_authors(article_ids: list[int]) -> str:
+    """Enfileira o fallback de autores via scraping de um lote de artigos."""
+    if settings.enable_arq:
+        try:
+            pool = await get_arq_pool()
+            job = await pool.enqueue_job("task_scrape_authors", list(article_ids))
+            return job.job_id
+        except Exception as e:
+            log.warning(f"Falha ao enfileirar scraping de autores no ARQ; usando fallback local: {e}")
+
+    from app.services.background_tasks import scrape_authors_task
+
+    await get_local_queue().submit(scrape_authors_task, list(article_ids))
+    return f"local-authors-{article_ids[0] if article_ids else 0}"
+
+
+async def dispatch_refresh_similar_articles(article_ids: list[int]) -> str:
+    """Enfileira a gravação das listas de artigos similares (um job por conjunto de IDs)."""
+    if settings.enable_arq:
+        try:
+            pool = await get_arq_pool()
+            # job_id fixo: leituras repetidas antes do job rodar não duplicam o trabalho
+            job = await pool.enqueue_job(
+                "task_refresh_similar_articles",
+                list(article_ids),
+                _job_id=f"similar-{'-'.join(map(str, article_ids))}",
+            )
+            return job.job_id if job else f"similar-{article_ids[0]}"
+        except Exception as e:
+            log.warning(f"Falha ao enfileirar artigos similares no ARQ; usando fallback local: {e}")
+
+    from app.services.background_tasks import refresh_similar_articles_task
+
+    await get_local_queue().submit(refresh_similar_articles_task, list(article_ids))
+    return f"local-similar-{article_ids[0] if article_ids else 0}"
@@ -14,6 +14,7 @@ from dateutil import parser as date_parser
 from selectolax.parser import HTMLParser
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from app.core.http_client import HTTPPurpose, get_http_client
 from app.core.logging import log
 from app.models import SourceType
 
@@ -92,19 +93,13 @@ class WebScrapingService:
         ".date",
     ]
 
-    def __init__(self):
-        # Timeout reduzido para prevenir DoS
-        # Limitar redirects para prevenir loops
-        self.client = httpx.AsyncClient(
-            timeout=10.0,  # Reduzido de 30s para 10s
-            follow_redirects=True,
-            max_redirects=5,  # Limitar número de redirects
-            headers=self.BROWSER_HEADERS,
-        )
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
+        # Cliente compartilhado de scraping: timeout curto e redirects limitados
+        # (ver app/core/http_client.py); o registro é dono do ciclo de vida
+        self.client = http_client or get_http_client(HTTPPurpose.SCRAPING)
 
     async def close(self):
-        """Fecha o cliente HTTP."""
-        await self.client.aclose()
+        """Mantido por compatibilidade: o cliente compartilhado é fechado no shutdown."""
 
     def _validate_url(self, url: str) -> None:
         """
@@ -195,7 +190,9 @@ class WebScrapingService:
 
         # Fazer requisição com timeout curto
         try:
-            response = await self.client.get(url, timeout=10.0)  # Timeout de 10 segundos
+            response = await self.client.get(
+                url, headers=self.BROWSER_HEADERS, timeout=10.0
+            )  # Timeout de 10 segundos
             response.raise_for_status()
         except httpx.TimeoutException:
             raise ValueError("Timeout ao acessar URL (máximo 10 segundos)")
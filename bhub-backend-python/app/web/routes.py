@@ -14,7 +14,6 @@ from sqlalchemy.orm import selectinload
 
 from app.api.deps import DBSession
 from app.core.csrf import CSRFValid, get_csrf_token
-from app.core.logging import log
 from app.core.security import CurrentUserOptional
 from app.models import Article, Category, ContactMessage, SourceType
 from app.services import SearchService
@@ -83,31 +82,9 @@ async def _fetch_articles(db: DBSession, filters: ArticleFilters) -> tuple[list[
     if filters.search:
         search_service = SearchService(db)
 
-        # Semantic search using embeddings
+        # Semantic search: top-k cosine over the article embedding index
         if filters.search_type == "semantic":
-            try:
-                from app.ml import EmbeddingClassifier
-                if EmbeddingClassifier.is_initialized():
-                    # Use category classification as semantic search
-                    # Classify the search query to find relevant category
-                    category_slug, confidence = await EmbeddingClassifier.classify(filters.search)
-                    if confidence > 0.3:
-                        # Find category by slug
-                        cat_result = await db.execute(
-                            select(Category.id).where(Category.slug == category_slug)
-                        )
-                        cat_id = cat_result.scalar_one_or_none()
-                        if cat_id:
-                            # Add category filter for semantic search
-                            if not filters.category_ids:
-                                # If no category filter already, use semantic category
-                                stmt = stmt.where(Article.category_id == cat_id)
-                            # Also do text search for better results
-                            article_ids = await search_service.search_fts5(filters.search, limit=1000)
-                            if not article_ids:
-                                article_ids = await search_service.search_like_fallback(filters.search, limit=1000)
-            except Exception as e:
-                log.warning(f"Semantic search failed, falling back to text search: {e}")
+            article_ids = await search_service.search_semantic(filters.search, limit=1000) or None
 
         # Text search (FTS5 or LIKE fallback)
         if filters.search_type == "text" or article_ids is None:
@@ -634,23 +611,9 @@ async def article_detail(
     await db.commit()
     await db.refresh(article)
 
-    similar_articles: list[Article] = []
-    if article.category_id:
-        similar_result = await db.execute(
-            select(Article)
-            .where(
-                Article.is_published == True,
-                Article.id != article_id,
-                Article.category_id == article.category_id,
-            )
-            .options(
-                selectinload(Article.authors),
-                selectinload(Article.category),
-            )
-            .order_by(Article.publication_date.desc())
-            .limit(6)
-        )
-        similar_articles = list(similar_result.scalars().all())
+    from app.services.similar_articles import SimilarArticlesService
+
+    similar_articles = await SimilarArticlesService(db).get_similar(article, limit=6)
 
     base_url = str(request.base_url).rstrip("/")
 
@@ -0,0 +1,215 @@
+"""
+Benchmark dos backends de inferência de embeddings (torch, onnx, onnx-int8).
+
+Cada backend roda num subprocesso próprio, para que a memória (RSS) de um não
+contamine a do outro. Para cada um são medidos: tempo de carga, RSS após carregar
+e após encodar, latência de um texto (p50/p95) e vazão em lote, usando os
+títulos/abstracts das fixtures de tests/fixtures/feeds.
+
+A compatibilidade é comparada com o primeiro backend da lista (referência):
+similaridade de cosseno entre os embeddings dos mesmos textos e concordância da
+categoria atribuída, tanto com as categorias do próprio backend quanto com os
+vetores de categoria da referência.
+
+Uso:
+    python -m scripts.benchmark_embeddings
+    python -m scripts.benchmark_embeddings --backends torch onnx-int8 --threads 2 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, ".")
+
+import numpy as np
+
+from app.ml.embedding_backends import BACKENDS
+from app.ml.similarity import normalize_rows
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "feeds"
+
+
+def load_texts(limit: int | None = None) -> list[str]:
+    """Título + resumo das entradas das fixtures de feeds."""
+    import feedparser
+
+    texts = []
+    for path in sorted(FIXTURES_DIR.glob("*.xml")):
+        for entry in feedparser.parse(path.read_bytes()).entries:
+            text = " ".join(filter(None, [entry.get("title"), entry.get("summary")]))
+            if text:
+                texts.append(text)
+    return texts[:limit] if limit else texts
+
+
+def current_rss_mb() -> float:
+    """RSS atual do processo em MB (/proc; ru_maxrss como aproximação fora do Linux)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_worker(backend: str, threads: int, repeats: int, limit: int | None, output: str) -> dict:
+    """Mede um backend no processo atual e grava os embeddings em output (.npz)."""
+    from app.core.logging import log
+    from app.ml.embedding_backends import load_sentence_transformer
+    from app.ml.embedding_classifier import EmbeddingClassifier
+    from app.models.category import DEFAULT_CATEGORIES
+
+    log.remove()
+    texts = load_texts(limit)
+    rss_start = current_rss_mb()
+
+    start = time.perf_counter()
+    model = load_sentence_transformer(backend=backend, threads=threads)
+    load_seconds = time.perf_counter() - start
+    rss_loaded = current_rss_mb()
+
+    def encode(batch: list[str]) -> np.ndarray:
+        return np.asarray(
+            model.encode(batch, convert_to_numpy=True, normalize_embeddings=True),
+            dtype=np.float32,
+        )
+
+    encode(texts[:8])  # aquecimento
+
+    latencies = []
+    for i in range(repeats):
+        text = texts[i % len(texts)]
+        start = time.perf_counter()
+        encode([text])
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    embeddings = encode(texts)
+    batch_seconds = time.perf_counter() - start
+
+    categories = encode(EmbeddingClassifier.category_texts(DEFAULT_CATEGORIES))
+    np.savez(output, embeddings=embeddings, categories=categories)
+
+    latencies.sort()
+    return {
+        "backend": backend,
+        "threads": threads,
+        "texts": len(texts),
+        "dim": int(embeddings.shape[1]),
+        "load_seconds": load_seconds,
+        "latency_p50_ms": statistics.median(latencies),
+        "latency_p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "texts_per_second": len(texts) / batch_seconds if batch_seconds else 0.0,
+        "rss_base_mb": rss_start,
+        "rss_loaded_mb": rss_loaded,
+        "rss_peak_mb": current_rss_mb(),
+    }
+
+
+def compare(reference: dict[str, np.ndarray], other: dict[str, np.ndarray]) -> dict:
+    """Compatibilidade dos embeddings de um backend com os da referência."""
+    ref_texts, ref_categories = reference["embeddings"], reference["categories"]
+    texts, categories = other["embeddings"], other["categories"]
+    cosine = np.sum(normalize_rows(ref_texts) * normalize_rows(texts), axis=1)
+
+    ref_labels = np.argmax(ref_texts @ ref_categories.T, axis=1)
+    own_labels = np.argmax(texts @ categories.T, axis=1)
+    # Embeddings do backend contra os vetores de categoria da referência (já armazenados)
+    cross_labels = np.argmax(texts @ ref_categories.T, axis=1)
+    return {
+        "cosine_mean": float(cosine.mean()),
+        "cosine_min": float(cosine.min()),
+        "category_agreement": float(np.mean(own_labels == ref_labels)),
+        "category_agreement_reference_vectors": float(np.mean(cross_labels == ref_labels)),
+    }
+
+
+def run_benchmark(
+    backends: list[str], threads: int = 0, repeats: int = 50, limit: int | None = None
+) -> dict:
+    """Roda cada backend num subprocesso e compara com o primeiro."""
+    results = []
+    vectors: dict[str, dict[str, np.ndarray]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in backends:
+            output = os.path.join(tmp, f"{backend}.npz")
+            cmd = [
+                sys.executable, "-m", "scripts.benchmark_embeddings",
+                "--worker", backend,
+                "--threads", str(threads),
+                "--repeats", str(repeats),
+                "--output", output,
+            ]
+            if limit:
+                cmd += ["--limit", str(limit)]
+            proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            if proc.returncode != 0:
+                results.append({"backend": backend, "error": proc.stderr.strip()[-2000:]})
+                continue
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+            with np.load(output) as data:
+                vectors[backend] = {key: data[key] for key in data.files}
+
+    reference = backends[0]
+    if reference in vectors:
+        for result in results:
+            if result["backend"] in vectors and "error" not in result:
+                result["compatibility"] = compare(vectors[reference], vectors[result["backend"]])
+    return {"reference": reference, "results": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dos backends de embeddings")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--threads", type=int, default=0, help="threads de inferência (0 = padrão)")
+    parser.add_argument("--repeats", type=int, default=50, help="encodes de um texto para a latência")
+    parser.add_argument("--limit", type=int, default=None, help="máximo de textos das fixtures")
+    parser.add_argument("--json", action="store_true", help="imprime o resumo em JSON")
+    parser.add_argument("--worker", choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_worker(args.worker, args.threads, args.repeats, args.limit, args.output)
+        print(json.dumps(result))
+        return 0
+
+    summary = run_benchmark(args.backends, args.threads, args.repeats, args.limit)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(f"referência: {summary['reference']}")
+    for r in summary["results"]:
+        if "error" in r:
+            print(f"  {r['backend']}: erro\n{r['error']}")
+            continue
+        print(
+            f"  {r['backend']:<10} carga {r['load_seconds']:.1f}s | "
+            f"latência p50 {r['latency_p50_ms']:.1f}ms p95 {r['latency_p95_ms']:.1f}ms | "
+            f"{r['texts_per_second']:.1f} textos/s | "
+            f"RSS {r['rss_loaded_mb'] - r['rss_base_mb']:.0f}MB modelo, {r['rss_peak_mb']:.0f}MB pico"
+        )
+        c = r.get("compatibility")
+        if c and r["backend"] != summary["reference"]:
+            print(
+                f"             cosseno médio {c['cosine_mean']:.4f} (mín {c['cosine_min']:.4f}) | "
+                f"mesma categoria {c['category_agreement']:.1%}, "
+                f"com vetores da referência {c['category_agreement_reference_vectors']:.1%}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
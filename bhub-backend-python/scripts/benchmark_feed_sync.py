@@ -0,0 +1,274 @@
+"""
+Benchmark de ingestão de feeds.
+
+Reproduz os feeds gravados em tests/fixtures/feeds, servidos por um servidor HTTP
+local, através do FeedAggregatorService contra um SQLite temporário e reporta
+artigos/segundo e o tempo por etapa da sincronização.
+
+Cada rodada usa um banco novo e executa duas passagens:
+- fria: todos os artigos são novos (fetch, parse, dedup, insert, commit);
+- quente: os mesmos feeds de novo (304 via ETag, ou dedup completo com --no-etag).
+
+As tarefas de background (classificação, PDF, autores) não são disparadas:
+o benchmark mede apenas a ingestão.
+
+Uso:
+    python -m scripts.benchmark_feed_sync
+    python -m scripts.benchmark_feed_sync --rounds 5 --copies 4 --json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, ".")
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401 - registra os modelos no metadata
+from app.config import settings
+from app.core.http_client import close_http_clients
+from app.core.logging import log
+from app.database import Base
+from app.models import Article, Feed
+from app.services import feed_aggregator
+from app.services.feed_aggregator import FeedAggregatorService
+from app.services.feed_parsing import parse_feed_document, run_in_parse_executor
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "feeds"
+
+# Prefixos DOI (10.NNNN/) reescritos em cada cópia para que não colidam no índice único
+_DOI_PREFIX = re.compile(rb"10\.(\d{4})/")
+
+
+def load_fixtures(copies: int = 1) -> dict[str, bytes]:
+    """Carrega as fixtures como path -> conteúdo, com N cópias de DOIs distintos."""
+    documents: dict[str, bytes] = {}
+    for path in sorted(FIXTURES_DIR.glob("*.xml")):
+        content = path.read_bytes()
+        for copy in range(copies):
+            body = content if copy == 0 else _DOI_PREFIX.sub(rb"10.\g<1>%d/" % copy, content)
+            documents[f"/{copy}/{path.name}"] = body
+    return documents
+
+
+@contextmanager
+def stub_feed_server(documents: dict[str, bytes], conditional: bool = True):
+    """Serve os documentos em 127.0.0.1 numa thread; retorna a URL base."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = documents.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            if conditional and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            if conditional:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+async def _skip_dispatch(*_args, **_kwargs) -> str:
+    return "benchmark"
+
+
+@contextmanager
+def background_jobs_disabled():
+    """Substitui os dispatchers de jobs usados pela sincronização por no-ops."""
+    names = ["dispatch_classify_articles", "dispatch_download_pdfs", "dispatch_scrape_authors"]
+    originals = {name: getattr(feed_aggregator, name) for name in names}
+    for name in names:
+        setattr(feed_aggregator, name, _skip_dispatch)
+    try:
+        yield
+    finally:
+        for name, original in originals.items():
+            setattr(feed_aggregator, name, original)
+
+
+def _sum_stages(results) -> dict[str, float]:
+    totals: dict[str, float] = {}
+    for result in results:
+        for stage, seconds in result.stage_timings.items():
+            totals[stage] = totals.get(stage, 0.0) + seconds
+    return totals
+
+
+async def run_round(base_url: str, paths: list[str], concurrency: int) -> dict:
+    """Executa uma rodada (passagem fria + quente) num SQLite temporário."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            async with session_factory() as db:
+                for path in paths:
+                    db.add(Feed(name=path.strip("/"), feed_url=base_url + path))
+                await db.commit()
+
+                service = FeedAggregatorService(db, session_factory=session_factory)
+
+                start = time.perf_counter()
+                cold = await service.sync_all_active_feeds(concurrency=concurrency)
+                cold_seconds = time.perf_counter() - start
+
+                # Forçar nova sincronização de todos os feeds
+                await db.execute(update(Feed).values(next_sync_at=None, last_sync_at=None))
+                await db.commit()
+
+                start = time.perf_counter()
+                warm = await service.sync_all_active_feeds(concurrency=concurrency)
+                warm_seconds = time.perf_counter() - start
+
+                stored = await db.scalar(select(func.count()).select_from(Article))
+        finally:
+            await engine.dispose()
+
+    failures = [e for r in cold.results + warm.results for e in r.errors]
+    return {
+        "feeds": cold.total_feeds,
+        "articles": cold.new_articles,
+        "stored": stored,
+        "cold_seconds": cold_seconds,
+        "articles_per_second": cold.new_articles / cold_seconds if cold_seconds else 0.0,
+        "cold_stages": _sum_stages(cold.results),
+        "warm_seconds": warm_seconds,
+        "warm_not_modified": sum(1 for r in warm.results if r.not_modified),
+        "warm_stages": _sum_stages(warm.results),
+        "errors": failures,
+    }
+
+
+async def run_benchmark(
+    rounds: int = 3,
+    copies: int = 1,
+    concurrency: int = 1,
+    conditional: bool = True,
+) -> dict:
+    """Executa o benchmark completo e retorna o resumo das rodadas."""
+    documents = load_fixtures(copies)
+    # Todos os feeds vêm do mesmo host: o limite por host não deve mascarar a concorrência
+    per_host_limit = settings.feed_sync_per_host_limit
+    settings.feed_sync_per_host_limit = max(per_host_limit, concurrency)
+    try:
+        # Aquecer o executor de parsing para não medir o spawn dos processos
+        await run_in_parse_executor(parse_feed_document, next(iter(documents.values())), 0)
+
+        with stub_feed_server(documents, conditional) as base_url, background_jobs_disabled():
+            results = [
+                await run_round(base_url, list(documents), concurrency) for _ in range(rounds)
+            ]
+    finally:
+        settings.feed_sync_per_host_limit = per_host_limit
+        await close_http_clients()
+
+    throughput = [r["articles_per_second"] for r in results]
+    return {
+        "rounds": results,
+        "parse_executor": settings.feed_parse_executor,
+        "concurrency": concurrency,
+        "median_articles_per_second": statistics.median(throughput),
+        "best_articles_per_second": max(throughput),
+        "median_warm_seconds": statistics.median(r["warm_seconds"] for r in results),
+    }
+
+
+def _format_stages(stages: dict[str, float]) -> str:
+    return " ".join(f"{stage}={seconds * 1000:.0f}ms" for stage, seconds in stages.items())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de ingestão de feeds")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--copies", type=int, default=1, help="cópias de cada fixture")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument(
+        "--parse-executor",
+        choices=["process", "thread", "inline"],
+        default=settings.feed_parse_executor,
+    )
+    parser.add_argument(
+        "--no-etag", action="store_true", help="sem 304: a passagem quente refaz o dedup"
+    )
+    parser.add_argument("--json", action="store_true", help="imprime o resumo em JSON")
+    parser.add_argument("--verbose", action="store_true", help="mantém os logs da sincronização")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        log.remove()
+        log.add(sys.stderr, level="WARNING")
+
+    settings.feed_parse_executor = args.parse_executor
+    summary = asyncio.run(
+        run_benchmark(args.rounds, args.copies, args.concurrency, not args.no_etag)
+    )
+
+    from app.services.feed_parsing import shutdown_parse_executor
+
+    shutdown_parse_executor()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(
+        f"executor={summary['parse_executor']} concurrency={summary['concurrency']} "
+        f"rounds={len(summary['rounds'])}"
+    )
+    for i, r in enumerate(summary["rounds"], 1):
+        print(
+            f"  #{i}: {r['articles']} artigos de {r['feeds']} feeds em {r['cold_seconds']:.3f}s "
+            f"({r['articles_per_second']:.1f} artigos/s) [{_format_stages(r['cold_stages'])}]"
+        )
+        print(
+            f"      quente: {r['warm_seconds']:.3f}s, {r['warm_not_modified']} x 304 "
+            f"[{_format_stages(r['warm_stages'])}]"
+        )
+        for error in r["errors"]:
+            print(f"      erro: {error}")
+    print(
+        f"mediana: {summary['median_articles_per_second']:.1f} artigos/s, "
+        f"melhor: {summary['best_articles_per_second']:.1f} artigos/s, "
+        f"quente: {summary['median_warm_seconds']:.3f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,9 +15,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import async_session_maker
-from app.models import Article, Category
+from app.models import Article, Category, DEFAULT_CATEGORIES
 from app.ai.manager import AIManager
 from app.services.classification_service import ClassificationService
+from app.services.embedding_store import EmbeddingStore
 
 
 async def get_articles_to_reclassify(db: AsyncSession) -> list[Article]:
@@ -32,10 +33,34 @@ async def get_articles_to_reclassify(db: AsyncSession) -> list[Article]:
     return list(result.scalars().all())
 
 
+async def load_article_embeddings(db: AsyncSession, articles: list[Article]) -> dict:
+    """
+    Carrega o classificador de embeddings (se instalado) e os vetores dos artigos.
+
+    Vetores já armazenados são reaproveitados; só os ausentes ou desatualizados
+    são calculados e gravados.
+    """
+    try:
+        from app.ml import EmbeddingClassifier
+
+        if EmbeddingClassifier is None:
+            return {}
+        await EmbeddingClassifier.load_category_embeddings(DEFAULT_CATEGORIES)
+    except Exception as e:
+        print(f"⚠️  Classificador de embeddings indisponível: {e}")
+        return {}
+
+    ids, vectors = await EmbeddingStore(db).ensure_for_articles([a.id for a in articles])
+    await db.commit()
+    print(f"🧮 Embeddings disponíveis para {len(ids)} artigos")
+    return dict(zip(ids, vectors, strict=True))
+
+
 async def reclassify_article(
     db: AsyncSession,
     article: Article,
     ai_manager: AIManager,
+    embedding=None,
 ) -> tuple[str, str, float]:
     """
     Reclassifica um artigo e retorna (categoria_antiga, categoria_nova, confiança).
@@ -64,6 +89,7 @@ async def reclassify_article(
         text=classification_text,
         ai_manager=ai_manager,
         min_confidence=0.3,
+        embedding=embedding,
     )
 
     if not category_slugs_with_confidence:
@@ -128,6 +154,8 @@ async def main():
             print("Operação cancelada.")
             return
 
+        embeddings = await load_article_embeddings(db, articles)
+
         print()
         print("-" * 70)
 
@@ -137,7 +165,9 @@ async def main():
         for article in articles:
             print(f"\n📄 Artigo #{article.id}: {article.title[:60]}...")
 
-            old_slug, new_slug, confidence = await reclassify_article(db, article, ai_manager)
+            old_slug, new_slug, confidence = await reclassify_article(
+                db, article, ai_manager, embeddings.get(article.id)
+            )
 
             if old_slug != new_slug:
                 print(f"   🔄 {old_slug} → {new_slug} (confiança: {confidence:.2f})")
@@ -186,6 +216,8 @@ async def batch_reclassify():
             print("✅ Nenhum artigo para reclassificar!")
             return
 
+        embeddings = await load_article_embeddings(db, articles)
+
         changed = 0
         kept = 0
         errors = 0
@@ -194,7 +226,9 @@ async def batch_reclassify():
             print(f"[{i}/{len(articles)}] Artigo #{article.id}: {article.title[:50]}...", end=" ")
 
             try:
-                old_slug, new_slug, confidence = await reclassify_article(db, article, ai_manager)
+                old_slug, new_slug, confidence = await reclassify_article(
+                    db, article, ai_manager, embeddings.get(article.id)
+                )
 
                 if old_slug != new_slug and confidence >= 0.5:
                     if await update_article_category(db, article, new_slug, confidence):
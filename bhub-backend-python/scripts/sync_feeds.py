@@ -6,6 +6,7 @@ import asyncio
 import sys
 sys.path.insert(0, ".")
 
+from app.core.http_client import close_http_clients
 from app.core.logging import setup_logging, log
 from app.database import get_session_context, init_db
 from app.services import FeedAggregatorService
@@ -49,6 +50,7 @@ async def sync_all_feeds():
 
         finally:
             await service.close()
+            await close_http_clients()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+import json
+
+import httpx
+import pytest
+
+
+def _completion(content: dict) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": json.dumps(content)}}]})
+
+
+@pytest.mark.asyncio
+async def test_deepseek_batch_retries_only_malformed_items(monkeypatch):
+    from app.ai.manager import DeepSeekService
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "deepseek_api_key", "test-key")
+    monkeypatch.setattr(settings, "ai_classify_batch_size", 3)
+    prompts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(request.content)["messages"][0]["content"]
+        prompts.append(prompt)
+        if "[1] Título:" in prompt:
+            # Item 2 com categoria inválida, item 3 ausente
+            return _completion(
+                {
+                    "results": [
+                        {"id": 1, "category": "educacao", "confidence": 0.9},
+                        {"id": 2, "category": "???", "confidence": 0.7},
+                    ]
+                }
+            )
+        return _completion({"category": "autismo", "confidence": 0.8})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = DeepSeekService(http_client=client)
+        results = await service.classify_batch(
+            ["Ensino na escola", "Texto dois", "Texto três", "Vivências autistas"]
+        )
+
+    assert results == [
+        ("educacao", 0.9),
+        ("autismo", 0.8),
+        ("autismo", 0.8),
+        ("autismo", 0.8),
+    ]
+    # Um lote de 3, duas reclassificações individuais e o último item (lote de 1) sozinho
+    assert len(prompts) == 4
+    assert "[3] Título: Texto três" in prompts[0]
+
+
+def test_deepseek_parse_batch_response_ignores_invalid_items():
+    from app.ai.manager import DeepSeekService
+
+    content = json.dumps(
+        {
+            "results": [
+                {"id": 1, "category": "Clinica", "confidence": 0.6},
+                {"id": 1, "category": "pesquisa", "confidence": 0.9},
+                {"id": 3, "category": "pesquisa", "confidence": 1.5},
+                {"id": 9, "category": "pesquisa", "confidence": 0.5},
+                "texto solto",
+            ]
+        }
+    )
+    assert DeepSeekService.parse_batch_response(content, 3) == {0: ("clinica", 0.6)}
+    assert DeepSeekService.parse_batch_response("não é json", 3) == {}
+
+
+@pytest.mark.asyncio
+async def test_deepseek_batch_keeps_successful_chunks_when_one_fails(monkeypatch):
+    from app.ai.manager import DeepSeekService
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "deepseek_api_key", "test-key")
+    monkeypatch.setattr(settings, "ai_classify_batch_size", 2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(request.content)["messages"][0]["content"]
+        if "Primeiro" in prompt:
+            return _completion(
+                {
+                    "results": [
+                        {"id": 1, "category": "educacao", "confidence": 0.9},
+                        {"id": 2, "category": "clinica", "confidence": 0.8},
+                    ]
+                }
+            )
+        if "Terceiro" in prompt and "Quarto" in prompt:
+            return httpx.Response(500)
+        # Reclassificação individual com resposta ilegível
+        return httpx.Response(200, json={"choices": [{"message": {"content": "???"}}]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = DeepSeekService(http_client=client)
+        results = await service.classify_batch(
+            ["Primeiro texto", "Segundo texto", "Terceiro texto", "Quarto texto", "Quinto"]
+        )
+
+    # Lote com erro HTTP e item ilegível ficam None para o próximo provedor
+    assert results == [("educacao", 0.9), ("clinica", 0.8), None, None, None]
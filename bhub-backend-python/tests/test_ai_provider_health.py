@@ -0,0 +1,132 @@
+import pytest
+
+
+class FakeProvider:
+    def __init__(self, answer=None, error=None):
+        self.answer = answer
+        self.error = error
+        self.calls = 0
+
+    async def is_available(self):
+        return True
+
+    async def classify(self, _text):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.answer
+
+
+def _manager(monkeypatch, providers):
+    from app.ai.manager import AIManager, ProviderHealth
+    from app.config import settings
+
+    for key in ("deepseek_api_key", "openrouter_api_key", "huggingface_api_key"):
+        monkeypatch.setattr(settings, key, None)
+    monkeypatch.setattr(settings, "local_llm_enabled", False)
+    manager = AIManager()
+    manager.providers = providers
+    manager.health = {p: ProviderHealth(p.value) for p in providers}
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_failures_and_probes_after_reset(monkeypatch):
+    from app.ai.manager import AIProvider, CircuitState
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "ai_circuit_failure_threshold", 2)
+    monkeypatch.setattr(settings, "ai_circuit_reset_seconds", 60)
+    broken = FakeProvider(error=RuntimeError("timeout"))
+    backup = FakeProvider(answer=("clinica", 0.7))
+    manager = _manager(monkeypatch, {AIProvider.DEEPSEEK: broken, AIProvider.OPENROUTER: backup})
+
+    for _ in range(4):
+        assert await manager.classify("texto") == ("clinica", 0.7, AIProvider.OPENROUTER)
+
+    # Aberto após 2 falhas: as chamadas seguintes nem tentam o provedor quebrado
+    assert broken.calls == 2
+    health = manager.get_status()["deepseek"]["health"]
+    assert health["state"] == CircuitState.OPEN.value
+
+    # Passado o tempo de reset, uma chamada de teste; sucesso fecha o circuito
+    manager.health[AIProvider.DEEPSEEK]._opened_at -= 61
+    broken.error, broken.answer = None, ("educacao", 0.9)
+    assert await manager.classify("texto") == ("educacao", 0.9, AIProvider.DEEPSEEK)
+    assert manager.health[AIProvider.DEEPSEEK].state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_provider_order_follows_observed_latency(monkeypatch):
+    from app.ai.manager import AIProvider
+
+    manager = _manager(
+        monkeypatch,
+        {
+            AIProvider.DEEPSEEK: FakeProvider(answer=("clinica", 0.7)),
+            AIProvider.LOCAL_LLM: FakeProvider(answer=("clinica", 0.7)),
+            AIProvider.OPENROUTER: FakeProvider(answer=("clinica", 0.7)),
+        },
+    )
+    order = manager.CLASSIFY_ORDER
+    assert manager._ordered(order) == [
+        AIProvider.DEEPSEEK,
+        AIProvider.LOCAL_LLM,
+        AIProvider.OPENROUTER,
+    ]
+
+    # Latências parecidas mantêm a prioridade; muito mais lenta perde posição
+    manager.health[AIProvider.DEEPSEEK].record_success(900)
+    manager.health[AIProvider.OPENROUTER].record_success(700)
+    assert manager._ordered(order)[0] == AIProvider.DEEPSEEK
+    manager.health[AIProvider.DEEPSEEK].latency_ms = 5000
+    assert manager._ordered(order) == [
+        AIProvider.OPENROUTER,
+        AIProvider.LOCAL_LLM,
+        AIProvider.DEEPSEEK,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_releases_half_open_slot(monkeypatch):
+    import asyncio
+
+    from app.ai.manager import AIProvider, CircuitState
+
+    started = asyncio.Event()
+
+    class SlowProvider(FakeProvider):
+        async def classify(self, _text):
+            started.set()
+            await asyncio.sleep(10)
+
+    provider = SlowProvider()
+    manager = _manager(monkeypatch, {AIProvider.DEEPSEEK: provider})
+    health = manager.health[AIProvider.DEEPSEEK]
+    health.state = CircuitState.OPEN
+    health._opened_at -= 3600
+
+    # Chamada de teste cancelada (ex.: cliente desconectou) não deixa o provedor travado
+    task = asyncio.create_task(manager.classify("texto"))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert health.state == CircuitState.HALF_OPEN
+    assert health.allow() is True
+
+
+@pytest.mark.asyncio
+async def test_batch_latency_does_not_skew_provider_order(monkeypatch):
+    from app.ai.manager import AIProvider
+
+    class BatchProvider(FakeProvider):
+        async def classify_batch(self, texts):
+            return [("clinica", 0.7)] * len(texts)
+
+    manager = _manager(monkeypatch, {AIProvider.DEEPSEEK: BatchProvider()})
+    await manager.classify_batch(["a", "b", "c"])
+
+    health = manager.health[AIProvider.DEEPSEEK].as_dict()
+    assert health["latency_ms"] is None
+    assert health["batch_latency_ms"] is not None
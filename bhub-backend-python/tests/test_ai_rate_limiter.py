@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters(monkeypatch):
+    from app.ai import manager
+
+    monkeypatch.setattr(manager, "_limiters", {})
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_concurrency_and_serves_in_order(monkeypatch):
+    from app.ai.manager import get_provider_limiter
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "ai_max_concurrency", 2)
+    monkeypatch.setattr(settings, "ai_requests_per_minute", 0)
+    limiter = get_provider_limiter("deepseek")
+    started, peak = [], 0
+
+    async def call(i):
+        nonlocal peak
+        async with limiter.slot():
+            started.append(i)
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(call(i) for i in range(6)))
+
+    assert peak == 2
+    assert started == list(range(6))
+    assert limiter.stats()["requests"] == 6
+
+
+@pytest.mark.asyncio
+async def test_limiter_waits_for_request_budget(monkeypatch):
+    from app.ai.manager import get_provider_limiter
+    from app.config import settings
+
+    # 600/min = uma requisição a cada 0,1s depois de esgotado o bucket inicial
+    monkeypatch.setattr(settings, "ai_requests_per_minute", 600)
+    limiter = get_provider_limiter("openrouter")
+    limiter._requests = 1.0
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(3):
+        async with limiter.slot():
+            pass
+
+    assert loop.time() - start >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_provider_and_manager_falls_back(monkeypatch):
+    from app.ai.manager import AIManager, AIProvider, DeepSeekService, ProviderHealth
+    from app.config import settings
+
+    for key in ("openrouter_api_key", "huggingface_api_key"):
+        monkeypatch.setattr(settings, key, None)
+    monkeypatch.setattr(settings, "local_llm_enabled", False)
+    monkeypatch.setattr(settings, "deepseek_api_key", "test-key")
+    monkeypatch.setattr(settings, "ai_retry_after_max_seconds", 30)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(json.loads(request.content))
+        return httpx.Response(429, headers={"Retry-After": "120"})
+
+    class Backup:
+        async def is_available(self):
+            return True
+
+        async def classify(self, _text):
+            return ("clinica", 0.7)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        manager = AIManager()
+        manager.providers = {
+            AIProvider.DEEPSEEK: DeepSeekService(http_client=client),
+            AIProvider.OPENROUTER: Backup(),
+        }
+        manager.health = {p: ProviderHealth(p.value) for p in manager.providers}
+
+        # Retry-After longo: sem retentativa cega e sem contar como falha do circuito
+        assert await manager.classify("texto") == ("clinica", 0.7, AIProvider.OPENROUTER)
+        assert len(calls) == 1
+        assert manager.health[AIProvider.DEEPSEEK].as_dict()["consecutive_failures"] == 0
+
+        # Enquanto pausado, o provedor nem é chamado
+        assert await manager.classify("outro texto") == ("clinica", 0.7, AIProvider.OPENROUTER)
+        assert len(calls) == 1
+
+    limiter = manager.get_status()["deepseek"]["limiter"]
+    assert limiter["rate_limited"] == 1
+    assert limiter["paused_seconds"] > 100
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    from app.ai.manager import parse_retry_after
+
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -1,6 +1,6 @@
 import pytest
 
-from app.services.background_tasks import classify_article_task, download_pdf_task
+from app.services.background_tasks import download_pdf_task
 
 
 class StubArticle:
@@ -56,55 +56,6 @@ class FakeSessionCtx:
         return False
 
 
-@pytest.mark.asyncio
-async def test_classify_article_task_happy(monkeypatch):
-    article = StubArticle()
-    db = FakeDB(article)
-
-    async def fake_classify_with_multiple_categories(**_kwargs):
-        return [("clinica", 0.8)]
-
-    async def fake_assign_categories_to_article(**_kwargs):
-        return [type("Cat", (), {"name": "Cat"})()]
-
-    async def fake_calc_impact(**_kwargs):
-        return 7.0
-
-    monkeypatch.setattr(
-        "app.services.background_tasks.get_session_context", lambda: FakeSessionCtx(db)
-    )
-    import app.services.background_tasks as bt
-
-    FakeCS = type(
-        "FakeCS",
-        (),
-        {
-            "classify_with_multiple_categories": staticmethod(fake_classify_with_multiple_categories),
-            "assign_categories_to_article": staticmethod(fake_assign_categories_to_article),
-        },
-    )
-    bt.ClassificationService = FakeCS
-    monkeypatch.setattr("app.services.classification_service.ClassificationService", FakeCS, raising=False)
-
-    FakeImpact = type("FakeImpact", (), {"calculate_impact": staticmethod(fake_calc_impact)})
-    bt.ImpactRatingService = FakeImpact
-    monkeypatch.setattr("app.ml.impact_rating.ImpactRatingService", FakeImpact, raising=False)
-
-    class FakeAI:
-        async def classify(self, text):
-            return ("clinica", 0.9, "fake")
-
-        providers = {}
-
-    bt.get_ai_manager = lambda: FakeAI()
-    monkeypatch.setattr("app.ai.get_ai_manager", bt.get_ai_manager, raising=False)
-
-    await classify_article_task(article_id=1)
-    assert db.committed is True
-    assert article.impact_score is not None
-    assert article.classification_confidence == 0.8
-
-
 @pytest.mark.asyncio
 async def test_download_pdf_task_happy(monkeypatch, tmp_path):
     article = StubArticle()
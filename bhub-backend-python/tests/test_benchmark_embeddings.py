@@ -0,0 +1,30 @@
+import numpy as np
+
+
+def test_compare_reports_cosine_and_category_agreement():
+    from scripts.benchmark_embeddings import compare, load_texts
+
+    assert len(load_texts(limit=5)) == 5
+
+    categories = np.eye(3, dtype=np.float32)
+    reference = {
+        "embeddings": np.array([[1, 0.1, 0], [0, 1, 0.1], [0.1, 0, 1]], dtype=np.float32),
+        "categories": categories,
+    }
+    # Perturbação (como a da quantização int8) que troca só a categoria do último texto
+    shift = np.array([[0, 0, 0], [0, 0, 0], [0.95, 0, 0]], dtype=np.float32)
+    other = {"embeddings": reference["embeddings"] + shift, "categories": categories}
+
+    result = compare(reference, other)
+    assert result["cosine_min"] < result["cosine_mean"] < 1.0
+    assert result["category_agreement"] == 2 / 3
+    assert result["category_agreement_reference_vectors"] == 2 / 3
+
+
+def test_int8_backend_stores_vectors_under_its_own_model_key(monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "embedding_backend", "onnx")
+    assert settings.embedding_model_key == settings.embedding_model
+    monkeypatch.setattr(settings, "embedding_backend", "onnx-int8")
+    assert settings.embedding_model_key == f"{settings.embedding_model}+qint8"
@@ -0,0 +1,21 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_benchmark_replays_fixtures_through_aggregator(monkeypatch):
+    from app.config import settings
+    from scripts.benchmark_feed_sync import load_fixtures, run_benchmark
+
+    monkeypatch.setattr(settings, "feed_parse_executor", "inline")
+
+    summary = await run_benchmark(rounds=1, copies=2)
+
+    [round_result] = summary["rounds"]
+    expected_feeds = len(load_fixtures(2))
+    assert round_result["errors"] == []
+    assert round_result["feeds"] == expected_feeds
+    # Cópias reescrevem os DOIs: nenhuma entrada é descartada como duplicata
+    assert round_result["articles"] == round_result["stored"] > 0
+    assert round_result["warm_not_modified"] == expected_feeds
+    assert summary["median_articles_per_second"] > 0
+    assert "parse" in round_result["cold_stages"]
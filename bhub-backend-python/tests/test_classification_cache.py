@@ -0,0 +1,97 @@
+import pytest
+
+
+class CountingAIManager:
+    """AIManager falso que conta as chamadas ao provedor."""
+
+    providers = {}
+
+    def __init__(self):
+        self.calls = []
+
+    def classify_cache_identities(self):
+        return [("deepseek", "deepseek-chat", "v1")]
+
+    async def classify(self, text):
+        self.calls.append(text)
+        if "escola" in text:
+            return ("educacao", 0.8, "deepseek")
+        return ("outros", 0.0, None)
+
+
+@pytest.fixture
+def empty_memory_cache():
+    from app.services.classification_cache import clear_classification_memory_cache
+
+    clear_classification_memory_cache()
+    yield
+    clear_classification_memory_cache()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("empty_memory_cache")
+async def test_repeated_classification_is_served_from_cache(db_session):
+    from app.services.classification_cache import (
+        classification_cache_stats,
+        clear_classification_memory_cache,
+    )
+    from app.services.classification_service import ClassificationService
+
+    ai = CountingAIManager()
+    service = ClassificationService(db=db_session, ai_manager=ai)
+    texts = ["Ensino de leitura na escola", "Texto sem categoria clara"]
+
+    first = await service.classify_batch(texts)
+    await db_session.commit()
+    assert first[0] == ("educacao", 0.8)
+    assert len(ai.calls) == 2
+
+    # Mesmo texto (espaços normalizados): LRU em memória, sem nova chamada
+    before = classification_cache_stats()
+    assert await service.classify("Ensino de leitura  na escola ") == ("educacao", 0.8)
+    assert len(ai.calls) == 2
+    assert classification_cache_stats()["memory_hits"] == before["memory_hits"] + 1
+
+    # Sem o LRU (outro processo), a tabela responde
+    clear_classification_memory_cache()
+    assert await service.classify(texts[0]) == ("educacao", 0.8)
+    assert len(ai.calls) == 2
+    assert classification_cache_stats()["db_hits"] == before["db_hits"] + 1
+
+    # Respostas sem provedor não entram no cache
+    await service.classify(texts[1])
+    assert ai.calls[-1] == texts[1]
+
+
+def test_classification_cache_key_depends_on_model_and_prompt():
+    from app.services.classification_cache import classification_cache_key
+
+    base = classification_cache_key("texto", ("deepseek", "deepseek-chat", "v1"))
+    assert base == classification_cache_key(" texto\n", ("deepseek", "deepseek-chat", "v1"))
+    assert base != classification_cache_key("texto", ("deepseek", "deepseek-chat", "v2"))
+    assert base != classification_cache_key("texto", ("openrouter", "deepseek-chat", "v1"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("empty_memory_cache")
+async def test_cache_read_failure_keeps_caller_transaction(db_session, monkeypatch):
+    from sqlalchemy import func, select
+
+    from app.models import Article, Category
+    from app.services.classification_cache import ClassificationCacheService
+
+    async def failing_fetch(self, _keys):
+        self.db.add(Category(name="Parcial", slug="parcial"))
+        await self.db.flush()
+        raise RuntimeError("conexão perdida")
+
+    monkeypatch.setattr(ClassificationCacheService, "_fetch", failing_fetch)
+    db_session.add(Article(external_id="cache-tx", title="Gravado pelo chamador"))
+
+    found = await ClassificationCacheService(db_session).get_many(["texto"], [("p", "m", "v")])
+    await db_session.commit()
+
+    # Só o trabalho do savepoint é desfeito
+    assert found == {}
+    assert await db_session.scalar(select(func.count()).select_from(Category)) == 0
+    assert await db_session.scalar(select(func.count()).select_from(Article)) == 1
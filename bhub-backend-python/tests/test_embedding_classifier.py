@@ -0,0 +1,154 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.ml.similarity import cosine_scores, normalize_rows, top_k
+
+
+def test_normalize_rows_is_float32_unit_norm_and_keeps_zero_rows():
+    matrix = normalize_rows(np.array([[3.0, 4.0], [0.0, 0.0]]))
+
+    assert matrix.dtype == np.float32
+    np.testing.assert_allclose(matrix[0], [0.6, 0.8], rtol=1e-6)
+    np.testing.assert_array_equal(matrix[1], [0.0, 0.0])
+
+
+def test_cosine_scores_matches_pairwise_loop():
+    rng = np.random.default_rng(0)
+    categories = rng.normal(size=(7, 16))
+    queries = rng.normal(size=(5, 16))
+
+    scores = cosine_scores(queries, normalize_rows(categories))
+
+    expected = np.array(
+        [
+            [q @ c / (np.linalg.norm(q) * np.linalg.norm(c)) for c in categories]
+            for q in queries
+        ]
+    )
+    assert scores.shape == (5, 7)
+    np.testing.assert_allclose(scores, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_top_k_returns_sorted_best_scores_per_row():
+    scores = np.array([[0.1, 0.9, 0.5, 0.7], [0.4, 0.2, 0.8, 0.6]])
+
+    indices, values = top_k(scores, 2)
+
+    np.testing.assert_array_equal(indices, [[1, 3], [2, 3]])
+    np.testing.assert_allclose(values, [[0.9, 0.7], [0.8, 0.6]])
+    assert top_k(scores, 10)[0].shape == (2, 4)
+
+
+class FakeEncoder:
+    """Embeddings determinísticos por palavra-chave (eixo 0: autismo, 1: escola, 2: empresa)."""
+
+    AXES = {"autism": 0, "school": 1, "workplace": 2}
+
+    def encode(self, texts, normalize_embeddings=False, **_kwargs):
+        rows = []
+        for text in texts:
+            row = np.full(3, 0.05, dtype=np.float32)
+            for word, axis in self.AXES.items():
+                row[axis] += text.lower().count(word)
+            rows.append(row)
+        matrix = np.array(rows)
+        return normalize_rows(matrix) if normalize_embeddings else matrix
+
+
+@pytest.mark.asyncio
+async def test_embedding_classifier_batch_uses_category_matrix(monkeypatch):
+    pytest.importorskip("sentence_transformers")
+    from app.ml.embedding_classifier import EmbeddingClassifier
+
+    monkeypatch.setattr(EmbeddingClassifier, "_model", FakeEncoder())
+    monkeypatch.setattr(EmbeddingClassifier, "_initialized", True)
+    monkeypatch.setattr(EmbeddingClassifier, "_category_slugs", [])
+    monkeypatch.setattr(EmbeddingClassifier, "_category_matrix", None)
+
+    await EmbeddingClassifier.load_category_embeddings(
+        [
+            {"slug": "autismo", "name": "autism"},
+            {"slug": "educacao", "name": "school"},
+            {"slug": "organizacional", "name": "workplace"},
+        ]
+    )
+    assert EmbeddingClassifier._category_matrix.shape == (3, 3)
+
+    results = await EmbeddingClassifier.classify_batch(
+        ["autism autism in school settings", "workplace safety program", "short"],
+        threshold=0.5,
+    )
+    assert [slug for slug, _ in results] == ["autismo", "organizacional", "outros"]
+    assert results[2][1] == 0.0
+
+    [labels] = await EmbeddingClassifier.classify_top_k(
+        ["autism support in school"], k=2, threshold=0.3
+    )
+    assert {slug for slug, _ in labels} == {"autismo", "educacao"}
+
+
+@pytest.mark.asyncio
+async def test_embedding_classifier_warmup_loads_in_background(monkeypatch):
+    import threading
+
+    from app.ml import embedding_classifier
+    from app.ml.embedding_classifier import EmbeddingClassifier
+
+    release = threading.Event()
+
+    def slow_load():
+        release.wait(5)
+        return FakeEncoder()
+
+    monkeypatch.setattr(embedding_classifier, "load_sentence_transformer", slow_load)
+    for name, value in [
+        ("_model", None),
+        ("_client", None),
+        ("_initialized", False),
+        ("_state", "not_loaded"),
+        ("_load_error", None),
+        ("_categories", []),
+        ("_category_slugs", []),
+        ("_category_matrix", None),
+        ("_warmup_task", None),
+    ]:
+        monkeypatch.setattr(EmbeddingClassifier, name, value)
+
+    task = EmbeddingClassifier.warmup([{"slug": "autismo", "name": "autism"}])
+
+    # O event loop segue livre enquanto o modelo carrega numa thread
+    await asyncio.sleep(0.05)
+    assert not task.done()
+    assert EmbeddingClassifier.get_status()["state"] == "loading"
+    assert not EmbeddingClassifier.is_ready()
+
+    release.set()
+    await asyncio.wait_for(task, 5)
+    status = EmbeddingClassifier.get_status()
+    assert status["state"] == "loaded" and status["ready"]
+    assert status["categories_loaded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_classify_endpoint_falls_back_to_heuristic_when_encoder_saturated(client, monkeypatch):
+    from app.ml.embedding_classifier import EmbeddingClassifier, HeuristicClassifier
+    from app.ml.encode_executor import EncodeQueueFull
+
+    async def saturated(_texts, _embeddings=None):
+        raise EncodeQueueFull("fila cheia")
+
+    monkeypatch.setattr(EmbeddingClassifier, "is_ready", classmethod(lambda _cls: True))
+    monkeypatch.setattr(EmbeddingClassifier, "score_batch", saturated)
+    text = "Intervenção comportamental intensiva para crianças com autismo"
+
+    # Indisponibilidade não vira "outros" com confiança 0: o chamador decide o fallback
+    with pytest.raises(EncodeQueueFull):
+        await EmbeddingClassifier.classify_batch([text])
+
+    response = await client.post("/api/v1/ai/classify", json={"text": text})
+
+    assert response.status_code == 200
+    category, confidence = HeuristicClassifier.classify(text)
+    assert response.json() == {"category": category, "confidence": confidence, "provider": "heuristic"}
@@ -0,0 +1,66 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_embedding_service_batches_concurrent_requests(tmp_path):
+    from app.ml.embedding_service import EmbeddingServer, EmbeddingServiceClient
+
+    calls = []
+
+    async def fake_encoder(texts):
+        calls.append(list(texts))
+        return np.asarray([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+    socket_path = str(tmp_path / "embeddings.sock")
+    server = EmbeddingServer(socket_path, batch_size=64, max_wait_seconds=0.2, encoder=fake_encoder)
+    await server.start()
+    try:
+        client = EmbeddingServiceClient(socket_path, timeout=5)
+        results = await asyncio.gather(
+            client.encode(["a"]), client.encode(["bb", "ccc"]), client.encode(["dddd"])
+        )
+    finally:
+        await server.close()
+
+    # Pedidos simultâneos viram um único encode, e cada cliente recebe só suas linhas
+    assert len(calls) == 1
+    assert sorted(calls[0]) == ["a", "bb", "ccc", "dddd"]
+    assert [r[:, 0].tolist() for r in results] == [[1.0], [2.0, 3.0], [4.0]]
+
+
+@pytest.mark.asyncio
+async def test_embedding_service_client_raises_when_unavailable(tmp_path):
+    from app.ml.embedding_service import EmbeddingServiceClient, EmbeddingServiceUnavailable
+
+    client = EmbeddingServiceClient(str(tmp_path / "missing.sock"), timeout=1)
+    with pytest.raises(EmbeddingServiceUnavailable):
+        await client.encode(["texto"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("categories_loaded", [False, True])
+async def test_classify_endpoint_falls_back_when_service_is_down(
+    client, monkeypatch, tmp_path, categories_loaded
+):
+    from app.ml.embedding_classifier import EmbeddingClassifier, HeuristicClassifier
+    from app.ml.embedding_service import EmbeddingServiceClient
+
+    matrix = np.eye(2, dtype=np.float32) if categories_loaded else None
+    for name, value in [
+        ("_client", EmbeddingServiceClient(str(tmp_path / "missing.sock"), timeout=1)),
+        ("_initialized", True),
+        ("_categories", [{"slug": "autismo", "name": "autismo"}, {"slug": "clinica", "name": "clinica"}]),
+        ("_category_slugs", ["autismo", "clinica"] if categories_loaded else []),
+        ("_category_matrix", matrix),
+    ]:
+        monkeypatch.setattr(EmbeddingClassifier, name, value)
+    text = "Intervenção comportamental intensiva para crianças com autismo"
+
+    response = await client.post("/api/v1/ai/classify", json={"text": text})
+
+    assert response.status_code == 200
+    category, confidence = HeuristicClassifier.classify(text)
+    assert response.json() == {"category": category, "confidence": confidence, "provider": "heuristic"}
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from app.services.embedding_store import EmbeddingStore, article_embedding_text
+
+
+class CountingEncoder:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[len(text), 1.0, 0.5] for text in texts], dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_ensure_encodes_only_missing_or_changed_articles(db_session):
+    from app.models import Article
+
+    articles = [Article(external_id=f"e{i}", title=f"Artigo {i}") for i in range(3)]
+    db_session.add_all(articles)
+    await db_session.commit()
+    ids = [a.id for a in articles]
+
+    encoder = CountingEncoder()
+    store = EmbeddingStore(db_session, model_name="test-model", encoder=encoder)
+
+    found, matrix = await store.ensure_for_articles(ids)
+    await db_session.commit()
+    assert found == ids
+    assert matrix.shape == (3, 3)
+    assert matrix.dtype == np.float32 and matrix.flags["C_CONTIGUOUS"]
+    assert len(encoder.calls) == 1
+
+    # Nada mudou: nenhum encode novo
+    await store.ensure_for_articles(ids)
+    assert len(encoder.calls) == 1
+
+    # Texto alterado invalida só o vetor daquele artigo
+    articles[1].abstract = "Novo resumo do artigo"
+    await db_session.commit()
+    found, matrix = await store.ensure_for_articles(ids)
+    await db_session.commit()
+    assert encoder.calls[-1] == [article_embedding_text("Artigo 1", "Novo resumo do artigo")]
+    assert matrix[1, 0] == len(encoder.calls[-1][0])
+
+    found, matrix = await store.get_many([ids[2], ids[0], 999])
+    assert found == [ids[2], ids[0]]
+    np.testing.assert_array_equal(matrix[:, 0], [len("Artigo 2"), len("Artigo 0")])
+
+    all_ids, all_vectors = await store.all_vectors()
+    assert all_ids == ids and all_vectors.shape == (3, 3)
+
+    # Outro modelo tem vetores próprios
+    other = EmbeddingStore(db_session, model_name="other-model")
+    assert (await other.get_many(ids))[0] == []
+
+
+@pytest.mark.asyncio
+async def test_ensure_without_encoder_returns_only_fresh_vectors(db_session):
+    from app.models import Article
+
+    articles = [Article(external_id=f"n{i}", title=f"Texto {i}") for i in range(2)]
+    db_session.add_all(articles)
+    await db_session.commit()
+
+    await EmbeddingStore(db_session, model_name="m", encoder=CountingEncoder()).ensure(
+        [(articles[0].id, "Texto 0")]
+    )
+    await db_session.commit()
+
+    store = EmbeddingStore(db_session, model_name="m")
+    found, matrix = await store.ensure([(a.id, a.title) for a in articles])
+    assert found == [articles[0].id]
+    assert matrix.shape == (1, 3)
@@ -0,0 +1,44 @@
+import asyncio
+import threading
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_encode_executor_bounds_pending_requests(monkeypatch):
+    from app.config import settings
+    from app.ml import encode_executor
+
+    monkeypatch.setattr(settings, "embedding_encode_workers", 1)
+    monkeypatch.setattr(settings, "embedding_encode_max_pending", 2)
+    monkeypatch.setattr(encode_executor, "_stats", encode_executor.EncodeStats())
+    encode_executor.shutdown_encode_executor()
+
+    release = threading.Event()
+
+    def blocking_encode(value):
+        release.wait(5)
+        return value * 2
+
+    try:
+        first = asyncio.create_task(encode_executor.run_in_encode_executor(blocking_encode, 1))
+        second = asyncio.create_task(encode_executor.run_in_encode_executor(blocking_encode, 2))
+        await asyncio.sleep(0.05)
+
+        stats = encode_executor.encode_executor_stats()
+        assert (stats["running"], stats["queued"]) == (1, 1)
+
+        # Fila cheia: recusa imediata em vez de esperar
+        with pytest.raises(encode_executor.EncodeQueueFull):
+            await encode_executor.run_in_encode_executor(blocking_encode, 3)
+
+        release.set()
+        assert await asyncio.gather(first, second) == [2, 4]
+    finally:
+        release.set()
+        encode_executor.shutdown_encode_executor()
+
+    stats = encode_executor.encode_executor_stats()
+    assert stats["completed"] == 2 and stats["rejected"] == 1
+    assert stats["queued"] == stats["running"] == 0
+    assert stats["max_queued"] >= 1
@@ -19,3 +19,687 @@ async def test_sync_feed_not_found():
     result = await service.sync_feed(feed_id=123)
     assert result.success is False
     assert "Feed não encontrado" in (result.errors or [])
+
+
+class FakeFeedsResult:
+    def __init__(self, feeds):
+        self.feeds = feeds
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.feeds
+
+
+class FakeFeedsDB:
+    def __init__(self, feeds):
+        self.feeds = feeds
+
+    async def execute(self, *_args, **_kwargs):
+        return FakeFeedsResult(self.feeds)
+
+
+class FakeSessionFactory:
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return object()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_sync_all_active_feeds_concurrent_respects_host_limit(monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.config import settings
+    from app.schemas.feed import FeedSyncResult
+
+    feeds = [
+        SimpleNamespace(
+            id=i,
+            name=f"feed-{i}",
+            feed_url=f"https://{'a' if i % 2 else 'b'}.example.com/rss/{i}",
+            needs_sync=True,
+            last_sync_at=None,
+            next_sync_at=None,
+        )
+        for i in range(6)
+    ]
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def fake_sync_feed(self, feed_id):
+        host = "a" if feed_id % 2 else "b"
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        if feed_id == 3:
+            raise RuntimeError("boom")
+        return FeedSyncResult(feed_id=feed_id, feed_name=f"feed-{feed_id}", success=True, new_articles=1)
+
+    monkeypatch.setattr(FeedAggregatorService, "sync_feed", fake_sync_feed)
+    monkeypatch.setattr(settings, "feed_sync_per_host_limit", 2)
+
+    service = FeedAggregatorService(db=FakeFeedsDB(feeds), session_factory=FakeSessionFactory())
+    result = await service.sync_all_active_feeds(concurrency=4)
+    await service.close()
+
+    assert [r.feed_id for r in result.results] == list(range(6))
+    assert result.total_feeds == 6
+    assert result.successful == 5
+    assert result.failed == 1
+    assert result.new_articles == 5
+    assert peak == {"a": 2, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_sync_feed_conditional_get_not_modified(db_session):
+    import httpx
+
+    from app.models import Feed
+
+    feed = Feed(name="Journal", feed_url="https://journal.example.com/rss")
+    db_session.add(feed)
+    await db_session.commit()
+
+    rss = (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>J</title>'
+        "</channel></rss>"
+    )
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            text=rss,
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = FeedAggregatorService(db=db_session, http_client=client)
+
+    first = await service.sync_feed(feed.id)
+    assert first.success is True
+    assert first.not_modified is False
+    assert feed.http_etag == '"v1"'
+
+    assert {"fetch", "parse", "dedup", "insert", "commit", "dispatch"} <= set(first.stage_timings)
+
+    second = await service.sync_feed(feed.id)
+    assert second.success is True
+    assert second.not_modified is True
+    assert set(second.stage_timings) == {"fetch", "commit"}
+    assert seen_headers[1]["if-none-match"] == '"v1"'
+    assert seen_headers[1]["if-modified-since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_sync_feed_failed_insert_keeps_previous_validators(db_session, monkeypatch):
+    import httpx
+
+    from app.models import Feed
+
+    feed = Feed(name="Journal", feed_url="https://journal.example.com/rss")
+    db_session.add(feed)
+    await db_session.commit()
+
+    rss = (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>J</title>'
+        "<item><title>T1</title><guid>urn:1</guid></item></channel></rss>"
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=rss, headers={"ETag": '"v1"'})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = FeedAggregatorService(db=db_session, http_client=client)
+    bulk_insert = service._bulk_insert_articles
+
+    async def failing_bulk_insert(*_args):
+        raise RuntimeError("insert falhou")
+
+    monkeypatch.setattr(service, "_bulk_insert_articles", failing_bulk_insert)
+    first = await service.sync_feed(feed.id)
+    assert first.success is False
+    assert feed.http_etag is None
+    assert feed.error_count == 1
+
+    # A próxima sincronização baixa o feed de novo e ingere as entradas perdidas
+    monkeypatch.setattr(service, "_bulk_insert_articles", bulk_insert)
+    monkeypatch.setattr(
+        "app.services.feed_aggregator.dispatch_classify_articles", _fake_dispatch
+    )
+    second = await service.sync_feed(feed.id)
+    await client.aclose()
+
+    assert second.success is True
+    assert second.not_modified is False
+    assert second.new_articles == 1
+    assert feed.http_etag == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_sync_feed_batch_dedup_only_processes_new_entries(db_session, monkeypatch):
+    import httpx
+
+    from app.models import Article, Feed
+
+    feed = Feed(name="Journal", feed_url="https://journal.example.com/rss")
+    db_session.add(feed)
+    await db_session.commit()
+
+    items = "".join(
+        f"<item><title>T{i}</title><guid>urn:{i}</guid></item>" for i in (1, 2, 2, 3)
+    )
+    rss = f'<?xml version="1.0"?><rss version="2.0"><channel><title>J</title>{items}</channel></rss>'
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _request: httpx.Response(200, text=rss))
+    )
+    service = FeedAggregatorService(db=db_session, http_client=client)
+
+    known_id = service.parser.generate_external_id({"id": "urn:1"}, feed.id)
+    db_session.add(Article(external_id=known_id, title="T1", feed_id=feed.id))
+    await db_session.commit()
+
+    processed = []
+    bulk_insert = service._bulk_insert_articles
+
+    async def recording_bulk_insert(feed, items):
+        processed.extend(data["title"] for _, data in items)
+        return await bulk_insert(feed, items)
+
+    monkeypatch.setattr(service, "_bulk_insert_articles", recording_bulk_insert)
+    monkeypatch.setattr(
+        "app.services.feed_aggregator.dispatch_classify_articles", _fake_dispatch
+    )
+    result = await service.sync_feed(feed.id)
+    await client.aclose()
+
+    assert result.success is True
+    assert result.new_articles == 2
+    assert processed == ["T2", "T3"]
+
+
+async def _fake_dispatch(article_ids, *_args):
+    return [f"test-{article_id}" for article_id in article_ids]
+
+
+@pytest.mark.asyncio
+async def test_bulk_link_authors_writes_authors_in_name_order(db_session):
+    from sqlalchemy import event, select
+
+    from app.models import Article, Author
+
+    articles = [Article(external_id=f"ord-{i}", title=f"T{i}") for i in range(2)]
+    db_session.add_all(articles)
+    db_session.add(Author(name="Zoe Lima", normalized_name="zoe lima", article_count=1))
+    await db_session.commit()
+
+    writes = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, executemany):
+        command = statement.lstrip().upper()
+        if executemany and command.startswith(("INSERT INTO AUTHORS", "UPDATE AUTHORS")):
+            writes.append((command.split()[0], parameters))
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        service = FeedAggregatorService(db=db_session)
+        await service._bulk_link_authors(
+            {
+                articles[0].id: [{"name": "Zoe Lima"}, {"name": "Carla Dias"}],
+                articles[1].id: [{"name": "Bruno Alves"}, {"name": "Zoe Lima"}],
+            }
+        )
+        await db_session.commit()
+        await service.close()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    rows = (
+        await db_session.execute(select(Author.id, Author.normalized_name, Author.article_count))
+    ).all()
+    by_id = {row.id: row.normalized_name for row in rows}
+    counts = {row.normalized_name: row.article_count for row in rows}
+
+    # Upsert e contadores seguem a ordem de normalized_name (mesma ordem de locks entre jobs)
+    [(_, inserted), (_, updated)] = writes
+    assert [row[1] for row in inserted] == ["bruno alves", "carla dias", "zoe lima"]
+    assert [by_id[row[1]] for row in updated] == ["bruno alves", "carla dias", "zoe lima"]
+    assert counts == {
+        "bruno alves": 1,
+        "carla dias": 1,
+        "zoe lima": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_articles_links_authors(db_session):
+    from sqlalchemy import select
+
+    from app.models import Author, Feed, article_authors
+
+    feed = Feed(name="Journal", feed_url="https://journal.example.com/rss", journal_name="JABA")
+    db_session.add(feed)
+    db_session.add(Author(name="Ana Souza", normalized_name="ana souza", article_count=3))
+    await db_session.commit()
+
+    service = FeedAggregatorService(db=db_session)
+    items = [
+        (
+            "ext-1",
+            {
+                "title": "A",
+                "doi": "10.1/a",
+                "authors": [{"name": "Ana Souza"}, {"name": "B. Skinner", "role": "editor"}],
+            },
+        ),
+        ("ext-2", {"title": "B", "doi": "10.1/a", "authors": [{"name": "Ana Souza"}]}),
+        ("ext-3", {"title": "C", "authors": [{"name": "Ána  Souza"}, {"name": "x"}]}),
+    ]
+    created = await service._bulk_insert_articles(feed, items)
+    await db_session.commit()
+    await service.close()
+
+    # ext-2 repete o DOI de ext-1 e é descartado
+    assert set(created) == {"ext-1", "ext-3"}
+
+    authors = {
+        a.normalized_name: a.article_count
+        for a in (await db_session.execute(select(Author))).scalars().all()
+    }
+    assert authors == {"ana souza": 5, "b skinner": 1}
+
+    links = (
+        await db_session.execute(
+            select(article_authors.c.article_id, article_authors.c.position, article_authors.c.role)
+        )
+    ).all()
+    assert sorted(links) == sorted(
+        [(created["ext-1"], 0, "author"), (created["ext-1"], 1, "editor"), (created["ext-3"], 0, "author")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_articles_skips_rows_inserted_concurrently(db_session):
+    from app.models import Article, Feed
+
+    feed = Feed(name="Journal", feed_url="https://journal.example.com/rss")
+    db_session.add(feed)
+    await db_session.commit()
+    # Gravado por outra sincronização depois da deduplicação desta
+    db_session.add(Article(external_id="ext-1", title="A", feed_id=feed.id))
+    await db_session.commit()
+
+    service = FeedAggregatorService(db=db_session)
+    items = [
+        ("ext-1", {"title": "A", "authors": [{"name": "Ana Souza"}]}),
+        ("ext-2", {"title": "B", "authors": [{"name": "Ana Souza"}]}),
+    ]
+    created = await service._bulk_insert_articles(feed, items)
+    await db_session.commit()
+    await service.close()
+
+    assert set(created) == {"ext-2"}
+
+
+@pytest.mark.asyncio
+async def test_sync_feed_updates_only_edited_entries(db_session, monkeypatch):
+    import httpx
+    from sqlalchemy import select
+
+    from app.models import Article, Author, Feed
+
+    feed = Feed(name="Journal", feed_url="https://journal.example.com/rss")
+    db_session.add(feed)
+    await db_session.commit()
+
+    def rss(title_2: str) -> str:
+        items = (
+            "<item><title>Stable</title><guid>urn:1</guid><author>Ana Souza</author></item>"
+            f"<item><title>{title_2}</title><guid>urn:2</guid><author>Ana Souza</author></item>"
+        )
+        return f'<?xml version="1.0"?><rss version="2.0"><channel><title>J</title>{items}</channel></rss>'
+
+    body = {"text": rss("Typo titel")}
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _request: httpx.Response(200, text=body["text"]))
+    )
+    dispatched = []
+
+    async def fake_dispatch(article_ids, *_args):
+        dispatched.extend(article_ids)
+        return [f"test-{article_id}" for article_id in article_ids]
+
+    monkeypatch.setattr("app.services.feed_aggregator.dispatch_classify_articles", fake_dispatch)
+    service = FeedAggregatorService(db=db_session, http_client=client)
+
+    first = await service.sync_feed(feed.id)
+    assert (first.new_articles, first.updated_articles) == (2, 0)
+
+    unchanged = await service.sync_feed(feed.id)
+    assert (unchanged.new_articles, unchanged.updated_articles) == (0, 0)
+
+    dispatched.clear()
+    body["text"] = rss("Fixed title")
+    edited = await service.sync_feed(feed.id)
+    await client.aclose()
+    assert (edited.new_articles, edited.updated_articles) == (0, 1)
+
+    db_session.expire_all()
+    article = (
+        await db_session.execute(select(Article).where(Article.title == "Fixed title"))
+    ).scalar_one()
+    assert dispatched == [article.id]
+    author = (await db_session.execute(select(Author))).scalar_one()
+    assert author.article_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+async def test_parse_feed_document_in_executor(monkeypatch, mode):
+    from app.config import settings
+    from app.services import feed_parsing
+
+    monkeypatch.setattr(settings, "feed_parse_executor", mode)
+    monkeypatch.setattr(feed_parsing, "_executor", None)
+
+    rss = (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>J</title>'
+        "<item><title>Verbal behavior</title><guid>urn:1</guid>"
+        "<pubDate>Wed, 01 Jan 2025 00:00:00 GMT</pubDate></item></channel></rss>"
+    )
+    try:
+        parsed = await feed_parsing.run_in_parse_executor(
+            feed_parsing.parse_feed_document, rss, 7, "JABA"
+        )
+    finally:
+        feed_parsing.shutdown_parse_executor()
+
+    assert parsed["title"] == "J"
+    assert parsed["bozo_exception"] is None
+    [item] = parsed["entries"]
+    assert item["external_id"].startswith("feed_7_")
+    assert item["data"]["title"] == "Verbal behavior"
+    assert item["data"]["publication_date"].year == 2025
+
+
+def test_adaptive_schedule_learns_cadence_and_backs_off(monkeypatch):
+    from datetime import datetime, timedelta
+
+    from app.config import settings
+    from app.models import Feed, SyncFrequency
+    from app.services import feed_scheduling
+
+    monkeypatch.setattr(settings, "feed_adaptive_sync", True)
+    monkeypatch.setattr(settings, "feed_sync_max_interval_hours", 24)
+    monkeypatch.setattr(feed_scheduling.random, "uniform", lambda _a, _b: 0.0)
+
+    now = datetime(2026, 1, 10, 12, 0)
+    feed = Feed(
+        name="J",
+        feed_url="https://j.example.com/rss",
+        sync_frequency=SyncFrequency.HOURLY,
+        is_active=True,
+        error_count=0,
+        max_errors=5,
+        idle_sync_count=0,
+    )
+
+    # Edição semanal com várias entradas na mesma data -> cadência de ~7 dias
+    dates = [now - timedelta(days=7 * week) for week in range(4) for _ in range(5)]
+    feed_scheduling.schedule_next_sync(feed, new_articles=5, publication_dates=dates, now=now)
+    assert feed.publish_interval_minutes == 7 * 24 * 60
+    assert feed.idle_sync_count == 0
+    assert feed.next_sync_at == now + timedelta(hours=24)  # limitado ao máximo
+
+    feed.publish_interval_minutes = 120
+    feed_scheduling.schedule_next_sync(feed, new_articles=0, now=now)
+    assert feed.idle_sync_count == 1
+    assert feed.next_sync_at == now + timedelta(hours=1.5)
+
+    feed.error_count = 3
+    feed_scheduling.schedule_next_sync(feed, new_articles=0, now=now)
+    assert feed.idle_sync_count == 1
+    assert feed.next_sync_at == now + timedelta(hours=8)
+
+    feed.last_sync_at = now
+    assert feed.needs_sync is True  # next_sync_at já passou
+    feed.next_sync_at = datetime.utcnow() + timedelta(minutes=30)
+    assert feed.needs_sync is False
+
+
+def test_schedule_spreads_same_cadence_feeds_across_ticks(monkeypatch):
+    from datetime import datetime, timedelta
+
+    from app.config import settings
+    from app.models import Feed, SyncFrequency
+    from app.services import feed_scheduling
+
+    monkeypatch.setattr(settings, "feed_adaptive_sync", True)
+    monkeypatch.setattr(settings, "feed_sync_tick_minutes", 5)
+    now = datetime(2026, 1, 10, 12, 0)
+
+    def make_feed():
+        return Feed(
+            name="J",
+            feed_url="https://j.example.com/rss",
+            sync_frequency=SyncFrequency.HOURLY,
+            is_active=True,
+            error_count=0,
+            max_errors=5,
+            idle_sync_count=0,
+            last_sync_at=now - timedelta(hours=2),
+        )
+
+    # Extremos do jitter: ±25% de uma hora
+    for bound, expected in ((-1.0, timedelta(minutes=45)), (1.0, timedelta(minutes=75))):
+        monkeypatch.setattr(feed_scheduling.random, "uniform", lambda _a, _b, bound=bound: bound)
+        feed = make_feed()
+        feed_scheduling.schedule_next_sync(feed, new_articles=1, now=now)
+        assert feed.next_sync_at == now + expected
+
+    # Primeiro agendamento: qualquer ponto dentro do primeiro intervalo
+    monkeypatch.setattr(feed_scheduling.random, "uniform", lambda a, b: (a + b) / 2)
+    feed = make_feed()
+    feed_scheduling.spread_first_sync(feed, now=now)
+    assert feed.next_sync_at == now + timedelta(minutes=30)
+
+
+@pytest.mark.asyncio
+async def test_sync_all_spreads_unscheduled_feeds(db_session, monkeypatch):
+    from datetime import datetime, timedelta
+
+    from app.config import settings
+    from app.models import Feed, SyncFrequency
+    from app.schemas.feed import FeedSyncResult
+
+    monkeypatch.setattr(settings, "feed_adaptive_sync", True)
+    synced = []
+
+    async def fake_sync_feed(self, feed_id):
+        synced.append(feed_id)
+        return FeedSyncResult(feed_id=feed_id, feed_name="f", success=True, new_articles=0)
+
+    monkeypatch.setattr(FeedAggregatorService, "sync_feed", fake_sync_feed)
+
+    old = [
+        Feed(
+            name=f"old-{i}",
+            feed_url=f"https://old{i}.example.com/rss",
+            sync_frequency=SyncFrequency.HOURLY,
+            is_active=True,
+            last_sync_at=datetime.utcnow() - timedelta(hours=3),
+        )
+        for i in range(20)
+    ]
+    new = Feed(name="new", feed_url="https://new.example.com/rss", is_active=True)
+    db_session.add_all([*old, new])
+    await db_session.commit()
+
+    service = FeedAggregatorService(db=db_session)
+    await service.sync_all_active_feeds(concurrency=1)
+    await service.close()
+
+    # O feed novo sincroniza na hora; os antigos recebem horários espalhados na primeira hora
+    assert synced == [new.id]
+    assert all(f.next_sync_at is not None for f in old)
+    assert len({f.next_sync_at for f in old}) == len(old)
+
+
+def test_estimate_publish_interval_needs_two_dates():
+    from datetime import datetime
+
+    from app.services.feed_scheduling import estimate_publish_interval
+
+    assert estimate_publish_interval([datetime(2026, 1, 1), None]) is None
+
+
+@pytest.mark.asyncio
+async def test_sync_feed_defers_author_scraping_and_caches_pages(db_session, monkeypatch):
+    import asyncio
+
+    import httpx
+    from sqlalchemy import func, select
+
+    from app.config import settings
+    from app.models import AuthorScrapeCache, Feed, article_authors
+    from app.services.author_scraper import AuthorScrapingService, author_cache_key
+
+    monkeypatch.setattr(settings, "feed_parse_executor", "inline")
+    monkeypatch.setattr(settings, "author_scrape_min_interval_seconds", 0)
+    monkeypatch.setattr(settings, "author_scrape_per_domain_concurrency", 1)
+    monkeypatch.setattr("app.services.author_scraper._domain_throttles", {})
+
+    feed = Feed(name="Springer", feed_url="https://link.springer.com/rss")
+    db_session.add(feed)
+    await db_session.commit()
+
+    items = "".join(
+        f"<item><title>T{i}</title><guid>urn:{i}</guid>"
+        f"<link>https://link.springer.com/article/{i}</link></item>"
+        for i in (1, 2)
+    )
+    rss = f'<?xml version="1.0"?><rss version="2.0"><channel><title>S</title>{items}</channel></rss>'
+    page = '<html><head><meta name="citation_author" content="Skinner, B. F."></head></html>'
+    page_requests = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        if request.url.path == "/rss":
+            return httpx.Response(200, text=rss)
+        page_requests.append(str(request.url))
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text=page)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    deferred = []
+
+    async def fake_dispatch_scrape_authors(article_ids):
+        deferred.append(article_ids)
+        return "test-authors"
+
+    monkeypatch.setattr("app.services.feed_aggregator.dispatch_classify_articles", _fake_dispatch)
+    monkeypatch.setattr(
+        "app.services.feed_aggregator.dispatch_scrape_authors", fake_dispatch_scrape_authors
+    )
+    monkeypatch.setattr(
+        "app.services.feed_aggregator.AuthorScrapingService",
+        lambda db: AuthorScrapingService(db, http_client=client),
+    )
+
+    service = FeedAggregatorService(db=db_session, http_client=client)
+    result = await service.sync_feed(feed.id)
+
+    # A sincronização não busca páginas; só agenda o job
+    assert result.new_articles == 2
+    assert page_requests == []
+    assert len(deferred) == 1 and len(deferred[0]) == 2
+
+    assert await service.fill_missing_authors(deferred[0]) == 2
+    assert len(page_requests) == 2
+    assert max_in_flight == 1
+
+    links = await db_session.scalar(select(func.count()).select_from(article_authors))
+    cached = await db_session.scalar(select(func.count()).select_from(AuthorScrapeCache))
+    assert links == 2
+    assert cached == 2
+
+    # Segunda execução: artigos já têm autores e o cache evita novas requisições
+    assert await service.fill_missing_authors(deferred[0]) == 0
+    scraper = AuthorScrapingService(db_session, http_client=client)
+    targets = {99: ("https://link.springer.com/article/1", None)}
+    assert (await scraper.scrape_many(targets))[99][0]["name"] == "Skinner, B. F."
+    assert len(page_requests) == 2
+
+    # Job concorrente gravando a mesma chave: upsert em vez de violar a chave única
+    key = author_cache_key(targets[99][0])
+    await scraper._store({key: [{"name": "Outro", "role": "author"}]}, {key: targets[99][0]})
+    await db_session.commit()
+    assert await db_session.scalar(select(func.count()).select_from(AuthorScrapeCache)) == 2
+    assert (await scraper._get_cached({key}))[key][0]["name"] == "Outro"
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_author_scraping_limits_are_shared_across_jobs(db_session, monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from app.config import settings
+    from app.services.author_scraper import AuthorScrapingService
+
+    monkeypatch.setattr(settings, "feed_parse_executor", "inline")
+    monkeypatch.setattr(settings, "author_scrape_min_interval_seconds", 0.05)
+    monkeypatch.setattr(settings, "author_scrape_per_domain_concurrency", 1)
+    monkeypatch.setattr("app.services.author_scraper._domain_throttles", {})
+
+    page = '<html><head><meta name="citation_author" content="Skinner, B. F."></head></html>'
+    started = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(_request):
+        nonlocal in_flight, max_in_flight
+        started.append(asyncio.get_running_loop().time())
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text=page)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        # Cada job de scraping cria seu próprio serviço; o limite por domínio é um só
+        jobs = [
+            AuthorScrapingService(db_session, http_client=client).scrape_many(
+                {i: (f"https://link.springer.com/article/{i}", None)}
+            )
+            for i in range(3)
+        ]
+        results = await asyncio.gather(*jobs)
+
+    assert all(result for result in results)
+    assert max_in_flight == 1
+    gaps = [later - earlier for earlier, later in zip(started, started[1:], strict=False)]
+    assert len(gaps) == 2 and min(gaps) >= 0.045
@@ -0,0 +1,30 @@
+import pytest
+
+from app.core.http_client import HTTPClientRegistry, HTTPPurpose
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_client_per_purpose():
+    registry = HTTPClientRegistry()
+
+    feeds = registry.get(HTTPPurpose.FEEDS)
+    assert registry.get(HTTPPurpose.FEEDS) is feeds
+    assert registry.get(HTTPPurpose.PDF) is not feeds
+    assert registry.get(HTTPPurpose.SCRAPING).max_redirects == 5
+
+    await registry.close()
+    assert feeds.is_closed
+    assert registry.get(HTTPPurpose.FEEDS) is not feeds
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_services_use_shared_clients():
+    from app.ai.manager import DeepSeekService
+    from app.core.http_client import get_http_client
+    from app.services.feed_aggregator import FeedAggregatorService
+    from app.services.web_scraper import WebScrapingService
+
+    assert FeedAggregatorService(db=None).http_client is get_http_client(HTTPPurpose.FEEDS)
+    assert WebScrapingService().client is get_http_client(HTTPPurpose.SCRAPING)
+    assert DeepSeekService()._client() is get_http_client(HTTPPurpose.AI)
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+async def isolated_index(tmp_path, monkeypatch):
+    from app.config import settings
+    from app.services import semantic_index
+
+    monkeypatch.setattr(settings, "vector_index_dir", tmp_path)
+    monkeypatch.setattr(settings, "similar_articles_cache_size", 2)
+    await semantic_index.close_semantic_index()
+    yield
+    await semantic_index.close_semantic_index()
+
+
+async def _articles_with_vectors(db_session, vectors, prefix="sim"):
+    from app.models import Article
+    from app.services.embedding_store import EmbeddingStore
+
+    articles = [
+        Article(external_id=f"{prefix}{i}", title=f"Artigo {prefix}{i}")
+        for i in range(len(vectors))
+    ]
+    db_session.add_all(articles)
+    await db_session.commit()
+    await EmbeddingStore(db_session).upsert(
+        [
+            (a.id, "h", np.asarray(v, dtype=np.float32))
+            for a, v in zip(articles, vectors, strict=True)
+        ]
+    )
+    await db_session.commit()
+    return articles
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("isolated_index")
+async def test_similar_articles_are_cached_and_updated_incrementally(db_session, monkeypatch):
+    from sqlalchemy import func, select
+
+    from app.models import ArticleNeighbor
+    from app.services.embedding_store import EmbeddingStore
+    from app.services.similar_articles import SimilarArticlesService
+
+    a0, a1, a2, a3 = await _articles_with_vectors(
+        db_session, [[1, 0, 0], [0.9, 0.1, 0], [0, 1, 0], [0, 0.2, 1]]
+    )
+    service = SimilarArticlesService(db_session)
+    dispatched = []
+
+    async def fake_dispatch(article_ids):
+        dispatched.append(article_ids)
+        return "test"
+
+    monkeypatch.setattr(
+        "app.services.task_dispatcher.dispatch_refresh_similar_articles", fake_dispatch
+    )
+
+    async def stored_count():
+        return await db_session.scalar(
+            select(func.count())
+            .select_from(ArticleNeighbor)
+            .where(ArticleNeighbor.article_id == a0.id)
+        )
+
+    # Primeira leitura calcula a lista sem gravar e enfileira a gravação
+    similar = await service.get_similar(a0, limit=5)
+    assert [a.id for a in similar] == [a1.id, a2.id]
+    assert await stored_count() == 0
+    assert dispatched == [[a0.id]]
+
+    await service.refresh([a0.id])
+    await db_session.commit()
+    assert await stored_count() == 2
+    assert [a.id for a in await service.get_similar(a0, limit=5)] == [a1.id, a2.id]
+    assert len(dispatched) == 1
+
+    # Artigo novo muito parecido com a0 entra na lista já gravada de a0
+    (a4,) = await _articles_with_vectors(db_session, [[1, 0.02, 0]], prefix="new")
+    await SimilarArticlesService(db_session).refresh([a4.id])
+    await db_session.commit()
+
+    similar = await service.get_similar(a0, limit=5)
+    assert [a.id for a in similar] == [a4.id, a1.id]
+    assert [a.id for a in await service.get_similar(a4, limit=1)] == [a0.id]
+
+    # Sem embedding (nem categoria), não há similares
+    await EmbeddingStore(db_session).delete([a3.id])
+    assert await service.get_similar(a3, limit=3) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("isolated_index")
+async def test_refresh_failure_keeps_caller_transaction_usable(db_session, monkeypatch):
+    from sqlalchemy import func, select
+
+    from app.models import Article, ArticleNeighbor
+    from app.services import similar_articles
+
+    (a0, a1) = await _articles_with_vectors(db_session, [[1, 0], [0.9, 0.1]])
+
+    async def failing_refresh(self, _article_ids):
+        await self._store({a0.id: [(a1.id, 0.9)]})
+        raise RuntimeError("falha no meio")
+
+    monkeypatch.setattr(similar_articles.SimilarArticlesService, "refresh", failing_refresh)
+    db_session.add(Article(external_id="depois", title="Gravado pelo chamador"))
+    await similar_articles.refresh_similar_articles(db_session, [a0.id])
+    await db_session.commit()
+
+    # O savepoint desfez só as listas
+    assert await db_session.scalar(select(func.count()).select_from(ArticleNeighbor)) == 0
+    assert await db_session.scalar(
+        select(func.count()).select_from(Article).where(Article.external_id == "depois")
+    ) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("isolated_index")
+async def test_similar_articles_fall_back_to_category_without_embeddings(db_session):
+    from app.models import Article, Category
+    from app.services.similar_articles import SimilarArticlesService
+
+    category = Category(name="Ecologia", slug="ecologia")
+    db_session.add(category)
+    await db_session.commit()
+    articles = [
+        Article(external_id=f"cat{i}", title=f"Artigo {i}", category_id=category.id)
+        for i in range(3)
+    ]
+    db_session.add_all(articles)
+    await db_session.commit()
+
+    similar = await SimilarArticlesService(db_session).get_similar(articles[0], limit=5)
+    assert {a.id for a in similar} == {articles[1].id, articles[2].id}
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from app.services import task_dispatcher
+
+
+class FakeJob:
+    def __init__(self, job_id):
+        self.job_id = job_id
+
+
+class FakePool:
+    def __init__(self):
+        self.calls = []
+
+    async def enqueue_job(self, name, *args, **kwargs):
+        self.calls.append((name, args, kwargs))
+        return FakeJob(f"job-{len(self.calls)}")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_classify_articles_enqueues_one_job_per_chunk(monkeypatch):
+    from app.config import settings
+
+    pool = FakePool()
+    monkeypatch.setattr(settings, "enable_arq", True)
+    monkeypatch.setattr(settings, "task_dispatch_batch_size", 2)
+    monkeypatch.setattr(task_dispatcher, "_arq_pool", pool)
+
+    job_ids = await task_dispatcher.dispatch_classify_articles([1, 2, 3, 4, 5])
+    pdf_job_ids = await task_dispatcher.dispatch_download_pdfs([(7, "https://x/7.pdf")])
+
+    assert job_ids == ["job-1", "job-2", "job-3"]
+    assert [call[1][0] for call in pool.calls[:3]] == [[1, 2], [3, 4], [5]]
+    assert pool.calls[0][0] == "task_classify_articles"
+    assert pdf_job_ids == ["job-4"]
+    assert pool.calls[3][:2] == ("task_download_pdfs", ([[7, "https://x/7.pdf"]],))
+
+
+@pytest.mark.asyncio
+async def test_dispatch_falls_back_locally_only_for_chunks_not_enqueued(monkeypatch):
+    from app.config import settings
+    from app.services import classification_worker
+
+    class FlakyPool(FakePool):
+        async def enqueue_job(self, name, *args, **kwargs):
+            if len(self.calls) in (1, 3):
+                self.calls.append((name, args, kwargs))
+                raise ConnectionError("redis caiu")
+            return await super().enqueue_job(name, *args, **kwargs)
+
+    submitted = []
+    local_pdfs = []
+
+    class FakeBatcher:
+        async def submit(self, article_ids):
+            submitted.append(list(article_ids))
+
+    class FakeQueue:
+        async def submit(self, _task, article_id):
+            local_pdfs.append(article_id)
+
+    pool = FlakyPool()
+    monkeypatch.setattr(settings, "enable_arq", True)
+    monkeypatch.setattr(settings, "task_dispatch_batch_size", 2)
+    monkeypatch.setattr(task_dispatcher, "_arq_pool", pool)
+    monkeypatch.setattr(classification_worker, "get_classification_batcher", FakeBatcher)
+    monkeypatch.setattr(task_dispatcher, "get_local_queue", FakeQueue)
+
+    job_ids = await task_dispatcher.dispatch_classify_articles([1, 2, 3, 4, 5])
+    pdf_job_ids = await task_dispatcher.dispatch_download_pdfs(
+        [(7, None), (8, None), (9, None)]
+    )
+
+    # O primeiro lote ficou no ARQ; só o restante usa o worker local
+    assert job_ids == ["job-1", "local-classify-3", "local-classify-4", "local-classify-5"]
+    assert submitted == [[3, 4, 5]]
+    assert pdf_job_ids == ["job-3", "local-pdf-9"]
+    assert local_pdfs == [9]
+    assert len(pool.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_local_task_queue_bounds_workers_and_applies_backpressure():
+    queue = task_dispatcher.LocalTaskQueue(workers=2, maxsize=1)
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+    done = []
+
+    async def job(n):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        done.append(n)
+
+    # 2 em execução + 1 na fila; o quarto submit aguarda espaço
+    for n in range(3):
+        await queue.submit(job, n)
+    await asyncio.sleep(0)
+    blocked = asyncio.create_task(queue.submit(job, 3))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await blocked
+    await queue.join()
+    await queue.close()
+
+    assert peak == 2
+    assert sorted(done) == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_local_task_queue_keeps_running_after_failed_job():
+    queue = task_dispatcher.LocalTaskQueue(workers=1, maxsize=10)
+    done = []
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    async def ok():
+        done.append(True)
+
+    await queue.submit(failing)
+    await queue.submit(ok)
+    await queue.join()
+    await queue.close()
+
+    assert done == [True]
@@ -0,0 +1,273 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.ml.vector_index import VectorIndex
+
+
+def _vectors(n: int, dim: int = 8, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+
+
+def test_search_matches_exact_cosine_ranking():
+    vectors = _vectors(50)
+    ids = list(range(100, 150))
+    index = VectorIndex()
+    index.add(ids, vectors)
+
+    query = vectors[7] + 0.01
+    hits = index.search(query, k=5)
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:5]
+    assert [article_id for article_id, _ in hits] == [ids[i] for i in expected]
+    assert hits[0][0] == 107 and hits[0][1] == pytest.approx(1.0, abs=1e-3)
+
+
+def test_save_load_maps_base_and_applies_incremental_updates(tmp_path):
+    vectors = _vectors(20)
+    index = VectorIndex()
+    index.add(list(range(1, 21)), vectors)
+    index.meta["synced_at"] = "2026-01-01T00:00:00"
+    index.save(tmp_path)
+    assert not index.dirty and index.pending == 0
+
+    loaded = VectorIndex.load(tmp_path)
+    assert isinstance(loaded._base_vectors, np.memmap)
+    assert len(loaded) == 20 and loaded.dim == 8
+    assert loaded.meta == {"synced_at": "2026-01-01T00:00:00"}
+    assert loaded.search(vectors[3], k=1)[0][0] == 4
+
+    # Vetor alterado substitui o da base; removido some da busca
+    loaded.add([4], -vectors[3:4])
+    loaded.remove([5])
+    assert len(loaded) == 19 and loaded.pending == 1
+    assert loaded.search(vectors[3], k=1)[0][0] != 4
+    assert 5 not in [article_id for article_id, _ in loaded.search(vectors[4], k=19)]
+
+    loaded.save(tmp_path)
+    reloaded = VectorIndex.load(tmp_path)
+    assert len(reloaded) == 19
+    assert reloaded.search(-vectors[3], k=1)[0][0] == 4
+
+
+def test_save_publishes_versions_atomically(tmp_path):
+    from app.ml.vector_index import CURRENT_LINK, IDS_FILE, VECTORS_FILE
+
+    # Formato antigo (arquivos soltos) ainda é carregado
+    np.save(tmp_path / IDS_FILE, np.arange(1, 4, dtype=np.int64))
+    np.save(tmp_path / VECTORS_FILE, _vectors(3))
+    (tmp_path / "meta.json").write_text("{}")
+    index = VectorIndex.load(tmp_path)
+    assert len(index) == 3
+
+    # Outro processo com o índice carregado da versão anterior continua lendo o mmap
+    reader = VectorIndex.load(tmp_path)
+    for i in range(3):
+        index.add([10 + i], _vectors(1, seed=i))
+        index.save(tmp_path)
+
+    versions = sorted(p.name for p in tmp_path.iterdir() if p.name.startswith("v-"))
+    assert len(versions) == 2
+    assert (tmp_path / CURRENT_LINK).is_symlink()
+    assert not (tmp_path / IDS_FILE).exists()
+    assert len(VectorIndex.load(tmp_path)) == 6
+    assert len(reader.search(_vectors(1)[0], k=3)) == 3
+
+
+def test_load_without_files_returns_empty_index(tmp_path):
+    index = VectorIndex.load(tmp_path / "missing")
+    assert len(index) == 0
+    assert index.search(np.ones(8, dtype=np.float32), k=3) == []
+
+
+def test_add_rejects_dimension_mismatch():
+    index = VectorIndex()
+    index.add([1], _vectors(1, dim=4))
+    with pytest.raises(ValueError):
+        index.add([2], _vectors(1, dim=6))
+
+
+@pytest.mark.asyncio
+async def test_search_semantic_returns_ranked_ids_from_stored_embeddings(
+    db_session, tmp_path, monkeypatch
+):
+    from app.config import settings
+    from app.models import Article
+    from app.services import search_service, semantic_index
+    from app.services.embedding_store import EmbeddingStore
+    from app.services.search_service import SearchService
+
+    articles = [Article(external_id=f"s{i}", title=f"Artigo {i}") for i in range(3)]
+    db_session.add_all(articles)
+    await db_session.commit()
+
+    store = EmbeddingStore(db_session)
+    basis = np.eye(3, dtype=np.float32)
+    await store.upsert([(a.id, f"h{i}", basis[i]) for i, a in enumerate(articles)])
+    await db_session.commit()
+
+    async def encode(texts):
+        return np.array([[0.2, 1.0, 0.0]] * len(texts), dtype=np.float32)
+
+    monkeypatch.setattr(settings, "vector_index_dir", tmp_path)
+    monkeypatch.setattr(search_service, "default_encoder", lambda: encode)
+    await semantic_index.close_semantic_index()
+    try:
+        ids = await SearchService(db_session).search_semantic("consulta", limit=10)
+        # Apenas artigos acima da similaridade mínima, do mais ao menos similar
+        assert ids == [articles[1].id]
+
+        # Artigo classificado neste processo entra direto no índice
+        semantic_index.add_to_semantic_index([articles[2].id], np.array([[0.1, 1.0, 0.0]]))
+        ids = await SearchService(db_session).search_semantic("consulta", limit=10)
+        assert ids == [articles[2].id, articles[1].id]
+    finally:
+        await semantic_index.close_semantic_index()
+
+    assert (semantic_index.semantic_index_dir() / "current" / "vectors.npy").exists()
+
+
+@pytest.mark.asyncio
+async def test_refresh_rereads_vectors_committed_after_watermark(db_session, tmp_path, monkeypatch):
+    from datetime import timedelta
+
+    from sqlalchemy import update
+
+    from app.config import settings
+    from app.models import Article, ArticleEmbedding
+    from app.services import semantic_index
+    from app.services.embedding_store import EmbeddingStore
+
+    articles = [Article(external_id=f"w{i}", title=f"Artigo {i}") for i in range(2)]
+    db_session.add_all(articles)
+    await db_session.commit()
+    store = EmbeddingStore(db_session)
+    await store.upsert([(articles[0].id, "h0", np.array([1.0, 0.0]))])
+    await db_session.commit()
+
+    monkeypatch.setattr(settings, "vector_index_dir", tmp_path)
+    monkeypatch.setattr(settings, "vector_index_sync_margin_seconds", 120)
+    await semantic_index.close_semantic_index()
+    try:
+        index = await semantic_index.refresh_semantic_index(db_session, force=True)
+        assert articles[0].id in index
+
+        # Vetor gravado no início de uma transação longa (updated_at 60s antes da
+        # marca já lida) e commitado só agora
+        await store.upsert([(articles[1].id, "h1", np.array([0.0, 1.0]))])
+        synced_at = index.meta["synced_at"]
+        await db_session.execute(
+            update(ArticleEmbedding)
+            .where(ArticleEmbedding.article_id == articles[1].id)
+            .values(updated_at=datetime.fromisoformat(synced_at) - timedelta(seconds=60))
+        )
+        await db_session.commit()
+
+        index = await semantic_index.refresh_semantic_index(db_session, force=True)
+        assert articles[1].id in index
+    finally:
+        await semantic_index.close_semantic_index()
+
+
+@pytest.mark.asyncio
+async def test_stamp_written_moves_updated_at_to_commit_time(db_session):
+    from datetime import timedelta
+
+    from sqlalchemy import select, update
+
+    from app.models import Article, ArticleEmbedding
+    from app.services.embedding_store import EmbeddingStore
+
+    article = Article(external_id="st", title="Artigo")
+    db_session.add(article)
+    await db_session.commit()
+    store = EmbeddingStore(db_session)
+    await store.upsert([(article.id, "h", np.array([1.0, 0.0]))])
+    old = datetime(2020, 1, 1)
+    await db_session.execute(update(ArticleEmbedding).values(updated_at=old))
+
+    await store.stamp_written()
+    await db_session.commit()
+    stamped = await db_session.scalar(select(ArticleEmbedding.updated_at))
+    assert stamped.replace(tzinfo=None) > old + timedelta(days=1)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_ranking_fuses_lexical_and_vector_candidates(
+    db_session, tmp_path, monkeypatch
+):
+    from app.config import settings
+    from app.models import Article
+    from app.services import search_service, semantic_index
+    from app.services.embedding_store import EmbeddingStore
+    from app.services.search_service import SearchService
+
+    articles = [
+        Article(external_id="h0", title="Aprendizado de máquina na biologia"),
+        Article(external_id="h1", title="Máquina de estados"),
+        Article(external_id="h2", title="Machine learning for phylogenetics"),
+        Article(external_id="h3", title="Rascunho", is_published=False),
+    ]
+    db_session.add_all(articles)
+    await db_session.commit()
+    a0, a1, a2, a3 = (a.id for a in articles)
+
+    vectors = np.array([[1, 0, 0], [0, 0, 1], [0, 1, 0], [0, 0.9, 0.1]], dtype=np.float32)
+    await EmbeddingStore(db_session).upsert(
+        [(a.id, "h", v) for a, v in zip(articles, vectors, strict=True)]
+    )
+    await db_session.commit()
+
+    async def encode(texts):
+        return np.array([[0.6, 0.8, 0.0]] * len(texts), dtype=np.float32)
+
+    async def lexical(*_args, **_kwargs):
+        return [a0, a1]
+
+    monkeypatch.setattr(settings, "vector_index_dir", tmp_path)
+    monkeypatch.setattr(search_service, "default_encoder", lambda: encode)
+    await semantic_index.close_semantic_index()
+    try:
+        service = SearchService(db_session)
+        monkeypatch.setattr(service, "search_fts5", lexical)
+        ranked = await service.search_with_ranking("aprendizado de máquina", hybrid=True)
+    finally:
+        await semantic_index.close_semantic_index()
+
+    # a0 aparece nas duas listas; a2 (inglês) só vem do índice vetorial; a3 não publicado
+    assert [article_id for article_id, _ in ranked] == [a0, a2, a1]
+    assert a3 not in dict(ranked)
+    assert ranked[0][1] == pytest.approx(1 / 61 + 1 / 63)
+
+
+@pytest.mark.asyncio
+async def test_search_falls_back_to_like_when_hybrid_finds_nothing(db_session, tmp_path, monkeypatch):
+    from app.config import settings
+    from app.models import Article
+    from app.services import search_service, semantic_index
+    from app.services.search_service import SearchService
+
+    article = Article(external_id="like-1", title="Reforçamento diferencial em sala de aula")
+    db_session.add(article)
+    await db_session.commit()
+
+    async def encode(texts):
+        return np.ones((len(texts), 3), dtype=np.float32)
+
+    async def no_lexical(*_args, **_kwargs):
+        return []
+
+    monkeypatch.setattr(settings, "vector_index_dir", tmp_path)
+    monkeypatch.setattr(search_service, "default_encoder", lambda: encode)
+    await semantic_index.close_semantic_index()
+    try:
+        # Encoder configurado, mas nenhum vetor gravado ainda: índice vazio
+        service = SearchService(db_session)
+        monkeypatch.setattr(service, "search_fts5", no_lexical)
+        results = await service.search("diferencial")
+    finally:
+        await semantic_index.close_semantic_index()
+
+    assert [result.id for result in results] == [article.id]